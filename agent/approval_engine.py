@@ -4,25 +4,71 @@ Monitors Pending_Approval folder and executes approved actions
 """
 
 import os
+import re
+import sys
 import time
 import json
 import shutil
+import fnmatch
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent.step_executor import PlanStep, StepExecutor, critical_path
+from agent.mcp_client import MCPEmailClient, idempotency_key
+from agent.execution_journal import ExecutionJournal, JournalWriteError
+from agent.outbound_scheduler import OutboundScheduler
+from agent.sender_index import record_decision
+from agent.job_scheduler import JobScheduler
+
+
+# Plans carry their status line at the top of the file, so a small read is
+# enough to detect approval/rejection in the common case
+STATUS_HEADER_BYTES = 4096
+STATUS_APPROVED = "STATUS: APPROVED"
+STATUS_REJECTED = "STATUS: REJECTED"
+PLAN_HEADER_END = "---"
+
+# Opening line of the fenced block holding an email body
+BODY_FENCE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})\s*$')
+
+# Optional dependency annotation on an execution step, e.g. "(after: 2, 3)"
+STEP_DEPENDENCY_PATTERN = re.compile(r'\s*\(after:\s*([^)]*)\)\s*$', re.IGNORECASE)
+
 
 class ApprovalEngine:
     """Monitors approval status and executes approved actions"""
 
-    def __init__(self, vault_path: str, check_interval: int = 30):
+    def __init__(
+        self,
+        vault_path: str,
+        check_interval: int = 30,
+        max_workers: int = 4,
+        step_timeout: float = 60.0,
+        mcp_client: Optional[MCPEmailClient] = None
+    ):
         self.vault_path = Path(vault_path)
         self.pending_approval_dir = self.vault_path / "Pending_Approval"
         self.approved_dir = self.vault_path / "Approved"
         self.done_dir = self.vault_path / "Done"
         self.check_interval = check_interval
 
+        # Runs independent plan steps concurrently
+        self.step_executor = StepExecutor(max_workers=max_workers, step_timeout=step_timeout)
+
+        # Email steps are sent through the MCP server unless MCP is disabled
+        if mcp_client is None and os.getenv('MCP_ENABLED', 'true').lower() == 'true':
+            mcp_client = MCPEmailClient()
+        self.mcp_client = mcp_client
+
+        # Scan cache: plan file name -> (mtime_ns, size) of files that had no
+        # status line when last inspected. Unchanged files are skipped.
+        self._scan_cache: Dict[str, Tuple[int, int]] = {}
+
         # Ensure directories exist
         self.pending_approval_dir.mkdir(exist_ok=True)
         self.approved_dir.mkdir(exist_ok=True)
@@ -42,28 +88,65 @@ class ApprovalEngine:
         )
         self.logger = logging.getLogger("ApprovalEngine")
 
+        # Step journal - lets a restarted engine resume a half-executed plan
+        self.journal = ExecutionJournal(log_dir / "execution_journal.jsonl")
+
+        # Decisions per requester, picked up by the brain's sender index
+        self.sender_decisions_path = log_dir / "sender_decisions.jsonl"
+        for plan_id in self.journal.unfinished_plans():
+            if not (self.pending_approval_dir / plan_id).exists():
+                # Plan was moved or deleted after its steps ran
+                self.journal.record_complete(plan_id)
+
+        # Per-channel rate limiting; throttled sends are queued on disk
+        self.outbound = OutboundScheduler(log_dir / "outbound_queue.json")
+        if self.mcp_client is not None:
+            self.outbound.register_sender(
+                "email", lambda payload, deadline: self.mcp_client.send_email(**payload, deadline=deadline)
+            )
+        self.outbound.register_sender("linkedin", lambda payload, deadline: {
+            "success": True, "result": "LinkedIn post published (simulated)"
+        })
+        self.outbound.register_sender("whatsapp", lambda payload, deadline: {
+            "success": True, "result": "WhatsApp message sent (simulated)"
+        })
+
     def start_monitoring(self):
         """Start continuous monitoring of Pending_Approval folder"""
         self.logger.info("Approval Engine started")
         self.logger.info(f"Monitoring: {self.pending_approval_dir}")
         self.logger.info(f"Check interval: {self.check_interval} seconds")
 
+        scheduler = JobScheduler(max_workers=1)
+        self.schedule(scheduler)
         try:
-            while True:
-                result = self.check_pending_approvals()
-
-                if result["approvals_processed"] > 0 or result["rejections_processed"] > 0:
-                    self.logger.info(
-                        f"Processed: {result['approvals_processed']} approvals, "
-                        f"{result['rejections_processed']} rejections"
-                    )
-
-                time.sleep(self.check_interval)
-
+            scheduler.run()
         except KeyboardInterrupt:
             self.logger.info("Approval Engine stopped by user")
         except Exception as e:
             self.logger.error(f"Approval Engine error: {e}", exc_info=True)
+        finally:
+            self.journal.close()
+
+    def schedule(self, scheduler: JobScheduler):
+        """Register the approval check as a job on a (possibly shared) scheduler"""
+        scheduler.add_interval("approval_check", self._monitor_cycle, self.check_interval, persist=False)
+
+    def _monitor_cycle(self) -> float:
+        """Scheduler job: one approval check; returns seconds until the next"""
+        result = self.check_pending_approvals()
+
+        if result["approvals_processed"] > 0 or result["rejections_processed"] > 0:
+            self.logger.info(
+                f"Processed: {result['approvals_processed']} approvals, "
+                f"{result['rejections_processed']} rejections"
+            )
+
+        # Wake up early when a deferred send can go out sooner
+        next_send = self.outbound.next_ready_in()
+        if next_send is not None:
+            return max(1.0, min(self.check_interval, next_send))
+        return self.check_interval
 
     def check_pending_approvals(self) -> Dict:
         """
@@ -75,49 +158,80 @@ class ApprovalEngine:
         approvals_processed = 0
         rejections_processed = 0
         executions_triggered = 0
+        plans_waiting = 0
         errors = []
 
         try:
-            # Get all plan files in Pending_Approval
-            plan_files = list(self.pending_approval_dir.glob("Plan_*.md"))
+            # Send anything deferred by the rate limiter first
+            drained = self.outbound.drain()
+            if drained:
+                self.logger.info(f"Sent {drained} deferred outbound message(s)")
+
+            # Stat every plan file once; only changed files are opened
+            seen_cache: Dict[str, Tuple[int, int]] = {}
+
+            with os.scandir(self.pending_approval_dir) as entries:
+                plan_entries = [
+                    entry for entry in entries
+                    if fnmatch.fnmatch(entry.name, "Plan_*.md") and entry.is_file()
+                ]
+
+            for entry in plan_entries:
+                plan_file = Path(entry.path)
 
-            for plan_file in plan_files:
                 try:
-                    # Read plan content
-                    with open(plan_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    stat = entry.stat()
+                    signature = (stat.st_mtime_ns, stat.st_size)
+
+                    # Skip files unchanged since the last scan
+                    if self._scan_cache.get(entry.name) == signature:
+                        seen_cache[entry.name] = signature
+                        continue
+
+                    status, content = self._read_plan_status(plan_file)
 
                     # Check for approval status
-                    if "STATUS: APPROVED" in content:
+                    if status == STATUS_APPROVED:
                         self.logger.info(f"Approval detected: {plan_file.name}")
 
                         # Process approval
                         exec_result = self._process_approval(plan_file, content)
 
-                        if exec_result["success"]:
+                        if exec_result.get("pending"):
+                            plans_waiting += 1
+                        elif exec_result["success"]:
                             approvals_processed += 1
                             executions_triggered += 1
                         else:
                             errors.append(f"Execution failed for {plan_file.name}: {exec_result.get('error')}")
 
-                    elif "STATUS: REJECTED" in content:
+                    elif status == STATUS_REJECTED:
                         self.logger.info(f"Rejection detected: {plan_file.name}")
 
                         # Process rejection
                         self._process_rejection(plan_file, content)
                         rejections_processed += 1
 
+                    else:
+                        # Still pending - remember it until it changes
+                        seen_cache[entry.name] = signature
+
                 except Exception as e:
                     error_msg = f"Error processing {plan_file.name}: {str(e)}"
                     self.logger.error(error_msg)
                     errors.append(error_msg)
 
+            # Drop cache entries for files that were moved or deleted
+            self._scan_cache = seen_cache
+
             return {
                 "success": True,
                 "approvals_processed": approvals_processed,
                 "rejections_processed": rejections_processed,
                 "executions_triggered": executions_triggered,
+                "plans_waiting": plans_waiting,
                 "errors": errors,
+                "outbound": self.outbound.metrics(),
                 "timestamp": datetime.now().isoformat()
             }
 
@@ -131,6 +245,62 @@ class ApprovalEngine:
                 "executions_triggered": 0
             }
 
+    def _read_plan_status(self, plan_file: Path) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Determine the approval status of a plan file
+
+        Reads only the first STATUS_HEADER_BYTES bytes and looks for a status
+        line in the plan header. The full file is read only when a status is
+        found (the content is needed for execution) or when the header does
+        not end within those bytes.
+
+        Args:
+            plan_file: Path to plan file
+
+        Returns:
+            Tuple of (status, content). status is STATUS_APPROVED,
+            STATUS_REJECTED or None; content is None when no status was found.
+        """
+        with open(plan_file, 'rb') as f:
+            header = f.read(STATUS_HEADER_BYTES)
+            truncated = bool(f.read(1))
+
+        text = header.decode('utf-8', errors='ignore')
+        status = self._find_status_line(text)
+
+        if status is None:
+            header_complete = any(line.strip() == PLAN_HEADER_END for line in text.split('\n'))
+            if header_complete or not truncated:
+                return None, None
+
+        with open(plan_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if status is None:
+            status = self._find_status_line(content)
+            if status is None:
+                return None, None
+
+        return status, content
+
+    def _find_status_line(self, text: str) -> Optional[str]:
+        """
+        Find a STATUS line in the plan header
+
+        Only the header above the first "---" line is searched: everything
+        below it may quote the task, which can come from an external email.
+        Only lines that start with the marker count.
+        """
+        for line in text.split('\n'):
+            stripped = line.strip()
+            if stripped == PLAN_HEADER_END:
+                break
+            if stripped.startswith(STATUS_APPROVED):
+                return STATUS_APPROVED
+            if stripped.startswith(STATUS_REJECTED):
+                return STATUS_REJECTED
+        return None
+
     def _process_approval(self, plan_file: Path, content: str) -> Dict:
         """
         Process an approved plan and execute actions
@@ -143,29 +313,90 @@ class ApprovalEngine:
             Execution result dictionary
         """
         try:
-            # Parse plan to extract actions
-            actions = self._parse_execution_steps(content)
+            # Parse plan to extract actions and their dependencies
+            steps = self._parse_execution_steps(content)
+            email_details = self._parse_email_details(content)
+            priority = self._parse_plan_priority(content)
+
+            try:
+                self.step_executor.validate(steps)
+            except ValueError as e:
+                # Retrying cannot fix the plan - take it out of the queue
+                self._reject_invalid_plan(plan_file, str(e))
+                return {
+                    "success": False,
+                    "error": f"Invalid plan: {e}",
+                    "rejected_path": str(self.done_dir / plan_file.name)
+                }
+
+            self.logger.info(f"Executing {len(steps)} actions from {plan_file.name}")
+
+            # Steps that finished before a crash/restart are not run again
+            plan_id = plan_file.name
+            finished = self.journal.finished_steps(plan_id)
+            if finished:
+                self.logger.info(
+                    f"Resuming {plan_id}: {len(finished)} step(s) already completed"
+                )
 
-            self.logger.info(f"Executing {len(actions)} actions from {plan_file.name}")
+            journal_errors = []
 
-            # Execute actions
-            execution_results = []
-            for i, action in enumerate(actions, 1):
-                self.logger.info(f"Executing step {i}/{len(actions)}: {action[:50]}...")
+            def run_step(step: PlanStep, deadline: float) -> Dict:
+                if step.index in finished:
+                    return dict(finished[step.index], resumed=True)
 
-                # Simulate action execution (in real implementation, call appropriate skills)
-                action_result = self._execute_action(action)
-                execution_results.append(action_result)
+                try:
+                    # A step whose start is not on disk is not run
+                    self.journal.record_start(plan_id, step.index)
+                    result = self._execute_action(step.action, {
+                        "plan_name": plan_id,
+                        "step": step.index,
+                        "email": email_details,
+                        "priority": priority,
+                        "deadline": deadline
+                    })
+                    self.journal.record_finish(plan_id, step.index, result)
+                except JournalWriteError as e:
+                    journal_errors.append(e)
+                    raise
+                return result
+
+            # Execute actions - independent steps run concurrently
+            started = time.monotonic()
+            execution_results = self.step_executor.run(steps, run_step)
+            wall_time_ms = round((time.monotonic() - started) * 1000, 1)
+
+            if journal_errors:
+                # Leave the plan in Pending_Approval; the next check resumes
+                # it after the steps that were journaled
+                raise journal_errors[0]
+
+            waiting = [r["step"] for r in execution_results if r.get("pending")]
+            if waiting:
+                # A send is still queued by the rate limiter. The plan stays
+                # in Pending_Approval and the next check runs it again: the
+                # send's step picks up its result once drain() has one.
+                self.logger.info(f"{plan_id} waiting on deferred step(s) {waiting}")
+                return {
+                    "success": False,
+                    "pending": True,
+                    "plan_name": plan_id,
+                    "waiting_steps": waiting
+                }
 
             # Move plan to Approved folder
             approved_path = self.approved_dir / plan_file.name
             shutil.move(str(plan_file), str(approved_path))
 
             # Create completion report
-            self._create_completion_report(approved_path, execution_results)
+            self._create_completion_report(approved_path, execution_results, wall_time_ms)
 
             # Log approval event
             self._log_approval_event(plan_file.name, "APPROVED", execution_results)
+            self._record_sender_decision(content, approved=True)
+
+            # Plan is fully handled - its journal entries can be compacted away
+            self.journal.record_complete(plan_id)
 
             return {
                 "success": True,
@@ -214,14 +445,46 @@ class ApprovalEngine:
 
             # Log rejection event
             self._log_approval_event(plan_file.name, "REJECTED", [{"reason": rejection_reason}])
+            self._record_sender_decision(content, approved=False)
 
             self.logger.info(f"Plan rejected: {plan_file.name} - {rejection_reason}")
 
         except Exception as e:
             self.logger.error(f"Error processing rejection: {e}", exc_info=True)
 
-    def _parse_execution_steps(self, content: str) -> List[str]:
-        """Parse execution steps from plan content"""
+    def _reject_invalid_plan(self, plan_file: Path, reason: str):
+        """
+        Move an approved plan that cannot be executed to Done with a note
+
+        Args:
+            plan_file: Path to the plan file
+            reason: Why the plan cannot be executed
+        """
+        done_path = self.done_dir / plan_file.name
+        shutil.move(str(plan_file), str(done_path))
+
+        note_path = self.done_dir / f"{plan_file.stem}.invalid.md"
+        with open(note_path, 'w', encoding='utf-8') as f:
+            f.write(f"# Plan Not Executed\n\n")
+            f.write(f"**Plan:** {plan_file.name}\n")
+            f.write(f"**Checked:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"**Error:** {reason}\n\n")
+            f.write("---\n\n")
+            f.write("This plan was approved but its execution steps are invalid, so no step was run.\n")
+            f.write("Fix the steps and move the plan back to Pending_Approval to run it.\n")
+
+        self._log_approval_event(plan_file.name, "INVALID", [{"error": reason}])
+        self.logger.error(f"Plan not executed: {plan_file.name} - {reason}")
+
+    def _parse_execution_steps(self, content: str) -> List[PlanStep]:
+        """
+        Parse execution steps from plan content
+
+        A step may end with "(after: 2, 3)" to declare the steps it depends
+        on, or "(after: none)" to run as soon as the plan starts. Steps
+        without an annotation depend on the previous step, which keeps plans
+        written before dependencies existed strictly sequential.
+        """
         steps = []
         in_steps_section = False
 
@@ -239,39 +502,142 @@ class ApprovalEngine:
                     # Remove number and period
                     step = line.strip().split('.', 1)
                     if len(step) > 1:
-                        steps.append(step[1].strip())
+                        index = len(steps) + 1
+                        action, depends_on = self._parse_step_dependencies(step[1].strip(), index)
+                        steps.append(PlanStep(index=index, action=action, depends_on=depends_on))
 
         return steps
 
-    def _execute_action(self, action: str) -> Dict:
+    def _parse_step_dependencies(self, text: str, index: int) -> Tuple[str, List[int]]:
+        """Split an optional "(after: ...)" annotation off a step"""
+        default = [index - 1] if index > 1 else []
+
+        match = STEP_DEPENDENCY_PATTERN.search(text)
+        if not match:
+            return text, default
+
+        action = text[:match.start()].strip()
+        spec = match.group(1).strip().lower()
+        if spec in ("", "none", "-"):
+            return action, []
+
+        return action, [int(dep) for dep in re.findall(r'\d+', spec)]
+
+    def _parse_plan_priority(self, content: str) -> str:
+        """Read the plan's **Priority:** header (defaults to Medium)"""
+        match = re.search(r'^\*\*Priority:\*\*\s*(\w+)', content, re.MULTILINE)
+        return match.group(1) if match else "Medium"
+
+    def _record_sender_decision(self, content: str, approved: bool):
+        """Log the decision against the plan's **Requested By:** sender, if any"""
+        match = re.search(r'^\*\*Requested By:\*\*\s*(.+?)\s*$', content, re.MULTILINE)
+        if not match:
+            return
+
+        # Response time: plan creation to this decision
+        response_s = None
+        created = re.search(r'^\*\*Created:\*\*\s*(.+?)\s*$', content, re.MULTILINE)
+        if created:
+            try:
+                created_at = datetime.strptime(created.group(1), "%Y-%m-%d %H:%M:%S")
+                response_s = round((datetime.now() - created_at).total_seconds(), 1)
+            except ValueError:
+                pass
+
+        try:
+            record_decision(self.sender_decisions_path, match.group(1), approved, response_s)
+        except Exception as e:
+            self.logger.warning(f"Failed to record sender decision: {e}")
+
+    def _parse_email_details(self, content: str) -> Optional[Dict[str, str]]:
+        """
+        Parse the Email Details section written by the planner
+
+        The body is a fenced block read up to its closing fence, so headings
+        and "---" lines inside it are kept. Plans written before the body
+        was fenced end it at the next section instead.
+        """
+        details = {}
+        body_lines = None
+        fence = None
+        in_section = False
+
+        for line in content.split('\n'):
+            if fence is not None:
+                if line.strip() == fence:
+                    break
+                body_lines.append(line)
+                continue
+
+            if line.startswith("## Email Details"):
+                in_section = True
+                continue
+
+            if not in_section:
+                continue
+
+            if line.startswith("## "):  # Next section
+                break
+
+            if body_lines is not None:
+                if not body_lines and BODY_FENCE_PATTERN.match(line):
+                    fence = line.strip()
+                    continue
+                if body_lines or line.strip():
+                    body_lines.append(line)
+            elif line.startswith("**To:**"):
+                details["to"] = line.replace("**To:**", "", 1).strip()
+            elif line.startswith("**Subject:**"):
+                details["subject"] = line.replace("**Subject:**", "", 1).strip()
+            elif line.startswith("**Cc:**"):
+                details["cc"] = line.replace("**Cc:**", "", 1).strip()
+            elif line.startswith("**Body:**"):
+                body_lines = []
+
+        if not details:
+            return None
+
+        if fence is None:
+            # Drop the section separator that follows an unfenced body
+            while body_lines and body_lines[-1].strip() in ("", "---"):
+                body_lines.pop()
+        details["body"] = "\n".join(body_lines or []).strip()
+
+        return details
+
+    def _execute_action(self, action: str, context: Optional[Dict] = None) -> Dict:
         """
-        Execute a single action (placeholder for actual implementation)
+        Execute a single action
 
-        In production, this would:
-        - Parse action type
-        - Call appropriate skill/function
-        - Handle errors
-        - Return detailed results
+        Email send steps are delivered through the MCP email server and
+        LinkedIn/WhatsApp publishing goes through the outbound rate limiter;
+        other actions are still simulated.
 
         Args:
             action: Action description
+            context: Plan name, step number, priority, parsed email details
+                and the step's deadline (time.monotonic())
 
         Returns:
             Action result dictionary
         """
-        # Placeholder implementation
-        # In real system, this would route to appropriate skills
-
+        context = context or {}
         action_lower = action.lower()
 
         try:
+            channel = self._outbound_channel(action_lower)
+            if channel == "email" and self.mcp_client is not None:
+                return self._send_email_via_mcp(action, context)
+            if channel in ("linkedin", "whatsapp"):
+                return self._submit_outbound(channel, action, {"action": action}, context)
+
             # Simulate different action types
             if "email" in action_lower:
-                # Would call Send_Email_via_MCP skill
+                # Drafting/validation steps - the send itself goes through MCP
                 return {
                     "success": True,
                     "action": action,
-                    "result": "Email sent successfully (simulated)",
+                    "result": "Email step completed (simulated)",
                     "timestamp": datetime.now().isoformat()
                 }
 
@@ -301,9 +667,95 @@ class ApprovalEngine:
                 "timestamp": datetime.now().isoformat()
             }
 
-    def _create_completion_report(self, plan_path: Path, execution_results: List[Dict]):
+    def _send_email_via_mcp(self, action: str, context: Dict) -> Dict:
+        """Send the plan's email through the MCP server"""
+        email = context.get("email")
+        if not email or not email.get("to"):
+            return {
+                "success": False,
+                "action": action,
+                "error": "Plan has no email recipient (missing Email Details section)",
+                "timestamp": datetime.now().isoformat()
+            }
+
+        payload = {
+            "to": email["to"],
+            "subject": email.get("subject") or "(No Subject)",
+            "body": email.get("body") or "",
+            "cc": email.get("cc"),
+            "idempotency_key": idempotency_key(context.get("plan_name", ""), context.get("step", 0))
+        }
+        response = self.outbound.submit(
+            "email", payload, context.get("priority", "Medium"),
+            label=f"{context.get('plan_name')} step {context.get('step')}",
+            deadline=context.get("deadline"),
+            key=payload["idempotency_key"]
+        )
+
+        if response.get("pending"):
+            return {
+                "success": False,
+                "action": action,
+                "result": response["result"],
+                "pending": True,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        if response["success"]:
+            result = f"Email sent to {email['to']} (message id: {response.get('message_id')})"
+            if response.get("duplicate"):
+                result += " - already sent, duplicate suppressed"
+            return {
+                "success": True,
+                "action": action,
+                "result": result,
+                "attempts": response.get("attempts", 1),
+                "timestamp": datetime.now().isoformat()
+            }
+
+        return {
+            "success": False,
+            "action": action,
+            "error": f"MCP send failed after {response.get('attempts', 0)} attempt(s): {response.get('error')}",
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _outbound_channel(self, action_lower: str) -> Optional[str]:
+        """Map an action to the outbound channel it sends on, if any"""
+        if "send email" in action_lower:
+            return "email"
+        if "linkedin" in action_lower and ("publish" in action_lower or "post to linkedin" in action_lower):
+            return "linkedin"
+        if "whatsapp" in action_lower and ("send" in action_lower or "reply" in action_lower):
+            return "whatsapp"
+        return None
+
+    def _submit_outbound(self, channel: str, action: str, payload: Dict, context: Dict) -> Dict:
+        """Send a rate-limited action on a channel without a dedicated client"""
+        response = self.outbound.submit(
+            channel, payload, context.get("priority", "Medium"),
+            label=f"{context.get('plan_name')} step {context.get('step')}",
+            deadline=context.get("deadline"),
+            key=idempotency_key(context.get("plan_name", ""), context.get("step", 0))
+        )
+        return {
+            "success": bool(response.get("success")),
+            "action": action,
+            "result": response.get("result"),
+            "error": response.get("error"),
+            "pending": bool(response.get("pending")),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _create_completion_report(
+        self,
+        plan_path: Path,
+        execution_results: List[Dict],
+        wall_time_ms: float = 0.0
+    ):
         """Create completion report for executed plan"""
         report_path = plan_path.parent / f"{plan_path.stem}.completion.md"
+        path, path_ms = critical_path(execution_results)
 
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(f"# Execution Completion Report\n\n")
@@ -311,7 +763,10 @@ class ApprovalEngine:
             f.write(f"**Executed:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"**Total Actions:** {len(execution_results)}\n")
             f.write(f"**Successful:** {len([r for r in execution_results if r['success']])}\n")
-            f.write(f"**Failed:** {len([r for r in execution_results if not r['success']])}\n\n")
+            f.write(f"**Failed:** {len([r for r in execution_results if not r['success']])}\n")
+            f.write(f"**Wall Time:** {wall_time_ms} ms\n\n")
+            f.write("---\n\n## Critical Path\n\n")
+            f.write(f"{' → '.join(f'Step {i}' for i in path) or 'None'} ({path_ms} ms)\n\n")
             f.write("---\n\n## Action Results\n\n")
 
             for i, result in enumerate(execution_results, 1):
@@ -319,8 +774,14 @@ class ApprovalEngine:
                 f.write(f"### Action {i}: {status}\n\n")
                 f.write(f"**Action:** {result['action']}\n\n")
 
+                depends_on = result.get("depends_on") or []
+                f.write(f"**Depends On:** {', '.join(str(d) for d in depends_on) or 'None'}\n\n")
+                f.write(f"**Duration:** {result.get('duration_ms', 0.0)} ms"
+                        f"{' (critical path)' if result.get('step') in path else ''}\n\n")
+
                 if result["success"]:
-                    f.write(f"**Result:** {result.get('result', 'Completed')}\n\n")
+                    resumed = " (completed before restart)" if result.get("resumed") else ""
+                    f.write(f"**Result:** {result.get('result', 'Completed')}{resumed}\n\n")
                 else:
                     f.write(f"**Error:** {result.get('error', 'Unknown error')}\n\n")
 
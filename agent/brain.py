@@ -10,6 +10,15 @@ Architecture Decision:
 - Skill-based architecture for modularity
 - State machine for task lifecycle management
 - Integration with Claude Code for reasoning (future: API integration)
+- Watchers running in the same process can hand tasks straight to the
+  brain's queue (submit) instead of going through Inbox file events
+- Email replies are folded into their conversation's task file and
+  re-classified from the reply alone (see ThreadIndex)
+- Near-duplicates of open tasks (the same request by email, file drop or
+  forward) are linked to the original instead of being planned again
+  (see NearDuplicateIndex)
+- Priority also weighs the sender's history (past priorities, approval
+  rate, response time), kept in a compact per-sender index (see SenderIndex)
 
 Author: AI Employee System
 Version: 1.0.0
@@ -18,13 +27,20 @@ Version: 1.0.0
 import os
 import re
 import json
+import time
+import queue
 import shutil
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from .thread_index import ThreadIndex
+from .duplicate_index import NearDuplicateIndex
+from .sender_index import SenderIndex
+
 # Silver Tier imports
 try:
     from .planner import TaskPlanner
@@ -36,6 +52,17 @@ except ImportError:
 
 logger = logging.getLogger("AIBrain")
 
+# "**Thread:** <key>" line written by the Gmail watcher
+THREAD_LINE = re.compile(r'^\*\*Thread:\*\* *(\S+) *$', re.MULTILINE)
+
+PRIORITY_ORDER = {"Low": 0, "Medium": 1, "High": 2}
+
+# "**Lane:** <route> (<priority>)" line written for routed Gmail mail
+LANE_LINE = re.compile(r'^\*\*Lane:\*\* *\S+ \((High|Medium|Low)\) *$', re.MULTILINE)
+
+# "**From:** <sender>" line written by the email and WhatsApp watchers
+FROM_LINE = re.compile(r'^\*\*From:\*\* *(.+?) *$', re.MULTILINE)
+
 
 @dataclass
 class TaskState:
@@ -50,6 +77,8 @@ class TaskState:
     actions_taken: List[str] = None
     is_complete: bool = False
     error: Optional[str] = None
+    file_ready: Optional[threading.Event] = None  # Set once a handed-off file is on disk
+    content_priority: Optional[str] = None  # Priority before the sender adjustment
 
     def __post_init__(self):
         if self.actions_taken is None:
@@ -158,8 +187,104 @@ class AIBrain:
         else:
             self.planner = None
 
+        # Serializes tasks from the Inbox handler and the handoff worker
+        self._lock = threading.RLock()
+        self._busy_since: Optional[float] = None  # time.monotonic() of the task in progress
+
+        # Conversation thread -> its task file (0 hours disables threading)
+        self.threads = ThreadIndex(
+            vault_path.parent / "logs" / "thread_index.json",
+            window_hours=float(os.getenv('THREAD_WINDOW_HOURS', '72'))
+        )
+
+        # MinHash/LSH signatures of recent tasks (0 hours disables the check)
+        self.duplicates = NearDuplicateIndex(
+            vault_path.parent / "logs" / "duplicate_index.jsonl",
+            window_hours=float(os.getenv('DUPLICATE_WINDOW_HOURS', '72')),
+            threshold=float(os.getenv('DUPLICATE_THRESHOLD', '0.8')),
+            max_entries=int(os.getenv('DUPLICATE_MAX_TASKS', '5000'))
+        )
+
+        # Per-sender history; the approval engine appends decisions that
+        # are folded in before each prioritization
+        logs_path = vault_path.parent / "logs"
+        self.senders = SenderIndex(
+            logs_path / "sender_index.bin",
+            decisions_path=logs_path / "sender_decisions.jsonl"
+        )
+        self.sender_min_history = int(os.getenv('SENDER_MIN_HISTORY', '3'))
+
+        # In-process handoff: tasks submitted by watchers, and the Inbox
+        # paths they will be written to (file events for those are ignored)
+        self.task_queue: "queue.Queue" = queue.Queue()
+        self._claimed = set()
+        self._claimed_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
         logger.info("AI Brain initialized successfully")
 
+    def submit(self, file_path: str, file_name: str, content: str,
+               file_ready: Optional[threading.Event] = None):
+        """
+        Queue a task handed over directly by a watcher in this process.
+
+        The task is reasoned about from `content` right away; the file at
+        file_path may still be being written, and is only moved once
+        file_ready is set. Inbox file events for file_path are ignored.
+
+        Args:
+            file_path: Inbox path the task file is (being) written to
+            file_name: Name of the file
+            content: File content
+            file_ready: Event set when the file is on disk (None = already there)
+        """
+        with self._claimed_lock:
+            self._claimed.add(file_path)
+        self.task_queue.put((file_path, file_name, content, file_ready, time.monotonic()))
+        self.start_worker()
+
+    def busy_for(self) -> float:
+        """Seconds the task in progress has been running (0 when idle)."""
+        started = self._busy_since
+        return time.monotonic() - started if started is not None else 0.0
+
+    def is_claimed(self, file_path: str) -> bool:
+        """True if the file was handed over through submit() and is still being processed."""
+        with self._claimed_lock:
+            return file_path in self._claimed
+
+    def start_worker(self):
+        """Start the thread that processes submitted tasks (once)."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._worker_loop, name="brain-worker", daemon=True)
+        self._worker.start()
+
+    def stop_worker(self, timeout: float = 30.0):
+        """Finish the queued tasks, then stop the worker thread."""
+        if self._worker and self._worker.is_alive():
+            self.task_queue.put(None)
+            self._worker.join(timeout)
+
+    def _worker_loop(self):
+        """Worker thread: process submitted tasks in order."""
+        while True:
+            item = self.task_queue.get()
+            if item is None:
+                return
+
+            file_path, file_name, content, file_ready, submitted = item
+            try:
+                logger.debug(f"Handoff picked up after {(time.monotonic() - submitted) * 1000:.1f} ms: {file_name}")
+                result = self.process_new_file(file_path, file_name, content, file_ready=file_ready)
+                if not result.get('success'):
+                    logger.error(f"❌ Failed to process handed-off task {file_name}: {result.get('error')}")
+            except Exception as e:
+                logger.error(f"❌ Error processing handed-off task {file_name}: {str(e)}", exc_info=True)
+            finally:
+                with self._claimed_lock:
+                    self._claimed.discard(file_path)
+
     def _load_handbook(self) -> str:
         """Load company handbook for context."""
         try:
@@ -169,7 +294,8 @@ class AIBrain:
             logger.warning(f"Could not load handbook: {str(e)}")
             return ""
 
-    def process_new_file(self, file_path: str, file_name: str, content: str) -> Dict:
+    def process_new_file(self, file_path: str, file_name: str, content: str,
+                         file_ready: Optional[threading.Event] = None) -> Dict:
         """
         Main entry point for processing a new file.
 
@@ -179,17 +305,46 @@ class AIBrain:
             file_path: Full path to the file
             file_name: Name of the file
             content: File content
+            file_ready: Event set once the file is on disk, for files still
+                being written (see submit)
 
         Returns:
             Dictionary with processing results
         """
+        with self._lock:
+            self._busy_since = time.monotonic()
+            try:
+                return self._process(file_path, file_name, content, file_ready)
+            finally:
+                self._busy_since = None
+
+    def _process(self, file_path: str, file_name: str, content: str,
+                 file_ready: Optional[threading.Event]) -> Dict:
+        """Reasoning loop for one task (caller holds self._lock)."""
+        thread_key = self._thread_key(content)
+        if thread_key:
+            entry = self.threads.lookup(thread_key)
+            task_path = self._open_task_path(entry['file_name']) if entry else None
+            if task_path:
+                return self._merge_reply(file_path, file_name, content, file_ready,
+                                         thread_key, entry, task_path)
+
+        signature = self.duplicates.signature(self._task_body(content)) if self.duplicates.enabled else None
+        if signature is not None:
+            for original, similarity in self.duplicates.query(signature):
+                task_path = self._open_task_path(original)
+                if task_path and task_path.name != file_name:
+                    return self._link_duplicate(file_path, file_name, content, file_ready,
+                                                task_path, similarity, thread_key)
+
         logger.info(f"🧠 Brain processing: {file_name}")
 
         # Initialize task state
         state = TaskState(
             file_path=file_path,
             file_name=file_name,
-            content=content
+            content=content,
+            file_ready=file_ready
         )
 
         # Reasoning loop - continue until task complete
@@ -220,9 +375,216 @@ class AIBrain:
                 state.error = str(e)
                 state.is_complete = True  # Stop on error
 
+        # This task file now stands for the whole conversation
+        if thread_key and state.error is None:
+            self.threads.record(
+                thread_key,
+                file_name=state.file_name,
+                task_type=state.task_type,
+                priority=state.priority,
+                confidence=state.confidence
+            )
+
+        if signature is not None and state.error is None:
+            self.duplicates.add(state.file_name, signature)
+
+        # Each completed task counts once in its sender's history
+        sender = self._sender(state)
+        if sender and state.content_priority and state.error is None:
+            self.senders.record_task(sender, state.content_priority)
+
         # Return results
         return self._format_result(state)
 
+    def _thread_key(self, content: str) -> Optional[str]:
+        """Conversation key from the task's Thread line (None if threading is off)."""
+        if not self.threads.enabled:
+            return None
+        match = THREAD_LINE.search(content)
+        return match.group(1) if match else None
+
+    def _open_task_path(self, file_name: str) -> Optional[Path]:
+        """Where a task file currently is, while it is still open."""
+        for folder in (self.needs_action_path, self.inbox_path):
+            path = folder / file_name
+            if path.exists():
+                return path
+        # Done (or removed): a related message starts a new task
+        return None
+
+    @staticmethod
+    def _task_body(content: str) -> str:
+        """The message itself: an email task's Content section, else the whole file."""
+        match = re.search(r'## Content\n(.*?)(?=\n## AI Notes|\Z)', content, re.S)
+        if not match:
+            return content
+        body = match.group(1).strip()
+        return body[:-3].rstrip() if body.endswith('---') else body
+
+    def _merge_reply(self, file_path: str, file_name: str, content: str,
+                     file_ready: Optional[threading.Event], thread_key: str,
+                     entry: Dict, task_path: Path) -> Dict:
+        """
+        Fold a reply into its conversation's task file.
+
+        Only the reply is classified and prioritized; the thread keeps the
+        more confident task type and the higher priority of the two. No
+        new plan or approval request is created. The reply's own file is
+        archived in Done with a note pointing at the task file.
+        """
+        logger.info(f"🧵 Reply in open thread: {file_name} -> {task_path.name}")
+
+        state = TaskState(file_path=file_path, file_name=file_name, content=content, file_ready=file_ready)
+        self._classify_task(state)
+        self._prioritize_task(state)
+
+        if state.confidence <= entry['confidence']:
+            state.task_type = entry['task_type']
+            state.confidence = entry['confidence']
+        if PRIORITY_ORDER.get(entry['priority'], 0) > PRIORITY_ORDER.get(state.priority, 0):
+            state.priority = entry['priority']
+
+        try:
+            self._append_reply(task_path, content)
+            self._update_thread_metadata(task_path, state, entry['messages'] + 1)
+            state.actions_taken.append(f"merged_into:{task_path.name}")
+
+            self._wait_for_file(state)
+            self._archive_linked(
+                state, merged_into=str(task_path), outcome='Appended to conversation task file'
+            )
+        except Exception as e:
+            logger.error(f"Failed to merge reply into {task_path.name}: {str(e)}")
+            state.error = f"Merge failed: {str(e)}"
+
+        if state.error is None:
+            self.threads.record(
+                thread_key,
+                file_name=entry['file_name'],
+                task_type=state.task_type,
+                priority=state.priority,
+                confidence=state.confidence
+            )
+
+        self._update_dashboard(state)
+        state.is_complete = True
+
+        result = self._format_result(state)
+        result['action'] = f"Merged into {task_path.name}"
+        return result
+
+    def _append_reply(self, task_path: Path, content: str):
+        """Insert a reply section into the task file, before its AI Notes."""
+        lines = content.split('\n')
+        title = "Reply"
+        if lines and lines[0].startswith('#'):
+            title = re.sub(r'^Email:\s*', '', lines[0].lstrip('#').strip())
+        headers = [line for line in lines if re.match(r'\*\*(From|Date):\*\*', line)]
+
+        body = self._task_body(content)
+        section = f"## Reply: {title}\n\n" + "\n".join(headers) + f"\n\n{body}\n\n---\n"
+
+        with open(task_path, 'r', encoding='utf-8') as f:
+            task = f.read()
+
+        notes = task.rfind('\n## AI Notes')
+        if notes >= 0:
+            task = task[:notes + 1] + section + task[notes + 1:]
+        else:
+            task = task.rstrip('\n') + "\n\n" + section
+
+        tmp_path = task_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(task)
+        os.replace(tmp_path, task_path)
+
+    def _update_thread_metadata(self, task_path: Path, state: TaskState, messages: int):
+        """Refresh the task's metadata file with the thread's current classification."""
+        metadata_path = task_path.with_suffix('.meta.json')
+        if not metadata_path.exists():
+            return
+
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+
+        metadata.update({
+            'task_type': state.task_type,
+            'priority': state.priority,
+            'confidence': state.confidence,
+            'thread_messages': messages,
+            'updated_at': datetime.now().isoformat(),
+            'reason': f"Classified as {state.task_type} with {state.priority} priority"
+        })
+        with open(metadata_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+    def _link_duplicate(self, file_path: str, file_name: str, content: str,
+                        file_ready: Optional[threading.Event], task_path: Path,
+                        similarity: float, thread_key: Optional[str] = None) -> Dict:
+        """
+        Link a near-duplicate of an open task to the original.
+
+        The copy is classified and prioritized for the record but gets no
+        plan or approval request. It is archived in Done pointing at the
+        original, whose metadata lists its duplicates. Later replies in the
+        copy's conversation are merged into the original.
+        """
+        logger.info(f"👯 Near-duplicate ({similarity:.0%}): {file_name} -> {task_path.name}")
+
+        state = TaskState(file_path=file_path, file_name=file_name, content=content, file_ready=file_ready)
+        self._classify_task(state)
+        self._prioritize_task(state)
+
+        try:
+            metadata_path = task_path.with_suffix('.meta.json')
+            if metadata_path.exists():
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+                metadata.setdefault('duplicates', []).append(
+                    {'file_name': file_name, 'similarity': round(similarity, 2)}
+                )
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump(metadata, f, indent=2)
+            state.actions_taken.append(f"duplicate_of:{task_path.name}")
+
+            self._wait_for_file(state)
+            self._archive_linked(
+                state, duplicate_of=str(task_path), similarity=round(similarity, 2),
+                outcome='Near-duplicate of an open task - not planned'
+            )
+        except Exception as e:
+            logger.error(f"Failed to link duplicate to {task_path.name}: {str(e)}")
+            state.error = f"Link failed: {str(e)}"
+
+        if thread_key and state.error is None:
+            self.threads.record(
+                thread_key,
+                file_name=task_path.name,
+                task_type=state.task_type,
+                priority=state.priority,
+                confidence=state.confidence
+            )
+
+        self._update_dashboard(state)
+        state.is_complete = True
+
+        result = self._format_result(state)
+        result['action'] = f"Linked to {task_path.name}"
+        return result
+
+    def _archive_linked(self, state: TaskState, **metadata):
+        """Move a task folded into another one to Done, with a pointer to it."""
+        source = Path(state.file_path)
+        if not source.exists():
+            return
+
+        destination = self.done_path / state.file_name
+        shutil.move(str(source), str(destination))
+
+        metadata = {'completed_at': datetime.now().isoformat(), **metadata}
+        with open(destination.with_suffix('.meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
     def _reason(self, state: TaskState) -> str:
         """
         Reasoning step: Analyze current state and decide next action.
@@ -245,7 +607,8 @@ class AIBrain:
 
         # Silver Tier: Check if task needs planning
         if self.planner and self._needs_planning(state):
-            if "plan_generated" not in state.actions_taken:
+            # Actions are recorded as "plan_generated:<file>", "plan_error:..." etc.
+            if not any(a.startswith("plan_") for a in state.actions_taken):
                 return "generate_plan"
 
         # If we've classified and prioritized, move to appropriate folder
@@ -404,19 +767,72 @@ class AIBrain:
         elif state.task_type == "Research":
             score -= 1  # Time-intensive
 
-        # Map score to priority
-        if score >= 8:
-            priority = "High"
-        elif score >= 4:
-            priority = "Medium"
-        else:
-            priority = "Low"
+        # Senders whose mail has mattered before rank higher. Their history
+        # records the content-based priority (once the task completes), so
+        # an adjustment never feeds back into later ones.
+        state.content_priority = self._score_priority(score)
+        sender = self._sender(state)
+        if sender:
+            self.senders.sync_decisions()
+            score += self._sender_adjustment(sender)
+
+        priority = self._score_priority(score)
+
+        # Mail from a priority lane never ranks below the lane
+        lane = LANE_LINE.search(state.content)
+        if lane and PRIORITY_ORDER[lane.group(1)] > PRIORITY_ORDER[priority]:
+            priority = lane.group(1)
 
         state.priority = priority
         state.actions_taken.append(f"prioritized_as:{priority}")
 
         logger.info(f"⚖️ Priority assigned: {priority} (score: {score})")
 
+    @staticmethod
+    def _score_priority(score: int) -> str:
+        """Map a priority score to High/Medium/Low"""
+        if score >= 8:
+            return "High"
+        elif score >= 4:
+            return "Medium"
+        return "Low"
+
+    @staticmethod
+    def _sender(state: TaskState) -> Optional[str]:
+        """Sender from the task's **From:** line, if any"""
+        match = FROM_LINE.search(state.content)
+        if not match or match.group(1) == "Unknown":
+            return None
+        return match.group(1)
+
+    def _sender_adjustment(self, sender: str) -> int:
+        """
+        Score adjustment from a sender's history (0 until it has
+        SENDER_MIN_HISTORY tasks; SENDER_MIN_HISTORY=0 disables it).
+        """
+        stats = self.senders.lookup(sender)
+        if not self.sender_min_history or stats is None or stats.tasks < self.sender_min_history:
+            return 0
+
+        adjustment = 0
+        rated = stats.high + stats.medium + stats.low
+        if rated:
+            if stats.high / rated >= 0.5:
+                adjustment += 3  # as much as an urgency marker
+            elif stats.low / rated >= 0.5:
+                adjustment -= 2
+
+        # Plans for this sender that humans approve, and approve quickly
+        if stats.decisions >= 3:
+            if stats.approval_rate >= 0.8:
+                adjustment += 1
+                if stats.responses >= 3 and stats.mean_response_s <= 3600:
+                    adjustment += 1
+            elif stats.approval_rate <= 0.2:
+                adjustment -= 1
+
+        return adjustment
+
     def _move_to_needs_action(self, state: TaskState):
         """
         Move file to Needs_Action folder.
@@ -424,6 +840,7 @@ class AIBrain:
         Implements Skill #3: Move_To_Needs_Action
         """
         try:
+            self._wait_for_file(state)
             source = Path(state.file_path)
             destination = self.needs_action_path / state.file_name
 
@@ -463,6 +880,7 @@ class AIBrain:
         Implements Skill #4: Move_To_Done
         """
         try:
+            self._wait_for_file(state)
             source = Path(state.file_path)
             destination = self.done_path / state.file_name
 
@@ -489,6 +907,11 @@ class AIBrain:
             logger.error(f"Failed to move file: {str(e)}")
             state.error = f"Move failed: {str(e)}"
 
+    def _wait_for_file(self, state: TaskState, timeout: float = 30.0):
+        """Block until a handed-off task's file has been written."""
+        if state.file_ready is not None and not state.file_ready.wait(timeout):
+            logger.warning(f"Timed out waiting for {state.file_name} to be written")
+
     def _update_dashboard(self, state: TaskState):
         """
         Update Dashboard.md with current task information.
@@ -573,7 +996,8 @@ Status: {'✅ Success' if not state.error else '❌ Error'}
             result = self.planner.generate_plan(
                 task_content=state.content,
                 task_type=state.task_type,
-                priority=state.priority
+                priority=state.priority,
+                context={'sender': self._sender(state)}
             )
 
             if result["success"]:
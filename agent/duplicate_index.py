@@ -0,0 +1,228 @@
+"""
+Duplicate Index - Silver Tier
+MinHash/LSH index of recent task content for near-duplicate detection
+"""
+
+import os
+import re
+import json
+import time
+import base64
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+
+WORD = re.compile(r'\w+')
+
+# Forward/reply boilerplate that differs between copies of the same request
+FORWARD_NOISE = re.compile(
+    r'^[ \t>]*(?:-{2,}.*(?:forwarded|original) message.*'
+    r'|(?:from|sent|to|cc|date|subject):.*'
+    r'|(?:on .* wrote:))$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Values are 58-bit hash remainders; the top 6 bits pick one of 64 bins
+VALUE_BITS = 58
+VALUE_MASK = (1 << VALUE_BITS) - 1
+EMPTY = 1 << 64
+
+
+class NearDuplicateIndex:
+    """
+    Incremental MinHash + LSH index over recent tasks
+
+    Forward headers and quote markers are dropped, the text is reduced to
+    3-word shingles, and the shingles are summarized by a 64-slot
+    one-permutation MinHash signature (one hash per shingle, empty slots
+    filled by rotation). Signatures are split into bands; tasks sharing any
+    band become candidates, and candidates whose estimated Jaccard
+    similarity reaches the threshold are reported.
+
+    Entries older than the window, or beyond max_entries, are evicted
+    oldest first. Every addition is appended to a JSONL file, which is
+    replayed and compacted on startup and compacted again once it holds
+    twice as many lines as live entries.
+    """
+
+    SLOTS = 64
+    BANDS = 16
+    SHINGLE = 3
+    MAX_WORDS = 2000
+
+    def __init__(self, index_path: Path, window_hours: float = 72.0,
+                 threshold: float = 0.8, max_entries: int = 5000):
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.window_s = window_hours * 3600
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.rows = self.SLOTS // self.BANDS
+        self.logger = logging.getLogger("NearDuplicateIndex")
+
+        self._lock = threading.Lock()
+        # key -> (added at, signature), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, array]]" = OrderedDict()
+        # hash of (band, band values) -> keys; a hash collision only adds
+        # a candidate, which the similarity check then rejects
+        self._buckets: Dict[int, List[str]] = {}
+        self._lines = 0
+
+        if self.enabled:
+            self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_s > 0
+
+    def signature(self, text: str) -> Optional[array]:
+        """MinHash signature of a text, or None if it has no words"""
+        words = WORD.findall(FORWARD_NOISE.sub('', text).lower())[:self.MAX_WORDS]
+        if not words:
+            return None
+
+        size = min(self.SHINGLE, len(words))
+        shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+        slots = [EMPTY] * self.SLOTS
+        for shingle in shingles:
+            h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+            slot = h >> VALUE_BITS
+            value = h & VALUE_MASK
+            if value < slots[slot]:
+                slots[slot] = value
+
+        # Densify: an empty slot borrows the next filled slot's value,
+        # offset by the distance so borrowed values stay distinguishable
+        for slot in range(self.SLOTS):
+            if slots[slot] == EMPTY:
+                for distance in range(1, self.SLOTS):
+                    value = slots[(slot + distance) % self.SLOTS]
+                    if value <= VALUE_MASK:
+                        slots[slot] = value + (distance << VALUE_BITS)
+                        break
+
+        return array('Q', slots)
+
+    def query(self, signature: array) -> List[Tuple[str, float]]:
+        """
+        Find indexed tasks similar to a signature
+
+        Returns:
+            (key, estimated similarity) pairs at or above the threshold,
+            most similar first
+        """
+        cutoff = time.time() - self.window_s
+        with self._lock:
+            candidates = set()
+            for band in self._bands(signature):
+                candidates.update(self._buckets.get(band, ()))
+
+            matches = []
+            for key in candidates:
+                added, other = self._entries[key]
+                if added < cutoff:
+                    continue
+                similarity = sum(a == b for a, b in zip(signature, other)) / self.SLOTS
+                if similarity >= self.threshold:
+                    matches.append((key, similarity))
+
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def add(self, key: str, signature: array):
+        """Index a task's signature and append it to the index file"""
+        now = time.time()
+        with self._lock:
+            self._insert(key, now, signature)
+            self._evict(now)
+            line = json.dumps({'key': key, 'added': now, 'sig': self._encode(signature)})
+
+            try:
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+                self._lines += 1
+                if self._lines > 2 * len(self._entries) + 100:
+                    self._compact()
+            except Exception as e:
+                self.logger.error(f"Failed to save duplicate index: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bands(self, signature: array):
+        data = signature.tobytes()
+        width = self.rows * signature.itemsize
+        for band in range(self.BANDS):
+            yield hash((band, data[band * width:(band + 1) * width]))
+
+    def _insert(self, key: str, added: float, signature: array):
+        self._remove(key)
+        self._entries[key] = (added, signature)
+        for band in self._bands(signature):
+            bucket = self._buckets.setdefault(band, [])
+            if key not in bucket:
+                bucket.append(key)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in self._bands(entry[1]):
+            bucket = self._buckets.get(band)
+            if bucket is not None and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def _evict(self, now: float):
+        """Drop entries past the window or over max_entries, oldest first"""
+        cutoff = now - self.window_s
+        while self._entries:
+            key, (added, _) = next(iter(self._entries.items()))
+            if added >= cutoff and len(self._entries) <= self.max_entries:
+                break
+            self._remove(key)
+
+    @staticmethod
+    def _encode(signature: array) -> str:
+        return base64.b64encode(signature.tobytes()).decode('ascii')
+
+    @staticmethod
+    def _decode(text: str) -> array:
+        signature = array('Q')
+        signature.frombytes(base64.b64decode(text))
+        return signature
+
+    def _load(self):
+        """Replay the index file, keeping live entries, then compact it"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        signature = self._decode(record['sig'])
+                    except Exception:
+                        continue  # torn last line after a crash
+                    if len(signature) == self.SLOTS:
+                        self._insert(record['key'], record['added'], signature)
+            self._evict(time.time())
+            self._compact()
+        except Exception as e:
+            self.logger.error(f"Failed to load duplicate index: {e}")
+
+    def _compact(self):
+        """Rewrite the index file with live entries only (caller holds the lock)"""
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, (added, signature) in self._entries.items():
+                f.write(json.dumps({'key': key, 'added': added, 'sig': self._encode(signature)}) + '\n')
+        os.replace(tmp_path, self.index_path)
+        self._lines = len(self._entries)
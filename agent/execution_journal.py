@@ -0,0 +1,211 @@
+"""
+Execution Journal - Silver Tier
+Append-only, fsynced record of plan step execution for crash recovery
+"""
+
+import os
+import json
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+
+class JournalWriteError(RuntimeError):
+    """A journal record could not be made durable"""
+
+
+class ExecutionJournal:
+    """
+    Durable journal of plan step starts and finishes
+
+    Each record is one JSON line keyed by plan ID and step index. Records are
+    handed to a single writer thread which writes everything queued so far
+    and issues one fsync for the whole batch (group commit), so concurrent
+    steps share the cost of a disk flush. Callers block until their record
+    is durable, and get a JournalWriteError if the write or fsync failed.
+
+    On startup the journal is replayed: plans that finished are dropped and
+    the file is compacted, while successful steps of unfinished plans are
+    kept so execution can resume after them.
+    """
+
+    def __init__(self, journal_path: Path, max_batch: int = 512):
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_batch = max_batch
+        self.logger = logging.getLogger("ExecutionJournal")
+
+        # plan ID -> step index -> successful result
+        self._finished: Dict[str, Dict[int, Dict]] = {}
+        # plan IDs with journal records but no completion record
+        self._open = set()
+        self._lock = threading.Lock()
+
+        self._recover()
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._writer = threading.Thread(target=self._write_loop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    def finished_steps(self, plan_id: str) -> Dict[int, Dict]:
+        """Return successful step results already recorded for a plan"""
+        with self._lock:
+            return dict(self._finished.get(plan_id, {}))
+
+    def unfinished_plans(self) -> List[str]:
+        """Plan IDs that have recorded steps but no completion record"""
+        with self._lock:
+            return list(self._open)
+
+    def record_start(self, plan_id: str, step: int):
+        """Durably record that a step is about to run"""
+        with self._lock:
+            self._open.add(plan_id)
+        self._append({"plan": plan_id, "step": step, "event": "start"})
+
+    def record_finish(self, plan_id: str, step: int, result: Dict):
+        """Durably record a step's result"""
+        self._append({"plan": plan_id, "step": step, "event": "finish", "result": result})
+        if result.get("success"):
+            with self._lock:
+                self._finished.setdefault(plan_id, {})[step] = result
+
+    def record_complete(self, plan_id: str):
+        """Durably record that a plan has been fully processed"""
+        self._append({"plan": plan_id, "event": "complete"})
+        with self._lock:
+            self._finished.pop(plan_id, None)
+            self._open.discard(plan_id)
+
+    def close(self):
+        """Flush outstanding records and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._file.close()
+
+    def _append(self, record: Dict):
+        """
+        Queue a record and wait until it is on disk
+
+        Raises:
+            JournalWriteError: If the batch holding the record was not
+                written and fsynced
+        """
+        if not self._writer.is_alive():
+            raise RuntimeError("Execution journal is closed")
+
+        record["timestamp"] = datetime.now().isoformat()
+        waiter = {"done": threading.Event(), "error": None}
+        self._queue.put((json.dumps(record, default=str), waiter))
+        waiter["done"].wait()
+
+        if waiter["error"] is not None:
+            raise JournalWriteError(f"Failed to write execution journal: {waiter['error']}")
+
+    def _write_loop(self):
+        """Writer thread: one write + fsync per batch of queued records"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            error = None
+            size = None
+            try:
+                size = os.fstat(self._file.fileno()).st_size
+                self._file.write("".join(line + "\n" for line, _ in batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except Exception as e:
+                error = e
+                self.logger.error(f"Failed to write execution journal: {e}")
+                self._discard_partial_write(size)
+            finally:
+                for _, waiter in batch:
+                    waiter["error"] = error
+                    waiter["done"].set()
+
+            if stop:
+                return
+
+    def _discard_partial_write(self, size: Optional[int]):
+        """
+        Reopen the journal and cut it back to its size before a failed batch
+
+        Drops any buffered remainder of the batch and any partial line, so
+        later records are not glued onto a torn one.
+        """
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        try:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+            if size is not None:
+                os.ftruncate(self._file.fileno(), size)
+        except Exception as e:
+            self.logger.error(f"Failed to reopen execution journal: {e}")
+
+    def _recover(self):
+        """Replay the journal and compact away completed plans"""
+        if not self.journal_path.exists():
+            return
+
+        records: List[Dict] = []
+        completed = set()
+        torn = False
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash - drop the partial line
+                    torn = True
+                    continue
+                records.append(record)
+                if record.get("event") == "complete":
+                    completed.add(record.get("plan"))
+
+        kept = []
+        for record in records:
+            plan_id = record.get("plan")
+            if plan_id in completed:
+                continue
+            kept.append(record)
+            self._open.add(plan_id)
+            if record.get("event") == "finish" and record.get("result", {}).get("success"):
+                self._finished.setdefault(plan_id, {})[record["step"]] = record["result"]
+
+        if torn or len(kept) != len(records):
+            self._rewrite(kept)
+
+        if self._open:
+            self.logger.info(f"Recovered journal state for {len(self._open)} unfinished plan(s)")
+
+    def _rewrite(self, records: List[Dict]):
+        """Atomically replace the journal with the given records"""
+        tmp_path = self.journal_path.with_suffix(self.journal_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
@@ -0,0 +1,107 @@
+"""
+Heartbeat - Silver Tier
+Liveness signal from a supervised process's own work loops
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+
+logger = logging.getLogger("Heartbeat")
+
+
+class Heartbeat:
+    """
+    Touches the supervisor's heartbeat file while every work loop is alive
+
+    Each loop in the process (a JobScheduler's dispatcher, the file
+    watcher's main loop) registers as a source and calls beat() from the
+    loop itself. The file is only touched while every registered source
+    has beaten within stale_after seconds, so one stuck loop stops the
+    whole process's heartbeat and the supervisor restarts it.
+
+    Until the first source registers (imports, authentication) a startup
+    thread beats for at most startup_timeout seconds.
+    """
+
+    def __init__(self, path: Path, interval: float, stall_timeout: float, startup_timeout: float = 300.0):
+        self.path = Path(path)
+        self.interval = interval
+        # A job or task running longer than this counts as hung
+        self.stall_timeout = stall_timeout
+        self.stale_after = 3 * interval
+        self.startup_timeout = startup_timeout
+
+        self._sources: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._registered = threading.Event()
+
+    def start(self):
+        """Beat from a startup thread until the first source registers"""
+        def startup():
+            deadline = time.monotonic() + self.startup_timeout
+            while not self._registered.is_set() and time.monotonic() < deadline:
+                self._touch()
+                self._registered.wait(self.interval)
+
+        threading.Thread(target=startup, name="heartbeat-startup", daemon=True).start()
+
+    def register(self, source: str):
+        """Add a work loop that must keep beating"""
+        with self._lock:
+            self._sources[source] = time.monotonic()
+        self._registered.set()
+
+    def unregister(self, source: str):
+        """Remove a work loop that has stopped on purpose"""
+        with self._lock:
+            self._sources.pop(source, None)
+
+    def beat(self, source: str):
+        """Record that a source's loop is making progress"""
+        now = time.monotonic()
+        with self._lock:
+            self._sources[source] = now
+            stale = [name for name, last in self._sources.items() if now - last > self.stale_after]
+        if stale:
+            logger.warning(f"Heartbeat held back - no progress from: {', '.join(stale)}")
+            return
+        self._touch()
+
+    def _touch(self):
+        try:
+            self.path.touch()
+        except OSError as e:
+            logger.warning(f"Heartbeat failed: {e}")
+
+
+_process_heartbeat: Optional[Heartbeat] = None
+_process_lock = threading.Lock()
+
+
+def process_heartbeat() -> Optional[Heartbeat]:
+    """
+    This process's heartbeat, or None when it is not run by the supervisor
+
+    Configured from SUPERVISOR_HEARTBEAT_FILE, SUPERVISOR_HEARTBEAT_INTERVAL
+    (seconds between beats) and SUPERVISOR_STALL_TIMEOUT (seconds a single
+    job may run before the process counts as hung).
+    """
+    global _process_heartbeat
+    path = os.getenv('SUPERVISOR_HEARTBEAT_FILE')
+    if not path:
+        return None
+
+    with _process_lock:
+        if _process_heartbeat is None:
+            _process_heartbeat = Heartbeat(
+                Path(path),
+                interval=float(os.getenv('SUPERVISOR_HEARTBEAT_INTERVAL', '5')),
+                stall_timeout=float(os.getenv('SUPERVISOR_STALL_TIMEOUT', '600')),
+                startup_timeout=float(os.getenv('SUPERVISOR_STARTUP_TIMEOUT', '300'))
+            )
+        return _process_heartbeat
@@ -0,0 +1,486 @@
+"""
+Job Scheduler - Silver Tier
+One in-process scheduler for every periodic job (interval, cron and one-shot)
+"""
+
+import os
+import json
+import time
+import heapq
+import random
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from agent.heartbeat import process_heartbeat
+
+
+# Longest single wait; bounds how late a job can be after the wall clock
+# jumps (suspend/resume, NTP) while the scheduler is asleep
+MAX_WAIT = 60.0
+
+MISFIRE_POLICIES = ("coalesce", "skip")
+
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+
+class IntervalTrigger:
+    """Every `seconds`, measured from the end of the previous run"""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive, got {seconds}")
+        self.seconds = float(seconds)
+
+    def next_run(self, last_due: float, now: float) -> Optional[float]:
+        return now + self.seconds
+
+    def __str__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class OnceTrigger:
+    """A single run; the job is dropped afterwards"""
+
+    def __init__(self, at: float):
+        self.at = at
+
+    def next_run(self, last_due: float, now: float) -> Optional[float]:
+        return None
+
+    def __str__(self) -> str:
+        return f"once at {datetime.fromtimestamp(self.at).isoformat(timespec='seconds')}"
+
+
+class CronTrigger:
+    """
+    Standard 5-field cron expression (minute hour day month weekday)
+
+    Fields accept *, numbers, ranges (1-5), lists (1,15) and steps (*/15,
+    0-30/10); weekday 0 and 7 are Sunday. As in cron, when both day and
+    weekday are restricted (neither starts with *) a day matching either
+    one fires. @hourly,
+    @daily, @weekly and @monthly are accepted. Times are local.
+    """
+
+    # (low, high) for minute, hour, day, month, weekday
+    RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = CRON_ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+
+        (self.minutes, self.hours, self.days, self.months, weekdays) = (
+            self._parse_field(text, low, high) for text, (low, high) in zip(fields, self.RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        # As in cron, a field starting with "*" (including "*/2") does not
+        # count as a restriction for the day-or-weekday rule
+        self.any_day = fields[2].startswith("*")
+        self.any_weekday = fields[4].startswith("*")
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int) -> frozenset:
+        values = set()
+        for part in text.split(","):
+            span, _, step = part.partition("/")
+            if span == "*":
+                start, end = low, high
+            elif "-" in span:
+                start, end = (int(v) for v in span.split("-", 1))
+            else:
+                start = end = int(span)
+                if step:
+                    end = high  # "5/10" means 5-max/10
+            step = int(step) if step else 1
+            if not (low <= start <= end <= high) or step < 1:
+                raise ValueError(f"Invalid cron field {text!r} (allowed {low}-{high})")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays  # cron counts from Sunday
+        if self.any_day:
+            return weekday
+        if self.any_weekday:
+            return day
+        return day or weekday
+
+    def next_run(self, last_due: float, now: float) -> Optional[float]:
+        """First matching minute after last_due"""
+        moment = datetime.fromtimestamp(last_due).replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+        # Jump a month, day, hour or minute at a time; at most a few
+        # thousand steps even for rare expressions such as Feb 29
+        for _ in range(100000):
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        return None
+
+    def __str__(self) -> str:
+        return f"cron {self.expression}"
+
+
+@dataclass
+class Job:
+    """A scheduled callable and its run bookkeeping"""
+    name: str
+    func: Callable[[], Optional[float]]
+    trigger: object
+    jitter: float = 0.0
+    misfire: str = "coalesce"
+    grace: float = 1.0
+    persist: bool = True
+    due: Optional[float] = None  # time.time() of the next run
+    running: bool = False
+    started_at: Optional[float] = None  # time.monotonic() of the run in progress
+    rerun: bool = False
+    version: int = 0
+    runs: int = 0
+    failures: int = 0
+    misses: int = 0
+    last_duration_s: float = 0.0
+    total_duration_s: float = 0.0
+
+
+class JobScheduler:
+    """
+    Heap-based scheduler shared by all periodic jobs in a process
+
+    One thread sleeps until the earliest due job (at most MAX_WAIT), so an
+    idle process wakes up only when something is due. Due jobs run on a
+    small thread pool.
+
+    - Overlap: a job is back in the heap only once its run has finished;
+      run_now() on a running job queues exactly one rerun
+    - Return value: a job returning a number of seconds sets its next run
+      (adaptive pollers); otherwise the trigger decides
+    - Jitter: each trigger time is pushed back by up to `jitter` seconds
+    - Missed runs (due more than `grace` seconds ago, e.g. after downtime
+      or an overlong run): "coalesce" runs once now, "skip" waits for the
+      next trigger time
+    - Persistence: next-run times of persisted jobs are saved to state_path
+      and restored when a job with the same name and trigger is added
+    - Heartbeat: in a process run by the supervisor, the dispatcher loop
+      beats the process heartbeat (agent/heartbeat.py) unless a job has
+      been running longer than its stall timeout
+
+    Args:
+        state_path: JSON file for next-run times (None disables persistence)
+        max_workers: Jobs that may run at the same time
+    """
+
+    def __init__(self, state_path: Optional[Path] = None, max_workers: int = 4):
+        self.state_path = Path(state_path) if state_path else None
+        self.max_workers = max(1, max_workers)
+        self.logger = logging.getLogger("JobScheduler")
+
+        self._lock = threading.Lock()
+        # Serialises state writes; taken before _lock, never while holding it
+        self._save_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._jobs: Dict[str, Job] = {}
+        # (due, sequence, name, version); stale entries are skipped on pop
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._saved_state = self._load_state()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self.wakeups = 0
+
+    # Adding jobs
+
+    def add_interval(self, name: str, func: Callable, seconds: float, start_in: float = 0.0,
+                     jitter: float = 0.0, misfire: str = "coalesce", persist: bool = True) -> Job:
+        """Run func every `seconds` (first run after `start_in`)"""
+        return self._add(Job(name, func, IntervalTrigger(seconds), jitter, misfire, persist=persist),
+                         first_run=time.time() + start_in)
+
+    def add_cron(self, name: str, func: Callable, expression: str, jitter: float = 0.0,
+                 misfire: str = "coalesce", persist: bool = True) -> Job:
+        """Run func at the times matching a cron expression"""
+        trigger = CronTrigger(expression)
+        first_run = trigger.next_run(time.time(), time.time())
+        if first_run is None:
+            raise ValueError(f"Cron expression never fires: {expression!r}")
+        return self._add(Job(name, func, trigger, jitter, misfire, persist=persist), first_run=first_run)
+
+    def add_once(self, name: str, func: Callable, delay: float = 0.0, at: Optional[float] = None,
+                 misfire: str = "coalesce", persist: bool = True) -> Job:
+        """Run func once, at `at` (time.time()) or after `delay` seconds"""
+        at = at if at is not None else time.time() + delay
+        return self._add(Job(name, func, OnceTrigger(at), misfire=misfire, persist=persist), first_run=at)
+
+    def _add(self, job: Job, first_run: float) -> Job:
+        if job.misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"Unknown misfire policy {job.misfire!r} (use {' or '.join(MISFIRE_POLICIES)})")
+
+        with self._lock:
+            if job.name in self._jobs:
+                raise ValueError(f"Job already scheduled: {job.name}")
+
+            saved = self._saved_state.get(job.name) if job.persist else None
+            if saved and saved.get("trigger") == str(job.trigger):
+                first_run = saved["next_run"]
+                self.logger.info(f"Job {job.name}: next run restored ({self._format(first_run)})")
+
+            self._jobs[job.name] = job
+            self._push(job, first_run)
+        self._save_state()
+        self._wake.set()
+        return job
+
+    def remove(self, name: str):
+        """Unschedule a job (a run in progress finishes)"""
+        with self._lock:
+            job = self._jobs.pop(name, None)
+            if job:
+                job.version += 1
+            self._saved_state.pop(name, None)
+        self._save_state()
+
+    def run_now(self, name: str):
+        """Run a job as soon as possible; if it is running, once more afterwards"""
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            if job.running:
+                job.rerun = True
+                return
+            self._push(job, time.time())
+        self._wake.set()
+
+    # Running
+
+    def start(self):
+        """Run the scheduler on a background thread"""
+        self._thread = threading.Thread(target=self.run, name="job-scheduler", daemon=True)
+        self._thread.start()
+
+    def run(self):
+        """Dispatch due jobs until stop() is called (blocks)"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        heartbeat = process_heartbeat()
+        source = f"scheduler-{id(self):x}"
+        if heartbeat:
+            heartbeat.register(source)
+        next_beat = 0.0
+        try:
+            while not self._stopping:
+                timeout = self._dispatch_due()
+                if heartbeat:
+                    now = time.monotonic()
+                    if now >= next_beat:
+                        self._beat(heartbeat, source)
+                        next_beat = now + heartbeat.interval
+                    timeout = min(timeout, max(0.0, next_beat - now))
+                self._wake.wait(timeout)
+                self._wake.clear()
+                self.wakeups += 1
+        finally:
+            if heartbeat:
+                heartbeat.unregister(source)
+            self._shutdown()
+
+    def stop(self, wait: bool = True):
+        """Stop dispatching; running jobs finish (waits for them if `wait`)"""
+        self._stopping = True
+        self._wake.set()
+        if wait and self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def stalled(self, older_than: float) -> List[str]:
+        """Names of jobs whose current run started more than older_than seconds ago"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                job.name for job in self._jobs.values()
+                if job.running and job.started_at is not None and now - job.started_at > older_than
+            ]
+
+    def _beat(self, heartbeat, source: str):
+        """Beat the process heartbeat unless a job looks hung"""
+        stalled = self.stalled(heartbeat.stall_timeout)
+        if stalled:
+            self.logger.warning(
+                f"Job(s) {', '.join(stalled)} running over {heartbeat.stall_timeout:.0f}s - heartbeat withheld"
+            )
+            return
+        heartbeat.beat(source)
+
+    def _shutdown(self):
+        self._executor.shutdown(wait=True)
+        self._save_state()
+
+    def _dispatch_due(self) -> float:
+        """Hand due jobs to the executor; return seconds until the next one"""
+        with self._lock:
+            while self._heap:
+                due, _, name, version = self._heap[0]
+                job = self._jobs.get(name)
+                if job is None or job.version != version or job.running:
+                    heapq.heappop(self._heap)  # superseded entry
+                    continue
+
+                now = time.time()
+                if due > now:
+                    return min(due - now, MAX_WAIT)
+                heapq.heappop(self._heap)
+
+                if now - due > job.grace:
+                    job.misses += 1
+                    if job.misfire == "skip":
+                        self.logger.warning(f"Job {job.name}: missed run at {self._format(due)} skipped")
+                        next_run = job.trigger.next_run(now, now)
+                        if next_run is None:
+                            self._drop(job)
+                        else:
+                            self._push(job, next_run + self._jitter(job))
+                        continue
+                    self.logger.info(f"Job {job.name}: missed run at {self._format(due)} - running now")
+                    due = now  # coalesce: the late run counts as the one due now
+
+                job.running = True
+                job.started_at = time.monotonic()
+                job.version += 1
+                self._executor.submit(self._run_job, job, due)
+        return MAX_WAIT
+
+    def _run_job(self, job: Job, due: float):
+        """Executor task: run the job once, then schedule its next run"""
+        started = time.time()
+        result = None
+        try:
+            result = job.func()
+        except Exception as e:
+            job.failures += 1
+            self.logger.error(f"Job {job.name} failed: {e}", exc_info=True)
+
+        finished = time.time()
+        with self._lock:
+            job.running = False
+            job.started_at = None
+            job.runs += 1
+            job.last_duration_s = finished - started
+            job.total_duration_s += job.last_duration_s
+
+            if self._jobs.get(job.name) is not job:
+                return  # removed while running
+            if job.rerun:
+                job.rerun = False
+                next_run = finished
+            elif isinstance(result, (int, float)) and not isinstance(result, bool):
+                next_run = finished + max(0.0, float(result))
+            else:
+                next_run = job.trigger.next_run(due, finished)
+                if next_run is not None:
+                    next_run += self._jitter(job)
+
+            if next_run is None:
+                self._drop(job)
+            else:
+                self._push(job, next_run)
+
+        if job.persist:
+            self._save_state()
+        self._wake.set()
+
+    def _drop(self, job: Job):
+        """Forget a job with no further runs (caller holds the lock)"""
+        del self._jobs[job.name]
+        job.due = None
+        self._saved_state.pop(job.name, None)
+
+    def _push(self, job: Job, due: float):
+        """Set a job's next run (caller holds the lock)"""
+        job.due = due
+        job.version += 1
+        heapq.heappush(self._heap, (due, next(self._sequence), job.name, job.version))
+
+    @staticmethod
+    def _jitter(job: Job) -> float:
+        return random.uniform(0, job.jitter) if job.jitter > 0 else 0.0
+
+    @staticmethod
+    def _format(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+    # Reporting
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-job trigger, next run, run counts and timings"""
+        with self._lock:
+            return {
+                job.name: {
+                    "trigger": str(job.trigger),
+                    "next_run": self._format(job.due) if job.due and not job.running else None,
+                    "running": job.running,
+                    "runs": job.runs,
+                    "failures": job.failures,
+                    "misses": job.misses,
+                    "last_duration_s": round(job.last_duration_s, 3),
+                    "total_duration_s": round(job.total_duration_s, 3)
+                }
+                for job in self._jobs.values()
+            }
+
+    # Persistence
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if not self.state_path or not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load scheduler state: {e}")
+            return {}
+
+    def _save_state(self):
+        """Write next-run times of persisted jobs atomically"""
+        if not self.state_path:
+            return
+        # Jobs finishing on different workers save concurrently; one writer
+        # at a time, each writing a snapshot no older than the last one
+        with self._save_lock:
+            with self._lock:
+                # Keep entries of jobs not (yet) added in this process
+                state = dict(self._saved_state)
+                for job in self._jobs.values():
+                    if job.persist and job.due is not None:
+                        state[job.name] = {"trigger": str(job.trigger), "next_run": job.due}
+                self._saved_state = state
+                snapshot = json.dumps(state, indent=2)
+
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.state_path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.state_path)
+            except Exception as e:
+                self.logger.error(f"Failed to save scheduler state: {e}")
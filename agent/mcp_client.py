@@ -0,0 +1,205 @@
+"""
+MCP Email Client - Silver Tier
+Sends email through the local MCP email server (mcp_server/email_mcp_server.js)
+"""
+
+import os
+import time
+import random
+import hashlib
+import threading
+from typing import Dict, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def idempotency_key(plan_name: str, step_index: int) -> str:
+    """Build a stable idempotency key for one step of one plan"""
+    return hashlib.sha256(f"{plan_name}:{step_index}".encode('utf-8')).hexdigest()[:32]
+
+
+class MCPEmailClient:
+    """
+    HTTP client for the MCP email server
+
+    A single keep-alive session is shared by all callers, so repeated sends
+    reuse pooled TCP connections instead of opening one per request. At most
+    max_concurrency requests are in flight at once; further callers wait for
+    a free slot (and a free pooled connection).
+
+    Requests that fail with a 5xx/429 response, a timeout or a connection
+    error are retried with jittered exponential backoff. Every send carries an
+    Idempotency-Key header so the server can drop duplicates of a retried
+    request that actually went through. A send given a deadline makes no
+    attempt, and no request waits, past it.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0
+    ):
+        host = os.getenv('MCP_HOST', 'localhost')
+        port = os.getenv('MCP_PORT', '3000')
+        self.base_url = (base_url or f"http://{host}:{port}").rstrip('/')
+        self.timeout = timeout if timeout is not None else float(os.getenv('MCP_TIMEOUT', '15'))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('MCP_MAX_RETRIES', '3'))
+        self.max_concurrency = max_concurrency or int(os.getenv('MCP_MAX_CONCURRENCY', '8'))
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        # Keep-alive session; pool size matches the concurrency limit so no
+        # request ever has to open a throwaway connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_concurrency,
+            pool_block=True,
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.logger = logging.getLogger("MCPEmailClient")
+
+    def send_email(
+        self,
+        to: str,
+        subject: str,
+        body: str,
+        idempotency_key: Optional[str] = None,
+        cc: Optional[str] = None,
+        bcc: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict:
+        """
+        Send an email via POST /send-email
+
+        Args:
+            to: Recipient address
+            subject: Email subject
+            body: Plain text body
+            idempotency_key: Key identifying this logical send across retries
+            cc: Optional CC addresses
+            bcc: Optional BCC addresses
+            deadline: time.monotonic() value after which no attempt is made
+
+        Returns:
+            Dictionary with success flag, message_id or error, status code
+            and number of attempts
+        """
+        payload = {"to": to, "subject": subject, "body": body}
+        if cc:
+            payload["cc"] = cc
+        if bcc:
+            payload["bcc"] = bcc
+
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        return self._post("/send-email", payload, headers, deadline)
+
+    def health(self) -> bool:
+        """Check whether the MCP server is reachable and healthy"""
+        try:
+            with self._slots:
+                response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _post(self, path: str, payload: Dict, headers: Dict, deadline: Optional[float] = None) -> Dict:
+        """POST with retries on transient failures, within the deadline if given"""
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        last_error = None
+        status_code = None
+
+        while attempt <= self.max_retries:
+            if attempt > 0:
+                time.sleep(self._backoff(attempt, deadline))
+
+            timeout = self.timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    last_error = f"Deadline passed after {attempt} attempt(s)" + (
+                        f" - last error: {last_error}" if last_error else ""
+                    )
+                    break
+            attempt += 1
+
+            try:
+                # Waiting for a free slot counts against the deadline too
+                if not self._slots.acquire(timeout=timeout if deadline is not None else -1):
+                    raise requests.Timeout("No free connection slot before the deadline")
+                try:
+                    response = self.session.post(url, json=payload, headers=headers, timeout=timeout)
+                finally:
+                    self._slots.release()
+            except (requests.Timeout, requests.ConnectionError) as e:
+                last_error = f"{type(e).__name__}: {e}"
+                status_code = None
+                self.logger.warning(f"MCP request failed (attempt {attempt}): {last_error}")
+                continue
+
+            status_code = response.status_code
+            data = self._json(response)
+
+            if status_code < 400:
+                return {
+                    "success": bool(data.get("success", True)),
+                    "message_id": data.get("message_id"),
+                    "duplicate": bool(data.get("duplicate", False)),
+                    "status_code": status_code,
+                    "attempts": attempt,
+                    "error": data.get("error")
+                }
+
+            last_error = data.get("error") or f"HTTP {status_code}"
+
+            # Client errors will not succeed on retry
+            if status_code < 500 and status_code != 429:
+                break
+
+            self.logger.warning(f"MCP server returned {status_code} (attempt {attempt}): {last_error}")
+
+        return {
+            "success": False,
+            "error": last_error,
+            "status_code": status_code,
+            "attempts": attempt
+        }
+
+    def _backoff(self, attempt: int, deadline: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never sleeping past the deadline"""
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1))))
+        if deadline is not None:
+            delay = min(delay, max(0.0, deadline - time.monotonic()))
+        return delay
+
+    @staticmethod
+    def _json(response: requests.Response) -> Dict:
+        try:
+            data = response.json()
+            return data if isinstance(data, dict) else {}
+        except ValueError:
+            return {}
@@ -0,0 +1,371 @@
+"""
+Outbound Scheduler - Silver Tier
+Per-channel rate limiting and a persisted priority queue for outbound sends
+"""
+
+import os
+import json
+import time
+import heapq
+import itertools
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+
+# Lower rank is served first
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+# Results of keyed sends are kept this long for their submitter to collect
+OUTCOME_TTL_S = 7 * 24 * 3600
+
+# Default limits per channel: (sends per minute, burst size)
+DEFAULT_CHANNEL_LIMITS = {
+    "email": (30.0, 10),
+    "linkedin": (2.0, 1),
+    "whatsapp": (20.0, 5),
+}
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at rate_per_minute"""
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self) -> bool:
+        """Take one token if available"""
+        self._refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        """Seconds until a token will be available (inf if the rate is 0)"""
+        self._refill()
+        if self.tokens >= 1.0:
+            return 0.0
+        if self.rate <= 0:
+            return float('inf')
+        return (1.0 - self.tokens) / self.rate
+
+
+class OutboundScheduler:
+    """
+    Rate-limits outbound sends per channel (email, LinkedIn, WhatsApp)
+
+    A send goes out immediately when its channel has a token and nothing is
+    already waiting. Otherwise it is deferred into the channel's priority
+    queue (High before Medium before Low, FIFO within a priority), which is
+    persisted to disk so deferred sends survive a restart. drain() sends
+    queued items as tokens become available; an item stays on disk until
+    its send succeeds, and one that fails max_attempts times is written to
+    the failures file and counted as dropped.
+
+    A send submitted with a key is pending until it has been sent or
+    dropped: submitting the same key again does not queue a second copy but
+    returns "pending" again, or, once drain() is done with it, the send's
+    real result. Those results are persisted with the queue.
+
+    Limits come from OUTBOUND_<CHANNEL>_RATE_PER_MIN and
+    OUTBOUND_<CHANNEL>_BURST environment variables.
+    """
+
+    def __init__(self, state_path: Path, max_attempts: int = 5,
+                 failures_path: Optional[Path] = None):
+        self.state_path = Path(state_path)
+        self.failures_path = Path(failures_path) if failures_path else \
+            self.state_path.with_name("outbound_failures.jsonl")
+        self.max_attempts = max_attempts
+        self.logger = logging.getLogger("OutboundScheduler")
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        for channel, (rate, burst) in DEFAULT_CHANNEL_LIMITS.items():
+            prefix = f"OUTBOUND_{channel.upper()}"
+            self.buckets[channel] = TokenBucket(
+                float(os.getenv(f"{prefix}_RATE_PER_MIN", rate)),
+                int(os.getenv(f"{prefix}_BURST", burst))
+            )
+
+        self.senders: Dict[str, Callable[[Dict, Optional[float]], Dict]] = {}
+        self._queues: Dict[str, List] = {channel: [] for channel in self.buckets}
+        # Popped items being sent; still persisted so a crash cannot lose them
+        self._in_flight: Dict[str, Optional[Dict]] = {channel: None for channel in self.buckets}
+        # key -> {"result": ..., "at": ...} for keyed sends finished by drain()
+        self._outcomes: Dict[str, Dict] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+        self._metrics = {
+            channel: {
+                "sent": 0,
+                "failed": 0,
+                "throttled": 0,
+                "dropped": 0,
+                "delayed_sends": 0,
+                "total_queue_delay_s": 0.0,
+                "max_queue_delay_s": 0.0
+            }
+            for channel in self.buckets
+        }
+
+        self._load()
+
+    def register_sender(self, channel: str, sender: Callable[[Dict, Optional[float]], Dict]):
+        """
+        Register the function that performs a send for a channel
+
+        The sender is called with the payload and a time.monotonic()
+        deadline, which is None for queued sends sent by drain().
+        """
+        self.senders[channel] = sender
+
+    def submit(self, channel: str, payload: Dict, priority: str = "Medium", label: str = "",
+               deadline: Optional[float] = None, key: Optional[str] = None) -> Dict:
+        """
+        Send now if the channel allows it, otherwise defer
+
+        Args:
+            channel: Channel name (email, linkedin, whatsapp)
+            payload: JSON-serializable arguments for the channel's sender
+            priority: Plan priority (High/Medium/Low)
+            label: Human-readable description for logs
+            deadline: time.monotonic() value an immediate send must finish by
+            key: Identifies the send across submits (e.g. plan and step)
+
+        Returns:
+            The sender's result, or a result with "pending": True while the
+            send is queued
+        """
+        with self._lock:
+            if key is not None:
+                outcome = self._outcomes.pop(key, None)
+                if outcome is not None:
+                    self._save()
+                    return outcome["result"]
+                if self._is_queued(channel, key):
+                    return self._pending(channel, "still queued")
+
+            queue = self._queues[channel]
+            send_now = (
+                not queue and self._in_flight[channel] is None
+                and self.buckets[channel].try_acquire()
+            )
+
+            if not send_now:
+                heapq.heappush(queue, self._make_item(channel, payload, priority, label, key))
+                self._metrics[channel]["throttled"] += 1
+                depth = len(queue)
+                self._save()
+
+        if send_now:
+            return self._send(channel, payload, queued_for=0.0, deadline=deadline)
+
+        self.logger.warning(f"Rate limit reached for {channel} - deferred {label or 'send'} (queue depth {depth})")
+        return self._pending(channel, f"queued at depth {depth}")
+
+    def drain(self) -> int:
+        """
+        Send queued items while tokens are available
+
+        Returns:
+            Number of queued items sent successfully
+        """
+        sent = 0
+        for channel in self._queues:
+            while True:
+                with self._lock:
+                    queue = self._queues[channel]
+                    if not queue or not self.buckets[channel].try_acquire():
+                        break
+                    _, _, item = heapq.heappop(queue)
+                    self._in_flight[channel] = item
+
+                queued_for = max(0.0, time.time() - item["enqueued_at"])
+                result = self._send(channel, item["payload"], queued_for)
+
+                if result.get("success"):
+                    with self._lock:
+                        self._in_flight[channel] = None
+                        self._set_outcome(item, result)
+                        self._save()
+                    sent += 1
+                    continue
+
+                item["attempts"] += 1
+                if item["attempts"] < self.max_attempts:
+                    with self._lock:
+                        self._in_flight[channel] = None
+                        heapq.heappush(queue, (item["rank"], next(self._seq), item))
+                        self._save()
+                    # Back off this channel until the next drain
+                    break
+
+                self._record_drop(item, result.get("error"))
+        return sent
+
+    def next_ready_in(self) -> Optional[float]:
+        """Seconds until the next queued item can be sent, or None if idle"""
+        with self._lock:
+            waits = [
+                self.buckets[channel].wait_time()
+                for channel, queue in self._queues.items() if queue
+            ]
+        # A channel with rate 0 never refills, so it needs no wakeup
+        waits = [wait for wait in waits if wait != float('inf')]
+        return min(waits) if waits else None
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-channel counters, queue depth and queueing delay"""
+        with self._lock:
+            snapshot = {}
+            for channel, counters in self._metrics.items():
+                delayed = counters["delayed_sends"]
+                snapshot[channel] = {
+                    "sent": counters["sent"],
+                    "failed": counters["failed"],
+                    "throttled": counters["throttled"],
+                    "dropped": counters["dropped"],
+                    "queue_depth": len(self._queues[channel]),
+                    "avg_queue_delay_s": round(counters["total_queue_delay_s"] / delayed, 3) if delayed else 0.0,
+                    "max_queue_delay_s": round(counters["max_queue_delay_s"], 3)
+                }
+            return snapshot
+
+    def _send(self, channel: str, payload: Dict, queued_for: float, deadline: Optional[float] = None) -> Dict:
+        sender = self.senders.get(channel)
+        if sender is None:
+            result = {"success": False, "error": f"No sender registered for channel {channel}"}
+        else:
+            try:
+                result = sender(payload, deadline)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+        with self._lock:
+            counters = self._metrics[channel]
+            counters["sent" if result.get("success") else "failed"] += 1
+            if queued_for > 0:
+                counters["delayed_sends"] += 1
+                counters["total_queue_delay_s"] += queued_for
+                counters["max_queue_delay_s"] = max(counters["max_queue_delay_s"], queued_for)
+
+        return result
+
+    def _record_drop(self, item: Dict, error: Optional[str]):
+        """Move an item that keeps failing out of the queue into the failures file"""
+        channel = item["channel"]
+        self.logger.error(
+            f"Dropping deferred {channel} send after {item['attempts']} attempts: "
+            f"{item.get('label')} - {error}"
+        )
+
+        record = dict(item, error=error, dropped_at=time.time())
+        with self._lock:
+            try:
+                self.failures_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.failures_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                # Keep the item queued rather than lose it without a trace
+                self.logger.error(f"Failed to record dropped {channel} send, keeping it queued: {e}")
+                self._in_flight[channel] = None
+                heapq.heappush(self._queues[channel], (item["rank"], next(self._seq), item))
+                self._save()
+                return
+
+            self._metrics[channel]["dropped"] += 1
+            self._in_flight[channel] = None
+            self._set_outcome(item, {
+                "success": False,
+                "dropped": True,
+                "error": f"Dropped after {item['attempts']} attempts: {error}"
+            })
+            self._save()
+
+    def _pending(self, channel: str, detail: str) -> Dict:
+        return {
+            "success": False,
+            "pending": True,
+            "result": f"Deferred: {channel} rate limit reached, {detail}"
+        }
+
+    def _is_queued(self, channel: str, key: str) -> bool:
+        """Whether a send with this key is queued or in flight (caller holds the lock)"""
+        in_flight = self._in_flight[channel]
+        if in_flight is not None and in_flight.get("key") == key:
+            return True
+        return any(item.get("key") == key for _, _, item in self._queues[channel])
+
+    def _set_outcome(self, item: Dict, result: Dict):
+        """Keep a keyed send's final result for its submitter (caller holds the lock)"""
+        if item.get("key") is not None:
+            self._outcomes[item["key"]] = {"result": result, "at": time.time()}
+
+    def _make_item(self, channel: str, payload: Dict, priority: str, label: str, key: Optional[str] = None):
+        rank = PRIORITY_RANK.get(priority, PRIORITY_RANK["Medium"])
+        item = {
+            "channel": channel,
+            "rank": rank,
+            "payload": payload,
+            "label": label,
+            "key": key,
+            "enqueued_at": time.time(),
+            "attempts": 0
+        }
+        return (rank, next(self._seq), item)
+
+    def _load(self):
+        """Restore deferred sends persisted by a previous run"""
+        if not self.state_path.exists():
+            return
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load outbound queue: {e}")
+            return
+
+        # Older state files hold just the list of queued items
+        if isinstance(state, list):
+            state = {"queue": state}
+        items = state.get("queue", [])
+        self._outcomes = state.get("outcomes", {})
+
+        for item in sorted(items, key=lambda i: i.get("enqueued_at", 0)):
+            channel = item.get("channel")
+            if channel in self._queues:
+                heapq.heappush(self._queues[channel], (item["rank"], next(self._seq), item))
+
+        if items:
+            self.logger.info(f"Restored {len(items)} deferred outbound send(s)")
+
+    def _save(self):
+        """Persist queued and in-flight items and uncollected outcomes (caller holds the lock)"""
+        items = [item for queue in self._queues.values() for _, _, item in queue]
+        items.extend(item for item in self._in_flight.values() if item is not None)
+
+        # Outcomes nobody came back for (e.g. the plan was deleted) expire
+        cutoff = time.time() - OUTCOME_TTL_S
+        self._outcomes = {key: outcome for key, outcome in self._outcomes.items() if outcome["at"] >= cutoff}
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"queue": items, "outcomes": self._outcomes}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_path)
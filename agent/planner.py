@@ -4,12 +4,35 @@ Generates structured execution plans for complex tasks
 """
 
 import os
+import re
 import json
 from datetime import datetime
+from email.utils import parseaddr
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
+EMAIL_ADDRESS = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+
+# An address named as the destination: "to bob@corp.com", "email: <bob@corp.com>"
+RECIPIENT_CUE = re.compile(
+    r'\b(?:to|email|e-mail|mail|cc)\s*:?\s*<?(' + EMAIL_ADDRESS.pattern + r')', re.IGNORECASE
+)
+
+# Task metadata such as "**From:** Alice <alice@example.com>"
+METADATA_LINE = re.compile(r'^\*\*[^*\n]+:\*\*')
+METADATA_FROM = re.compile(r'^\*\*From:\*\*\s*(.+?)\s*$', re.MULTILINE)
+
+# "## Content" section of an email task; the message may contain its own
+# headings and "---" lines, so it runs up to the watcher's closing sections
+CONTENT_SECTION = re.compile(
+    r'^## Content\n(.*?)(?=\n## (?:Attachments|AI Notes)\b|\Z)', re.MULTILINE | re.DOTALL
+)
+
+# Heading markers and an "Email:" label in front of an email task's subject
+OBJECTIVE_LABEL = re.compile(r'^\s*#*\s*(?:email\s*:\s*)?', re.IGNORECASE)
+
+
 class TaskPlanner:
     """Generates and manages execution plans for tasks"""
 
@@ -47,10 +70,16 @@ class TaskPlanner:
             # Analyze task requirements
             objective = self._extract_objective(task_content)
             required_skills = self._identify_required_skills(task_content, task_type)
-            execution_steps = self._generate_execution_steps(task_content, task_type, required_skills)
+            execution_steps, step_dependencies = self._generate_execution_steps(
+                task_content, task_type, required_skills
+            )
             risk_assessment = self._assess_risk(execution_steps, task_type)
             approval_required = risk_assessment["requires_approval"]
             estimated_outcome = self._estimate_outcome(task_content, execution_steps)
+            email_details = (
+                self._extract_email_details(task_content, objective)
+                if "Send_Email_via_MCP" in required_skills else None
+            )
 
             # Generate task name for filename
             task_name = self._generate_task_name(task_content)
@@ -63,11 +92,14 @@ class TaskPlanner:
                 objective=objective,
                 required_skills=required_skills,
                 execution_steps=execution_steps,
+                step_dependencies=step_dependencies,
                 risk_assessment=risk_assessment,
                 approval_required=approval_required,
                 estimated_outcome=estimated_outcome,
+                email_details=email_details,
                 priority=priority,
-                task_type=task_type
+                task_type=task_type,
+                requested_by=(context or {}).get('sender')
             )
 
             # Save plan
@@ -133,43 +165,56 @@ class TaskPlanner:
         task_content: str,
         task_type: str,
         required_skills: List[str]
-    ) -> List[str]:
-        """Generate step-by-step execution plan"""
+    ) -> Tuple[List[str], Dict[int, List[int]]]:
+        """
+        Generate step-by-step execution plan
+
+        Returns:
+            Tuple of (steps, dependencies) where dependencies maps each
+            1-based step number to the step numbers it must wait for
+        """
         steps = []
-        content_lower = task_content.lower()
+        dependencies = {}
+
+        def add_step(step: str, after: List[int]) -> int:
+            steps.append(step)
+            dependencies[len(steps)] = after
+            return len(steps)
 
         # Step 1: Always analyze the task
-        steps.append("Analyze task requirements and validate inputs")
+        analyze = add_step("Analyze task requirements and validate inputs", [])
+        branch_ends = []
 
         # Add task-specific steps
         if "Send_Email_via_MCP" in required_skills:
-            steps.append("Draft email content with subject and body")
-            steps.append("Validate recipient email address")
-            steps.append("Send email via MCP server")
-            steps.append("Verify email delivery confirmation")
+            draft = add_step("Draft email content with subject and body", [analyze])
+            validate = add_step("Validate recipient email address", [analyze])
+            send = add_step("Send email via MCP server", [draft, validate])
+            branch_ends.append(add_step("Verify email delivery confirmation", [send]))
 
         if "Generate_LinkedIn_Post" in required_skills:
-            steps.append("Generate LinkedIn post content with engagement hook")
-            steps.append("Add relevant hashtags and call-to-action")
-            steps.append("Save draft to Needs_Action folder")
-            steps.append("Request approval for posting")
+            generate = add_step("Generate LinkedIn post content with engagement hook", [analyze])
+            hashtags = add_step("Add relevant hashtags and call-to-action", [generate])
+            save = add_step("Save draft to Needs_Action folder", [hashtags])
+            branch_ends.append(add_step("Request approval for posting", [save]))
 
         if task_type == "Research":
-            steps.append("Gather relevant information from available sources")
-            steps.append("Analyze and synthesize findings")
-            steps.append("Generate summary report")
+            gather = add_step("Gather relevant information from available sources", [analyze])
+            synthesize = add_step("Analyze and synthesize findings", [gather])
+            branch_ends.append(add_step("Generate summary report", [synthesize]))
 
         if task_type == "Data_Processing":
-            steps.append("Load and validate data")
-            steps.append("Process data according to requirements")
-            steps.append("Generate output report")
+            load = add_step("Load and validate data", [analyze])
+            process = add_step("Process data according to requirements", [load])
+            branch_ends.append(add_step("Generate output report", [process]))
 
-        # Final steps
-        steps.append("Update dashboard with task completion")
-        steps.append("Log all actions taken")
-        steps.append("Move task to Done folder")
+        # Final steps - dashboard and logging only need the work branches
+        finished = branch_ends or [analyze]
+        dashboard = add_step("Update dashboard with task completion", finished)
+        log = add_step("Log all actions taken", finished)
+        add_step("Move task to Done folder", [dashboard, log])
 
-        return steps
+        return steps, dependencies
 
     def _assess_risk(self, execution_steps: List[str], task_type: str) -> Dict:
         """Assess risk level of planned actions"""
@@ -217,6 +262,62 @@ class TaskPlanner:
             "risk_factors": risk_factors if risk_factors else ["No significant risk factors identified"]
         }
 
+    def _extract_email_details(self, task_content: str, objective: str) -> Dict[str, str]:
+        """
+        Extract recipient, subject and body for an email task
+
+        Only the request itself is searched for the recipient: the Content
+        section of an email task, or the task text without its metadata
+        lines. An address named as the destination ("to bob@corp.com",
+        "email: bob@corp.com") wins, then the only address in the request.
+        A request naming no address is answered with a reply to the task's
+        **From:** sender. Otherwise To is left empty for the reviewer.
+
+        The body starts out as the request text; the reviewer edits it in
+        the plan before approving.
+        """
+        request = self._request_text(task_content)
+        sender = METADATA_FROM.search(task_content)
+        sender_address = parseaddr(sender.group(1))[1] if sender else ""
+
+        cued = RECIPIENT_CUE.search(request)
+        addresses = set(EMAIL_ADDRESS.findall(request))
+        if cued:
+            recipient = cued.group(1)
+        elif len(addresses) == 1:
+            recipient = addresses.pop()
+        elif not addresses and EMAIL_ADDRESS.fullmatch(sender_address):
+            recipient = sender_address
+        else:
+            recipient = ""
+
+        explicit = re.search(r'subject\s*:?\s*["\']([^"\'\n]+)["\']', request, re.IGNORECASE)
+        if explicit:
+            subject = explicit.group(1).strip()
+        else:
+            subject = OBJECTIVE_LABEL.sub('', objective).strip()[:100]
+            if recipient and recipient == sender_address and not subject.lower().startswith('re:'):
+                subject = f"Re: {subject}"
+
+        return {
+            "to": recipient,
+            "subject": subject,
+            "body": request
+        }
+
+    def _request_text(self, task_content: str) -> str:
+        """The task's request: its Content section, else the text without metadata"""
+        section = CONTENT_SECTION.search(task_content)
+        if section:
+            body = section.group(1).strip()
+            return body[:-3].rstrip() if body.endswith('---') else body
+
+        lines = [
+            line for line in task_content.strip().split('\n')
+            if not METADATA_LINE.match(line)
+        ]
+        return '\n'.join(lines).strip()
+
     def _estimate_outcome(self, task_content: str, execution_steps: List[str]) -> str:
         """Estimate expected outcome of task execution"""
         step_count = len(execution_steps)
@@ -251,20 +352,25 @@ class TaskPlanner:
         objective: str,
         required_skills: List[str],
         execution_steps: List[str],
+        step_dependencies: Dict[int, List[int]],
         risk_assessment: Dict,
         approval_required: bool,
         estimated_outcome: str,
         priority: str,
-        task_type: str
+        task_type: str,
+        email_details: Optional[Dict[str, str]] = None,
+        requested_by: Optional[str] = None
     ) -> str:
         """Format plan as markdown"""
 
+        requested_by_line = f"**Requested By:** {requested_by}\n" if requested_by else ""
+
         plan = f"""# Plan: {task_name}
 
 **Created:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 **Priority:** {priority}
 **Task Type:** {task_type}
-**Status:** Pending Approval
+{requested_by_line}**Status:** Pending Approval
 
 ---
 
@@ -284,7 +390,15 @@ class TaskPlanner:
         plan += "\n---\n\n## Execution Steps\n\n"
 
         for i, step in enumerate(execution_steps, 1):
-            plan += f"{i}. {step}\n"
+            plan += f"{i}. {step}{self._format_dependencies(i, step_dependencies.get(i))}\n"
+
+        if email_details:
+            plan += "\n---\n\n## Email Details\n\n"
+            plan += f"**To:** {email_details['to']}\n"
+            plan += f"**Subject:** {email_details['subject']}\n"
+            plan += "**Body:**\n\n"
+            fence = self._body_fence(email_details['body'])
+            plan += f"{fence}\n{email_details['body']}\n{fence}\n"
 
         plan += f"\n---\n\n## Risk Assessment\n\n"
         plan += f"**Risk Level:** {risk_assessment['risk_level']}\n"
@@ -316,6 +430,31 @@ class TaskPlanner:
 
         return plan
 
+    @staticmethod
+    def _body_fence(body: str) -> str:
+        """
+        Code fence for the email body, longer than any backtick run in it
+
+        The body quotes the task, which may come from an external email; the
+        fence keeps it one block that the approval engine reads verbatim.
+        """
+        longest = max((len(run) for run in re.findall(r'`+', body)), default=0)
+        return '`' * max(3, longest + 1)
+
+    def _format_dependencies(self, step_number: int, after: Optional[List[int]]) -> str:
+        """
+        Format the dependency annotation for an execution step
+
+        Steps without an annotation run after the previous step, so the
+        annotation is only written when it differs from that default.
+        """
+        default = [step_number - 1] if step_number > 1 else []
+        if after is None or after == default:
+            return ""
+        if not after:
+            return " (after: none)"
+        return f" (after: {', '.join(str(d) for d in after)})"
+
 
 if __name__ == "__main__":
     # Test the planner
@@ -0,0 +1,296 @@
+"""
+Sender Index - Silver Tier
+Compact per-sender history (task priorities, approvals, response times)
+"""
+
+import os
+import json
+import time
+import struct
+import hashlib
+import threading
+from array import array
+from email.utils import parseaddr
+from pathlib import Path
+from typing import NamedTuple, Optional
+import logging
+
+
+# tasks, high, medium, low, approved, rejected, responses, mean response (s), last seen
+RECORD = struct.Struct('<IHHHHHHfI')
+ENTRY = struct.Struct('<Q' + RECORD.format[1:])
+HEADER = struct.Struct('<4sIQ')  # magic, version, bytes of the decisions file applied
+MAGIC = b'SNDX'
+VERSION = 1
+
+COUNT_MAX = 0xFFFF
+PRIORITY_FIELDS = {"High": 1, "Medium": 2, "Low": 3}
+
+
+class SenderStats(NamedTuple):
+    tasks: int
+    high: int
+    medium: int
+    low: int
+    approved: int
+    rejected: int
+    responses: int
+    mean_response_s: float
+    last_seen: int
+
+    @property
+    def decisions(self) -> int:
+        return self.approved + self.rejected
+
+    @property
+    def approval_rate(self) -> Optional[float]:
+        return self.approved / self.decisions if self.decisions else None
+
+
+def normalize_sender(sender: str) -> str:
+    """Lower-cased address from a From header ("Name <a@b.com>" -> "a@b.com")"""
+    if '<' in sender or '(' in sender:
+        sender = parseaddr(sender)[1] or sender
+    return sender.strip().lower()
+
+
+def record_decision(decisions_path: Path, sender: str, approved: bool, response_s: Optional[float]):
+    """
+    Append a human approval decision for the sender index to pick up
+
+    Used by the approval engine, which may run in another process; the
+    brain's SenderIndex is the only writer of the index itself.
+    """
+    line = json.dumps({
+        'sender': normalize_sender(sender),
+        'approved': approved,
+        'response_s': response_s
+    })
+    with open(decisions_path, 'a', encoding='utf-8') as f:
+        f.write(line + '\n')
+
+
+class SenderIndex:
+    """
+    Open-addressing hash table of sender statistics
+
+    Senders are keyed by a 64-bit blake2b hash of their address (addresses
+    themselves are not stored). Keys live in one array('Q') and records in
+    one bytearray of fixed 24-byte slots: 32 bytes per slot, 43 to 85
+    bytes per sender depending on load, so hundreds of thousands of
+    senders take a few tens of megabytes at most. Lookups are a hash plus
+    a short linear probe.
+
+    Every update appends the sender's full 32-byte entry to a binary
+    journal, which is replayed and compacted on startup and compacted again
+    once it holds twice as many entries as there are senders. Approval
+    decisions written by the approval engine (see record_decision) are
+    applied by sync_decisions, which remembers how far it has read.
+    """
+
+    MAX_LOAD = 0.75
+
+    def __init__(self, index_path: Path, decisions_path: Optional[Path] = None, capacity: int = 1024):
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.decisions_path = Path(decisions_path) if decisions_path else None
+        self.logger = logging.getLogger("SenderIndex")
+
+        self._lock = threading.Lock()
+        self._allocate(max(16, 1 << (capacity - 1).bit_length()))
+        self._count = 0
+        self._journal_entries = 0
+        self._decisions_offset = 0
+
+        self._load()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, sender: str) -> Optional[SenderStats]:
+        """Statistics for a sender, or None if never seen"""
+        key = self._key(sender)
+        with self._lock:
+            slot = self._find(key)
+            if self._keys[slot] != key:
+                return None
+            return SenderStats(*RECORD.unpack_from(self._records, slot * RECORD.size))
+
+    def record_task(self, sender: str, priority: str):
+        """Count a task from the sender at the given priority"""
+        def update(stats: list):
+            stats[0] += 1
+            field = PRIORITY_FIELDS.get(priority)
+            if field:
+                stats[field] = min(COUNT_MAX, stats[field] + 1)
+            stats[8] = int(time.time())
+
+        self._update(self._key(sender), update)
+
+    def record_decision(self, sender: str, approved: bool, response_s: Optional[float] = None):
+        """Count an approval or rejection of the sender's plan and its response time"""
+        self._update(self._key(sender), self._decision_update(approved, response_s))
+
+    def sync_decisions(self) -> int:
+        """
+        Apply decisions appended to the decisions file since the last sync
+
+        Returns:
+            Number of decisions applied
+        """
+        if not self.decisions_path or not self.decisions_path.exists():
+            return 0
+
+        with self._lock:
+            size = self.decisions_path.stat().st_size
+            if size == self._decisions_offset:
+                return 0
+            if size < self._decisions_offset:
+                self._decisions_offset = 0  # file was replaced
+
+            with open(self.decisions_path, 'rb') as f:
+                f.seek(self._decisions_offset)
+                data = f.read(size - self._decisions_offset)
+
+        # Leave a partly written last line for the next sync
+        complete = data[:data.rfind(b'\n') + 1]
+        applied = 0
+        for line in complete.splitlines():
+            try:
+                decision = json.loads(line)
+                self.record_decision(decision['sender'], bool(decision['approved']), decision.get('response_s'))
+                applied += 1
+            except Exception as e:
+                self.logger.warning(f"Skipping malformed sender decision: {e}")
+
+        with self._lock:
+            self._decisions_offset += len(complete)
+            self._write_offset()
+        return applied
+
+    # Table internals
+
+    @staticmethod
+    def _key(sender: str) -> int:
+        digest = hashlib.blake2b(normalize_sender(sender).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1  # 0 marks an empty slot
+
+    def _allocate(self, capacity: int):
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._keys = array('Q', bytes(8 * capacity))
+        self._records = bytearray(RECORD.size * capacity)
+
+    def _find(self, key: int) -> int:
+        """Slot holding key, or the empty slot where it would go"""
+        keys = self._keys
+        slot = key & self._mask
+        while keys[slot] and keys[slot] != key:
+            slot = (slot + 1) & self._mask
+        return slot
+
+    def _store(self, key: int, values) -> int:
+        """Insert or overwrite a sender's record (caller holds the lock)"""
+        slot = self._find(key)
+        if self._keys[slot] != key:
+            if (self._count + 1) > self._capacity * self.MAX_LOAD:
+                self._grow()
+                slot = self._find(key)
+            self._keys[slot] = key
+            self._count += 1
+        RECORD.pack_into(self._records, slot * RECORD.size, *values)
+        return slot
+
+    def _grow(self):
+        keys, records = self._keys, self._records
+        self._allocate(self._capacity * 2)
+        for slot, key in enumerate(keys):
+            if key:
+                new_slot = self._find(key)
+                self._keys[new_slot] = key
+                start = new_slot * RECORD.size
+                self._records[start:start + RECORD.size] = records[slot * RECORD.size:(slot + 1) * RECORD.size]
+
+    def _update(self, key: int, update):
+        with self._lock:
+            slot = self._find(key)
+            if self._keys[slot] == key:
+                stats = list(RECORD.unpack_from(self._records, slot * RECORD.size))
+            else:
+                stats = [0] * 8 + [int(time.time())]
+            update(stats)
+            self._store(key, stats)
+            self._append(key, stats)
+
+    @staticmethod
+    def _decision_update(approved: bool, response_s: Optional[float]):
+        def update(stats: list):
+            field = 4 if approved else 5
+            stats[field] = min(COUNT_MAX, stats[field] + 1)
+            if response_s is not None and response_s >= 0:
+                responses = min(COUNT_MAX, stats[6] + 1)
+                # Running mean; once the count saturates it becomes a slow moving average
+                stats[7] += (response_s - stats[7]) / responses
+                stats[6] = responses
+        return update
+
+    # Persistence
+
+    def _append(self, key: int, stats: list):
+        """Journal one entry; compact when the journal grows (caller holds the lock)"""
+        try:
+            if self._journal_entries > 2 * self._count + 1024:
+                self._compact()
+                return
+            with open(self.index_path, 'ab') as f:
+                if f.tell() == 0:
+                    f.write(HEADER.pack(MAGIC, VERSION, self._decisions_offset))
+                f.write(ENTRY.pack(key, *stats))
+            self._journal_entries += 1
+        except Exception as e:
+            self.logger.error(f"Failed to save sender index: {e}")
+
+    def _write_offset(self):
+        """Record how much of the decisions file has been applied (caller holds the lock)"""
+        try:
+            if not self.index_path.exists():
+                self._compact()
+                return
+            with open(self.index_path, 'r+b') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, self._decisions_offset))
+        except Exception as e:
+            self.logger.error(f"Failed to save sender index: {e}")
+
+    def _compact(self):
+        """Rewrite the journal with one entry per sender (caller holds the lock)"""
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self._decisions_offset))
+            for slot, key in enumerate(self._keys):
+                if key:
+                    f.write(struct.pack('<Q', key))
+                    f.write(self._records[slot * RECORD.size:(slot + 1) * RECORD.size])
+        os.replace(tmp_path, self.index_path)
+        self._journal_entries = self._count
+
+    def _load(self):
+        """Replay the journal (the last entry per sender wins), then compact it"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+            magic, version, offset = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                self.logger.error(f"Unrecognized sender index file: {self.index_path}")
+                return
+
+            # A torn entry at the end (crash mid-write) is ignored
+            end = HEADER.size + (len(data) - HEADER.size) // ENTRY.size * ENTRY.size
+            with self._lock:
+                for entry in ENTRY.iter_unpack(data[HEADER.size:end]):
+                    self._store(entry[0], entry[1:])
+                self._decisions_offset = offset
+                self._compact()
+        except Exception as e:
+            self.logger.error(f"Failed to load sender index: {e}")
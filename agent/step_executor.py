@@ -0,0 +1,248 @@
+"""
+Step Executor - Silver Tier
+Runs approved plan steps as a dependency graph on a thread pool
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+
+@dataclass
+class PlanStep:
+    """A single execution step and the steps it must wait for (1-based)"""
+    index: int
+    action: str
+    depends_on: List[int] = field(default_factory=list)
+
+
+class StepExecutor:
+    """
+    Executes plan steps concurrently while respecting their dependencies
+
+    A step starts as soon as all of its dependencies have succeeded. When a
+    step fails, every step that depends on it (directly or transitively) is
+    cancelled instead of being run. A step can also come back "pending"
+    (e.g. a send waiting on a rate limit): its dependents are then held, not
+    run and not cancelled, and marked pending too so the caller can run the
+    plan again later.
+
+    Each step is handed a deadline, step_timeout seconds after it starts,
+    and must give up by then (MCP sends use it as their request budget). A
+    thread cannot be stopped from outside, so a step is only reported once
+    it has returned: one that overruns its deadline is waited for rather
+    than reported failed while it might still complete.
+    """
+
+    def __init__(self, max_workers: int = 4, step_timeout: float = 60.0):
+        self.max_workers = max_workers
+        self.step_timeout = step_timeout
+        self.logger = logging.getLogger("StepExecutor")
+
+    def validate(self, steps: List[PlanStep]):
+        """
+        Check that dependencies only point at earlier steps
+
+        Raises:
+            ValueError: If a step depends on itself, a later step or a
+                step that does not exist
+        """
+        for step in steps:
+            for dep in step.depends_on:
+                if dep < 1 or dep >= step.index:
+                    raise ValueError(
+                        f"Step {step.index} has invalid dependency on step {dep}"
+                    )
+
+    def run(self, steps: List[PlanStep], execute: Callable[[PlanStep, float], Dict]) -> List[Dict]:
+        """
+        Run all steps and return one result dictionary per step, in step order
+
+        Args:
+            steps: Plan steps to execute
+            execute: Callable that performs a step before the given deadline
+                (a time.monotonic() value) and returns a result dictionary
+                with at least a "success" key
+
+        Returns:
+            List of result dictionaries annotated with step timing
+        """
+        self.validate(steps)
+
+        by_index = {step.index: step for step in steps}
+        dependents: Dict[int, List[int]] = {step.index: [] for step in steps}
+        for step in steps:
+            for dep in step.depends_on:
+                dependents[dep].append(step.index)
+
+        results: Dict[int, Dict] = {}
+        started: Dict[int, float] = {}
+        started_lock = threading.Lock()
+
+        def run_step(step: PlanStep) -> Dict:
+            start = time.monotonic()
+            with started_lock:
+                started[step.index] = start
+            return execute(step, start + self.step_timeout)
+
+        def cancel_dependents(index: int):
+            pending = [(child, index) for child in dependents[index]]
+            while pending:
+                child, parent = pending.pop()
+                # A held step is overridden: it can no longer run
+                if child in results and not results[child].get("pending"):
+                    continue
+                results[child] = {
+                    "success": False,
+                    "action": by_index[child].action,
+                    "error": f"Cancelled: dependency step {parent} did not complete",
+                    "cancelled": True,
+                    "timestamp": datetime.now().isoformat()
+                }
+                pending.extend((grandchild, child) for grandchild in dependents[child])
+
+        def hold_dependents(index: int):
+            pending = [(child, index) for child in dependents[index]]
+            while pending:
+                child, parent = pending.pop()
+                if child in results:
+                    continue
+                results[child] = {
+                    "success": False,
+                    "action": by_index[child].action,
+                    "error": f"Waiting: dependency step {parent} is pending",
+                    "pending": True,
+                    "timestamp": datetime.now().isoformat()
+                }
+                pending.extend((grandchild, child) for grandchild in dependents[child])
+
+        def finish(index: int, result: Dict, finished_at: float):
+            start = started.get(index, finished_at)
+            result["duration_ms"] = round((finished_at - start) * 1000, 1)
+            results[index] = result
+            if result.get("pending"):
+                hold_dependents(index)
+            elif not result.get("success"):
+                cancel_dependents(index)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="plan-step"
+        )
+        running = {}
+        overdue = set()
+        try:
+            while len(results) < len(steps):
+                # Submit every step whose dependencies have all succeeded
+                for step in steps:
+                    if step.index in results or step.index in running.values():
+                        continue
+                    if all(dep in results and results[dep].get("success") for dep in step.depends_on):
+                        self.logger.info(f"Starting step {step.index}/{len(steps)}: {step.action[:50]}...")
+                        running[executor.submit(run_step, step)] = step.index
+
+                if not running:
+                    break
+
+                done, _ = wait(
+                    list(running), timeout=self._next_timeout(running, started, overdue),
+                    return_when=FIRST_COMPLETED
+                )
+                now = time.monotonic()
+
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {
+                            "success": False,
+                            "action": by_index[index].action,
+                            "error": str(e),
+                            "timestamp": datetime.now().isoformat()
+                        }
+                    finish(index, result, now)
+
+                # A step past its deadline may still complete, so it is
+                # waited for; its dependents stay queued until it returns
+                for index in running.values():
+                    start = started.get(index)
+                    if start is not None and now - start >= self.step_timeout and index not in overdue:
+                        overdue.add(index)
+                        self.logger.warning(
+                            f"Step {index} passed its {self.step_timeout}s deadline - waiting for it to stop"
+                        )
+        finally:
+            # Only reached with steps still running if the loop itself failed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        ordered = []
+        for step in steps:
+            result = results.get(step.index, {
+                "success": False,
+                "action": step.action,
+                "error": "Not executed",
+                "timestamp": datetime.now().isoformat()
+            })
+            result["step"] = step.index
+            result["depends_on"] = list(step.depends_on)
+            result.setdefault("duration_ms", 0.0)
+            ordered.append(result)
+
+        return ordered
+
+    def _next_timeout(self, running: Dict, started: Dict[int, float], overdue: set) -> Optional[float]:
+        """Seconds until the earliest running step passes its deadline"""
+        now = time.monotonic()
+        if any(index not in started for index in running.values()):
+            # Steps are queued but not yet started - poll again shortly
+            return min(self.step_timeout, 0.05)
+
+        deadlines = [
+            started[index] + self.step_timeout
+            for index in running.values()
+            if index not in overdue
+        ]
+        if not deadlines:
+            # Every running step is overdue - just wait for one to return
+            return None
+        return max(0.0, min(deadlines) - now)
+
+
+def critical_path(results: List[Dict]) -> Tuple[List[int], float]:
+    """
+    Find the chain of dependent steps with the largest total duration
+
+    Args:
+        results: Step results as returned by StepExecutor.run
+
+    Returns:
+        Tuple of (step indices along the path, total duration in ms)
+    """
+    total: Dict[int, float] = {}
+    previous: Dict[int, Optional[int]] = {}
+
+    for result in sorted(results, key=lambda r: r["step"]):
+        best_dep = None
+        best_time = 0.0
+        for dep in result.get("depends_on", []):
+            if dep in total and total[dep] > best_time:
+                best_dep, best_time = dep, total[dep]
+        total[result["step"]] = best_time + result.get("duration_ms", 0.0)
+        previous[result["step"]] = best_dep
+
+    if not total:
+        return [], 0.0
+
+    end = max(total, key=lambda i: total[i])
+    path = []
+    node = end
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    path.reverse()
+
+    return path, round(total[end], 1)
@@ -0,0 +1,402 @@
+"""
+Supervisor - Silver Tier
+Runs every component as a child process with heartbeats, restarts and resource reports
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import importlib
+import threading
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent.job_scheduler import JobScheduler
+from agent.heartbeat import process_heartbeat
+
+# Optional: per-process CPU/RSS on any platform (falls back to /proc)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+ROOT = Path(__file__).parent.parent
+LOG_DIR = ROOT / "logs"
+HEARTBEAT_DIR = LOG_DIR / "supervisor"
+
+# Start order; shutdown runs in reverse, so mail and post producers stop
+# before the brain that consumes their files, and approvals stop last
+COMPONENTS: Dict[str, str] = {
+    "approval_engine": "agent.supervisor:run_approval_engine",
+    "file_watcher": "watchers.file_watcher:main",
+    "gmail_watcher": "watchers.gmail_watcher:main",
+    "linkedin_watcher": "watchers.linkedin_watcher:main",
+}
+
+# A child that stays up this long is considered healthy again (backoff resets)
+STABLE_AFTER = 60.0
+
+logger = logging.getLogger("Supervisor")
+
+
+def run_approval_engine():
+    """Child entry point for the approval engine"""
+    from agent.approval_engine import ApprovalEngine
+    engine = ApprovalEngine(
+        os.getenv('VAULT_PATH', str(ROOT / "vault")),
+        check_interval=int(os.getenv('APPROVAL_CHECK_INTERVAL', '30'))
+    )
+    engine.start_monitoring()
+
+
+def default_components() -> List[str]:
+    """Components to run when SUPERVISOR_COMPONENTS is not set"""
+    names = ["approval_engine", "file_watcher"]
+    # With direct handoff the file watcher hosts the Gmail watcher itself
+    if os.getenv('GMAIL_DIRECT_HANDOFF', 'false').lower() != 'true':
+        names.append("gmail_watcher")
+    if os.getenv('LINKEDIN_ENABLED', 'true').lower() == 'true':
+        names.append("linkedin_watcher")
+    return names
+
+
+def process_usage(pid: int) -> Tuple[Optional[float], Optional[int]]:
+    """
+    CPU seconds used and resident memory (bytes) of a process.
+
+    Returns:
+        (cpu_s, rss_bytes); either is None where it cannot be read
+    """
+    try:
+        if PSUTIL_AVAILABLE:
+            process = psutil.Process(pid)
+            times = process.cpu_times()
+            return times.user + times.system, process.memory_info().rss
+
+        with open(f"/proc/{pid}/stat", "r") as f:
+            # Fields after the parenthesized command name; utime and stime
+            # are fields 14 and 15 of the whole line
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu_s = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/statm", "r") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        return cpu_s, rss
+    except Exception:
+        return None, None
+
+
+@dataclass
+class Child:
+    """A supervised component and its restart bookkeeping"""
+    name: str
+    target: str
+    process: Optional[subprocess.Popen] = None
+    started_at: float = 0.0
+    restarts: int = 0
+    failures: int = 0  # consecutive short-lived runs, drives the backoff
+    last_exit: Optional[int] = None
+    cpu_sample: Optional[Tuple[float, float]] = None  # (cpu_s, time) at the last report
+    cpu_percent: Optional[float] = None
+    rss_bytes: Optional[int] = None
+
+    @property
+    def heartbeat_path(self) -> Path:
+        return HEARTBEAT_DIR / f"{self.name}.heartbeat"
+
+
+class Supervisor:
+    """
+    Starts each component as a child process and keeps it running
+
+    - Health: children touch a heartbeat file from their own work loops
+      (agent/heartbeat.py), so a deadlocked or hung component stops
+      beating; one that exits, or whose heartbeat is older than
+      heartbeat_timeout, is restarted
+    - Restarts: after 1s, doubling for every consecutive run shorter than
+      STABLE_AFTER, up to max_backoff
+    - Shutdown: components are stopped in reverse start order, each given
+      stop_timeout seconds to exit cleanly before it is killed
+    - Reports: CPU share and RSS per component are logged every
+      report_interval seconds and written to logs/supervisor_status.json
+
+    Health checks and restarts are jobs on a JobScheduler; a waiter thread
+    per child triggers a check as soon as the child exits.
+    """
+
+    def __init__(
+        self,
+        components: List[str],
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 30.0,
+        max_backoff: float = 60.0,
+        report_interval: float = 300.0,
+        stop_timeout: float = 20.0
+    ):
+        unknown = [name for name in components if name not in COMPONENTS]
+        if unknown:
+            raise ValueError(f"Unknown components: {', '.join(unknown)} (known: {', '.join(COMPONENTS)})")
+
+        self.children = [Child(name, COMPONENTS[name]) for name in COMPONENTS if name in components]
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_backoff = max_backoff
+        self.report_interval = report_interval
+        self.stop_timeout = stop_timeout
+
+        self.scheduler = JobScheduler(max_workers=2)
+        self._lock = threading.Lock()
+        self._stopping = False
+        HEARTBEAT_DIR.mkdir(parents=True, exist_ok=True)
+
+    def run(self):
+        """Start every component and supervise until interrupted (blocks)"""
+        logger.info(f"Starting components: {', '.join(child.name for child in self.children)}")
+        for child in self.children:
+            self._spawn(child)
+
+        self.scheduler.add_interval("health_check", self.check_health, self.heartbeat_interval, persist=False)
+        self.scheduler.add_interval(
+            "resource_report", self.report, self.report_interval, start_in=self.report_interval, persist=False
+        )
+
+        try:
+            self.scheduler.run()
+        except KeyboardInterrupt:
+            logger.info("⏹️  Shutdown signal received")
+        finally:
+            self.shutdown()
+
+    def stop(self):
+        """Ask run() to shut everything down (signal handlers, other threads)"""
+        self.scheduler.stop(wait=False)
+
+    # Children
+
+    def _spawn(self, child: Child):
+        """Start a component's process and a thread waiting for its exit"""
+        command = [sys.executable, "-m", "agent.supervisor", "--component", child.name,
+                   "--heartbeat-interval", str(self.heartbeat_interval)]
+        # Own process group: a Ctrl+C in the terminal reaches only the
+        # supervisor, which then stops the children in order
+        if sys.platform == "win32":
+            kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            kwargs = {"start_new_session": True}
+
+        with self._lock:
+            if self._stopping:
+                return
+            child.process = subprocess.Popen(command, cwd=str(ROOT), **kwargs)
+            child.started_at = time.time()
+            child.cpu_sample = None
+            logger.info(f"▶️  {child.name} started (pid {child.process.pid})")
+
+        process = child.process
+        threading.Thread(
+            target=self._wait_for_exit, args=(process,), name=f"wait-{child.name}", daemon=True
+        ).start()
+
+    def _wait_for_exit(self, process: subprocess.Popen):
+        process.wait()
+        self.scheduler.run_now("health_check")
+
+    def check_health(self):
+        """Scheduler job: restart children that exited or stopped beating"""
+        now = time.time()
+        for child in self.children:
+            with self._lock:
+                if self._stopping:
+                    return
+                process = child.process
+                if process is None:
+                    continue  # restart pending
+
+                code = process.poll()
+                if code is None:
+                    beat = child.started_at
+                    if child.heartbeat_path.exists():
+                        beat = max(beat, child.heartbeat_path.stat().st_mtime)
+                    if now - beat <= self.heartbeat_timeout:
+                        if child.failures and now - child.started_at >= STABLE_AFTER:
+                            child.failures = 0
+                        continue
+                    # Unresponsive: asking it to shut down cleanly would only wait
+                    logger.warning(f"💔 {child.name} missed heartbeats for {now - beat:.0f}s - killing it")
+                    process.kill()
+                    code = process.wait()
+
+                uptime = now - child.started_at
+                child.process = None
+                child.last_exit = code
+                child.failures = child.failures + 1 if uptime < STABLE_AFTER else 1
+                delay = min(self.max_backoff, 2.0 ** (child.failures - 1))
+
+            logger.error(f"❌ {child.name} exited (code {code}) after {uptime:.0f}s - restarting in {delay:.0f}s")
+            self.scheduler.add_once(f"restart_{child.name}", lambda child=child: self._restart(child),
+                                    delay=delay, persist=False)
+
+    def _restart(self, child: Child):
+        child.restarts += 1
+        self._spawn(child)
+
+    def _terminate(self, child: Child, timeout: float):
+        """Ask a child to exit, then kill it after timeout (caller holds the lock)"""
+        process = child.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            if sys.platform == "win32":
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                process.terminate()
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{child.name} did not stop within {timeout:.0f}s - killing it")
+            process.kill()
+            process.wait()
+
+    def shutdown(self):
+        """Stop every component, last started first"""
+        with self._lock:
+            self._stopping = True
+            for child in reversed(self.children):
+                if child.process is not None and child.process.poll() is None:
+                    logger.info(f"⏹️  Stopping {child.name}...")
+                    self._terminate(child, timeout=self.stop_timeout)
+                    logger.info(f"✅ {child.name} stopped (code {child.process.returncode})")
+        self.scheduler.stop(wait=False)
+
+    # Reporting
+
+    def status(self) -> Dict[str, Dict]:
+        """Per-component pid, uptime, restarts, CPU share and RSS"""
+        now = time.time()
+        status = {}
+        for child in self.children:
+            process = child.process
+            running = process is not None and process.poll() is None
+            if running:
+                cpu_s, child.rss_bytes = process_usage(process.pid)
+                if cpu_s is not None:
+                    if child.cpu_sample:
+                        last_cpu, last_time = child.cpu_sample
+                        child.cpu_percent = 100.0 * (cpu_s - last_cpu) / max(now - last_time, 1e-6)
+                    child.cpu_sample = (cpu_s, now)
+
+            status[child.name] = {
+                "running": running,
+                "pid": process.pid if running else None,
+                "uptime_s": round(now - child.started_at) if running else 0,
+                "restarts": child.restarts,
+                "last_exit": child.last_exit,
+                "cpu_percent": round(child.cpu_percent, 1) if running and child.cpu_percent is not None else None,
+                "rss_mb": round(child.rss_bytes / 1048576, 1) if running and child.rss_bytes else None
+            }
+        return status
+
+    def report(self):
+        """Scheduler job: log and save the status of every component"""
+        status = self.status()
+        for name, entry in status.items():
+            if entry["running"]:
+                cpu = f"{entry['cpu_percent']}%" if entry["cpu_percent"] is not None else "n/a"
+                rss = f"{entry['rss_mb']} MB" if entry["rss_mb"] is not None else "n/a"
+                logger.info(
+                    f"📊 {name}: pid {entry['pid']}, up {entry['uptime_s']}s, "
+                    f"CPU {cpu}, RSS {rss}, restarts {entry['restarts']}"
+                )
+            else:
+                logger.info(f"📊 {name}: not running, restarts {entry['restarts']}")
+
+        try:
+            tmp_path = LOG_DIR / "supervisor_status.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"updated": time.time(), "components": status}, f, indent=2)
+            os.replace(tmp_path, LOG_DIR / "supervisor_status.json")
+        except Exception as e:
+            logger.error(f"Failed to save supervisor status: {e}")
+
+
+def run_component(name: str, heartbeat_interval: float):
+    """
+    Child process body: set up the heartbeat and run the component.
+
+    The component's work loops beat the heartbeat themselves (every
+    JobScheduler does, the file watcher beats from its main loop); only
+    startup is covered by a thread, until the first loop registers.
+
+    SIGTERM (CTRL_BREAK on Windows) is turned into KeyboardInterrupt, so
+    every component shuts down through its usual Ctrl+C path.
+    """
+    if sys.platform == "win32":
+        signal.signal(signal.SIGBREAK, signal.default_int_handler)
+    else:
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    os.environ['SUPERVISOR_HEARTBEAT_FILE'] = str(HEARTBEAT_DIR / f"{name}.heartbeat")
+    os.environ['SUPERVISOR_HEARTBEAT_INTERVAL'] = str(heartbeat_interval)
+    process_heartbeat().start()
+
+    module_name, function_name = COMPONENTS[name].split(":")
+    entry = getattr(importlib.import_module(module_name), function_name)
+    try:
+        entry()
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    """
+    Main entry point: bring up the whole system under one supervisor.
+
+    Usage:
+        python -m agent.supervisor
+    """
+    parser = argparse.ArgumentParser(description="Run and supervise all AI Employee components")
+    parser.add_argument("--component", choices=list(COMPONENTS), help=argparse.SUPPRESS)
+    parser.add_argument("--heartbeat-interval", type=float, default=5.0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    if args.component:
+        run_component(args.component, args.heartbeat_interval)
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_DIR / "supervisor.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+    components = [name.strip() for name in os.getenv('SUPERVISOR_COMPONENTS', '').split(',') if name.strip()]
+    supervisor = Supervisor(
+        components or default_components(),
+        heartbeat_interval=float(os.getenv('SUPERVISOR_HEARTBEAT_INTERVAL', '5')),
+        heartbeat_timeout=float(os.getenv('SUPERVISOR_HEARTBEAT_TIMEOUT', '30')),
+        max_backoff=float(os.getenv('SUPERVISOR_MAX_BACKOFF', '60')),
+        report_interval=float(os.getenv('SUPERVISOR_REPORT_INTERVAL', '300')),
+        stop_timeout=float(os.getenv('SUPERVISOR_STOP_TIMEOUT', '20'))
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: supervisor.stop())
+    supervisor.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Thread Index - Silver Tier
+Maps email conversation threads to the single task file that tracks them
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+
+class ThreadIndex:
+    """
+    Persistent map of conversation thread -> task file
+
+    An entry remembers the name of the thread's task file and how the
+    thread was classified, so a reply arriving within the window can be
+    appended to that file and re-classified from the reply alone. Entries
+    idle for longer than the window are dropped when the index is saved.
+    """
+
+    def __init__(self, index_path: Path, window_hours: float = 72.0):
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.window_s = window_hours * 3600
+        self.logger = logging.getLogger("ThreadIndex")
+
+        self._lock = threading.Lock()
+        self._threads: Dict[str, Dict] = self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_s > 0
+
+    def lookup(self, thread_key: str) -> Optional[Dict]:
+        """Return the thread's entry if it saw activity within the window"""
+        with self._lock:
+            entry = self._threads.get(thread_key)
+            if entry is None or time.time() - entry['last_activity'] > self.window_s:
+                return None
+            return dict(entry)
+
+    def record(self, thread_key: str, **fields):
+        """Create or update a thread's entry and persist the index"""
+        with self._lock:
+            entry = self._threads.setdefault(thread_key, {'messages': 0})
+            entry.update(fields)
+            entry['messages'] += 1
+            entry['last_activity'] = time.time()
+        self.save()
+
+    def save(self):
+        """Drop expired entries and write the index atomically"""
+        with self._lock:
+            cutoff = time.time() - self.window_s
+            self._threads = {
+                key: entry for key, entry in self._threads.items()
+                if entry['last_activity'] >= cutoff
+            }
+            snapshot = json.dumps(self._threads)
+
+        try:
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save thread index: {e}")
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load thread index: {e}")
+            return {}
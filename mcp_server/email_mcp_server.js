@@ -55,6 +55,60 @@ const emailConfig = {
     }
 };
 
+// Dry-run mode: accept and log sends without contacting SMTP (local testing)
+const DRY_RUN = process.env.MCP_DRY_RUN === 'true';
+let dryRunCounter = 0;
+
+// Idempotency - remember completed sends so retried requests are not resent.
+// Completed keys are appended to a file and reloaded on startup, so a
+// restart does not forget them; sends still in flight share one promise.
+const IDEMPOTENCY_TTL_MS = 24 * 60 * 60 * 1000;
+const idempotencyFile = path.join(logDir, 'mcp_idempotency.jsonl');
+const completedSends = new Map();
+const inFlightSends = new Map();
+
+function loadCompletedSends() {
+    if (!fs.existsSync(idempotencyFile)) {
+        return;
+    }
+
+    const now = Date.now();
+    for (const line of fs.readFileSync(idempotencyFile, 'utf8').split('\n')) {
+        try {
+            const { key, response, expires } = JSON.parse(line);
+            if (expires > now) {
+                completedSends.set(key, { response, expires });
+            }
+        } catch (error) {
+            // Blank or partly written line
+        }
+    }
+
+    // Compact: keep only the keys that are still live
+    const live = [...completedSends].map(([key, entry]) => JSON.stringify({ key, ...entry }) + '\n');
+    fs.writeFileSync(idempotencyFile, live.join(''));
+}
+
+function rememberSend(key, response) {
+    const now = Date.now();
+    const entry = { response, expires: now + IDEMPOTENCY_TTL_MS };
+    completedSends.set(key, entry);
+
+    try {
+        fs.appendFileSync(idempotencyFile, JSON.stringify({ key, ...entry }) + '\n');
+    } catch (error) {
+        log('WARN', 'Failed to persist idempotency key', { key, error: error.message });
+    }
+
+    // Map iterates in insertion order, so expired entries are at the front
+    for (const [oldKey, oldEntry] of completedSends) {
+        if (oldEntry.expires > now) break;
+        completedSends.delete(oldKey);
+    }
+}
+
+loadCompletedSends();
+
 // Create reusable transporter
 let transporter = null;
 
@@ -83,45 +137,37 @@ app.get('/health', (req, res) => {
     });
 });
 
-// Send email endpoint
-app.post('/send-email', async (req, res) => {
-    const startTime = Date.now();
-
+// Send one email; resolves to { status, body } and never rejects
+async function performSend(fields, startTime) {
     try {
         log('INFO', 'Received email send request', {
-            to: req.body.to,
-            subject: req.body.subject
+            to: fields.to,
+            subject: fields.subject
         });
 
         // Validate required fields
-        const { to, subject, body } = req.body;
+        const { to, subject, body } = fields;
 
         if (!to || !subject || !body) {
-            log('WARN', 'Missing required fields', req.body);
-            return res.status(400).json({
-                success: false,
-                error: 'Missing required fields: to, subject, body'
-            });
+            log('WARN', 'Missing required fields', fields);
+            return {
+                status: 400,
+                body: { success: false, error: 'Missing required fields: to, subject, body' }
+            };
         }
 
         // Validate email format
         const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
         if (!emailRegex.test(to)) {
             log('WARN', 'Invalid email format', { to });
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid email format'
-            });
+            return { status: 400, body: { success: false, error: 'Invalid email format' } };
         }
 
         // Initialize transporter if not already done
-        if (!transporter) {
+        if (!transporter && !DRY_RUN) {
             const initialized = initializeTransporter();
             if (!initialized) {
-                return res.status(500).json({
-                    success: false,
-                    error: 'Email service not configured'
-                });
+                return { status: 500, body: { success: false, error: 'Email service not configured' } };
             }
         }
 
@@ -131,21 +177,23 @@ app.post('/send-email', async (req, res) => {
             to: to,
             subject: subject,
             text: body,
-            html: req.body.html || body.replace(/\n/g, '<br>')
+            html: fields.html || body.replace(/\n/g, '<br>')
         };
 
         // Add CC if provided
-        if (req.body.cc) {
-            mailOptions.cc = req.body.cc;
+        if (fields.cc) {
+            mailOptions.cc = fields.cc;
         }
 
         // Add BCC if provided
-        if (req.body.bcc) {
-            mailOptions.bcc = req.body.bcc;
+        if (fields.bcc) {
+            mailOptions.bcc = fields.bcc;
         }
 
         // Send email
-        const info = await transporter.sendMail(mailOptions);
+        const info = DRY_RUN
+            ? { messageId: `<dry-run-${Date.now()}-${++dryRunCounter}@localhost>` }
+            : await transporter.sendMail(mailOptions);
 
         const duration = Date.now() - startTime;
 
@@ -156,12 +204,15 @@ app.post('/send-email', async (req, res) => {
             duration: `${duration}ms`
         });
 
-        res.json({
-            success: true,
-            message_id: info.messageId,
-            timestamp: new Date().toISOString(),
-            duration_ms: duration
-        });
+        return {
+            status: 200,
+            body: {
+                success: true,
+                message_id: info.messageId,
+                timestamp: new Date().toISOString(),
+                duration_ms: duration
+            }
+        };
 
     } catch (error) {
         const duration = Date.now() - startTime;
@@ -172,12 +223,55 @@ app.post('/send-email', async (req, res) => {
             duration: `${duration}ms`
         });
 
-        res.status(500).json({
-            success: false,
-            error: error.message,
-            timestamp: new Date().toISOString()
-        });
+        return {
+            status: 500,
+            body: { success: false, error: error.message, timestamp: new Date().toISOString() }
+        };
+    }
+}
+
+// Send email endpoint
+app.post('/send-email', async (req, res) => {
+    const startTime = Date.now();
+    const idempotencyKey = req.get('Idempotency-Key');
+
+    if (idempotencyKey) {
+        // Return the original result for a send we have already completed
+        const entry = completedSends.get(idempotencyKey);
+        if (entry && entry.expires > Date.now()) {
+            log('INFO', 'Duplicate send suppressed', { idempotencyKey });
+            return res.json({ ...entry.response, duplicate: true });
+        }
+        completedSends.delete(idempotencyKey);
+
+        // A retry that arrives while the first request is still sending
+        // waits for that send instead of starting a second one
+        const pending = inFlightSends.get(idempotencyKey);
+        if (pending) {
+            log('INFO', 'Waiting for in-flight send with the same key', { idempotencyKey });
+            const result = await pending;
+            const body = result.status === 200 ? { ...result.body, duplicate: true } : result.body;
+            return res.status(result.status).json(body);
+        }
+    }
+
+    let send = performSend(req.body, startTime);
+    if (idempotencyKey) {
+        // Remembered before the in-flight entry is dropped, so there is no
+        // moment where a retry finds neither
+        send = send
+            .then((result) => {
+                if (result.status === 200) {
+                    rememberSend(idempotencyKey, result.body);
+                }
+                return result;
+            })
+            .finally(() => inFlightSends.delete(idempotencyKey));
+        inFlightSends.set(idempotencyKey, send);
     }
+
+    const result = await send;
+    res.status(result.status).json(result.body);
 });
 
 // Test email endpoint (for development)
@@ -230,7 +324,11 @@ app.listen(PORT, () => {
     console.log('='.repeat(60));
 
     // Initialize transporter on startup
-    initializeTransporter();
+    if (DRY_RUN) {
+        log('INFO', 'Dry-run mode enabled - emails will not be delivered');
+    } else {
+        initializeTransporter();
+    }
 });
 
 // Graceful shutdown
@@ -6,7 +6,8 @@ This script provides a simple way to start the AI Employee system
 from VS Code or command line.
 
 Usage:
-    python run.py
+    python run.py          # file watcher only
+    python run.py --all    # every component under the supervisor
 """
 
 import os
@@ -67,8 +68,16 @@ def main():
     print("Press Ctrl+C to stop")
     print()
 
-    # Import and run watcher
     sys.path.insert(0, str(Path(__file__).parent))
+
+    # Whole system: approval engine and all watchers as supervised processes
+    if "--all" in sys.argv[1:]:
+        from agent.supervisor import main as supervisor_main
+        sys.argv = [sys.argv[0]]
+        supervisor_main()
+        return
+
+    # Import and run watcher
     from watchers.file_watcher import main as watcher_main
 
     try:
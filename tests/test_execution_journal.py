@@ -0,0 +1,70 @@
+"""Tests for journal replay and compaction (agent/execution_journal.py)"""
+
+import json
+
+import pytest
+
+from agent.execution_journal import ExecutionJournal
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "journal.jsonl"
+
+
+def test_unfinished_plan_is_recovered(journal_path):
+    journal = ExecutionJournal(journal_path)
+    journal.record_start("plan-a", 1)
+    journal.record_finish("plan-a", 1, {"success": True, "message_id": "m1"})
+    journal.record_start("plan-a", 2)
+    journal.record_finish("plan-a", 2, {"success": False, "error": "boom"})
+    journal.close()
+
+    recovered = ExecutionJournal(journal_path)
+    try:
+        assert recovered.unfinished_plans() == ["plan-a"]
+        assert recovered.finished_steps("plan-a") == {1: {"success": True, "message_id": "m1"}}
+    finally:
+        recovered.close()
+
+
+def test_completed_plans_are_compacted_away(journal_path):
+    journal = ExecutionJournal(journal_path)
+    journal.record_start("done", 1)
+    journal.record_finish("done", 1, {"success": True})
+    journal.record_complete("done")
+    journal.record_start("open", 1)
+    journal.close()
+
+    recovered = ExecutionJournal(journal_path)
+    recovered.close()
+
+    plans = {json.loads(line)["plan"] for line in journal_path.read_text().splitlines()}
+    assert plans == {"open"}
+    assert recovered.finished_steps("done") == {}
+
+
+def test_torn_last_line_is_dropped(journal_path):
+    journal = ExecutionJournal(journal_path)
+    journal.record_start("plan-a", 1)
+    journal.record_finish("plan-a", 1, {"success": True})
+    journal.close()
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"plan": "plan-a", "step": 2, "ev')
+
+    recovered = ExecutionJournal(journal_path)
+    try:
+        assert recovered.finished_steps("plan-a") == {1: {"success": True}}
+        recovered.record_start("plan-a", 2)
+    finally:
+        recovered.close()
+
+    for line in journal_path.read_text().splitlines():
+        json.loads(line)
+
+
+def test_closed_journal_refuses_records(journal_path):
+    journal = ExecutionJournal(journal_path)
+    journal.close()
+    with pytest.raises(RuntimeError):
+        journal.record_start("plan-a", 1)
@@ -0,0 +1,44 @@
+"""Tests for the local Gmail push notification receiver (watchers/gmail_push.py)"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from watchers.gmail_push import GmailPushReceiver, publish_notification
+
+
+@pytest.fixture
+def receiver():
+    receiver = GmailPushReceiver(port=0, token="secret")
+    receiver.start()
+    yield receiver
+    receiver.stop()
+
+
+def test_notification_calls_listener_with_newest_history_id(receiver):
+    calls = []
+    receiver.listener = lambda: calls.append(receiver.latest_history_id)
+
+    assert publish_notification(receiver.url + "?token=secret", 200, "me@example.com") == 204
+    assert publish_notification(receiver.url + "?token=secret", 150) == 204
+
+    assert calls == [200, 200]
+    assert receiver.notifications == 2
+    assert receiver.last_email_address == "me@example.com"
+
+
+@pytest.mark.parametrize("suffix, status", [("?token=wrong", 403), ("/other?token=secret", 404)])
+def test_bad_token_and_path_are_rejected(receiver, suffix, status):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        publish_notification(receiver.url + suffix, 1)
+    assert error.value.code == status
+    assert receiver.notifications == 0
+
+
+def test_malformed_body_is_acknowledged_without_notifying(receiver):
+    request = urllib.request.Request(receiver.url + "?token=secret", data=b'{"message": {}}', method="POST",
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        assert response.status == 204
+    assert receiver.notifications == 0
@@ -0,0 +1,93 @@
+"""Tests for cron parsing and job scheduling (agent/job_scheduler.py)"""
+
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from agent.job_scheduler import CronTrigger, JobScheduler
+
+
+def ts(*args) -> float:
+    return datetime(*args).timestamp()
+
+
+def next_after(expression: str, *moment) -> datetime:
+    start = ts(*moment)
+    return datetime.fromtimestamp(CronTrigger(expression).next_run(start, start))
+
+
+def test_fields_are_parsed():
+    trigger = CronTrigger("0-30/10 9,17 * 1-3 1-5")
+    assert trigger.minutes == {0, 10, 20, 30}
+    assert trigger.hours == {9, 17}
+    assert trigger.months == {1, 2, 3}
+    assert trigger.weekdays == {1, 2, 3, 4, 5}
+
+
+def test_aliases_and_sunday_as_seven():
+    assert CronTrigger("@daily").hours == {0}
+    assert CronTrigger("0 0 * * 7").weekdays == {0}
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* 24 * * *", "5-1 * * * *", "*/0 * * * *", "x * * * *"])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        CronTrigger(expression)
+
+
+def test_next_run_is_strictly_after_last_due():
+    assert next_after("30 9 * * *", 2026, 10, 19, 9, 30) == datetime(2026, 10, 20, 9, 30)
+    assert next_after("*/15 * * * *", 2026, 10, 19, 9, 7) == datetime(2026, 10, 19, 9, 15)
+
+
+def test_next_run_crosses_months_and_years():
+    assert next_after("0 0 1 * *", 2026, 12, 15) == datetime(2027, 1, 1)
+    assert next_after("0 12 29 2 *", 2026, 3, 1) == datetime(2028, 2, 29, 12)
+
+
+def test_day_and_weekday_match_either_when_both_restricted():
+    # 2026-10-19 is a Monday; the 21st comes before the next Monday
+    assert next_after("0 9 21 * 1", 2026, 10, 19, 10) == datetime(2026, 10, 21, 9)
+    assert next_after("0 9 30 * 1", 2026, 10, 19, 10) == datetime(2026, 10, 26, 9)
+
+
+def test_star_step_day_does_not_restrict():
+    # "*/2" counts as unrestricted, so only the weekday applies
+    assert next_after("0 9 */2 * 1", 2026, 10, 19, 10) == datetime(2026, 10, 26, 9)
+    assert next_after("0 9 1 * */2", 2026, 10, 19, 10) == datetime(2026, 11, 1, 9)
+
+
+def test_run_now_and_state_persistence(tmp_path):
+    state_path = tmp_path / "scheduler_state.json"
+    ran = threading.Event()
+
+    scheduler = JobScheduler(state_path=state_path)
+    scheduler.add_interval("poll", ran.set, seconds=3600, start_in=3600)
+    scheduler.start()
+    try:
+        scheduler.run_now("poll")
+        assert ran.wait(5)
+    finally:
+        scheduler.stop()
+
+    state = json.loads(state_path.read_text())
+    assert state["poll"]["trigger"] == "every 3600s"
+    assert scheduler.stats()["poll"]["runs"] == 1
+
+
+def test_concurrent_state_saves_leave_valid_file(tmp_path):
+    state_path = tmp_path / "scheduler_state.json"
+    scheduler = JobScheduler(state_path=state_path)
+    for i in range(20):
+        scheduler.add_interval(f"job{i}", lambda: None, seconds=60)
+
+    threads = [threading.Thread(target=lambda: [scheduler._save_state() for _ in range(25)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(json.loads(state_path.read_text())) == 20
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,143 @@
+"""Tests for MCP email sends and their idempotency keys (agent/mcp_client.py)"""
+
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from agent.mcp_client import MCPEmailClient, idempotency_key
+
+
+class StubMCPServer:
+    """
+    Minimal stand-in for mcp_server/email_mcp_server.js
+
+    Remembers Idempotency-Keys like the real server and answers a repeated
+    key with duplicate: true. `script` lists behaviours for successive
+    requests: "ok", "error" (503), "reject" (400) or "slow" (records the
+    send, then answers too late for the client).
+    """
+
+    def __init__(self, script, slow_for=1.0):
+        self.script = list(script)
+        self.slow_for = slow_for
+        self.keys = []
+        self.sent = {}
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                key = self.headers.get("Idempotency-Key")
+                with stub.lock:
+                    stub.keys.append(key)
+                    action = stub.script.pop(0) if stub.script else "ok"
+                    duplicate = key in stub.sent
+
+                if action == "error":
+                    return self._reply(503, {"success": False, "error": "unavailable"})
+                if action == "reject":
+                    return self._reply(400, {"success": False, "error": "bad address"})
+                if duplicate:
+                    return self._reply(200, {"success": True, "duplicate": True, "message_id": stub.sent[key]})
+
+                with stub.lock:
+                    stub.sent[key] = f"<msg-{len(stub.sent) + 1}>"
+                if action == "slow":
+                    time.sleep(stub.slow_for)
+                self._reply(200, {"success": True, "message_id": stub.sent[key]})
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    pass  # client gave up waiting
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def make(script, **kwargs):
+        server = StubMCPServer(script, **kwargs)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("timeout", 2.0)
+    kwargs.setdefault("max_retries", 3)
+    return MCPEmailClient(base_url=server.url, backoff_base=0.01, backoff_cap=0.05, **kwargs)
+
+
+def test_idempotency_key_is_stable_per_plan_step():
+    assert idempotency_key("Plan_a.md", 1) == idempotency_key("Plan_a.md", 1)
+    assert idempotency_key("Plan_a.md", 1) != idempotency_key("Plan_a.md", 2)
+    assert len(idempotency_key("Plan_a.md", 1)) == 32
+
+
+def test_retries_reuse_the_same_key(make_server):
+    server = make_server(["error", "error", "ok"])
+    key = idempotency_key("Plan_a.md", 1)
+    with make_client(server) as client:
+        result = client.send_email("a@example.com", "Hi", "Body", idempotency_key=key)
+
+    assert result["success"] and result["attempts"] == 3
+    assert server.keys == [key, key, key]
+
+
+def test_retry_after_timeout_is_answered_as_duplicate(make_server):
+    server = make_server(["slow"], slow_for=1.0)
+    key = idempotency_key("Plan_a.md", 2)
+    with make_client(server, timeout=0.3) as client:
+        result = client.send_email("a@example.com", "Hi", "Body", idempotency_key=key)
+
+    assert result["success"] and result["duplicate"]
+    assert len(server.sent) == 1
+    assert result["message_id"] == server.sent[key]
+
+
+def test_client_errors_are_not_retried(make_server):
+    server = make_server(["reject"])
+    with make_client(server) as client:
+        result = client.send_email("bad", "Hi", "Body", idempotency_key="k")
+
+    assert not result["success"]
+    assert result["status_code"] == 400 and result["attempts"] == 1
+    assert result["error"] == "bad address"
+
+
+def test_send_gives_up_by_its_deadline(make_server):
+    server = make_server(["error"] * 100)
+    with make_client(server, max_retries=100) as client:
+        started = time.monotonic()
+        result = client.send_email("a@example.com", "Hi", "Body", idempotency_key="k",
+                                   deadline=started + 0.5)
+
+    assert not result["success"]
+    assert "Deadline passed" in result["error"]
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,119 @@
+"""Tests for rate-limited outbound sends (agent/outbound_scheduler.py)"""
+
+import json
+
+import pytest
+
+from agent.outbound_scheduler import OutboundScheduler, TokenBucket
+
+
+@pytest.fixture
+def state_path(tmp_path, monkeypatch):
+    # One immediate email send, then no refill until a test grants tokens
+    monkeypatch.setenv("OUTBOUND_EMAIL_RATE_PER_MIN", "0")
+    monkeypatch.setenv("OUTBOUND_EMAIL_BURST", "1")
+    return tmp_path / "outbound_queue.json"
+
+
+def make_scheduler(state_path, sender=None, **kwargs):
+    scheduler = OutboundScheduler(state_path, **kwargs)
+    scheduler.register_sender("email", sender or (lambda payload, deadline: {"success": True, "to": payload["to"]}))
+    return scheduler
+
+
+def grant(scheduler, tokens):
+    bucket = scheduler.buckets["email"]
+    bucket.capacity = bucket.tokens = float(tokens)
+
+
+def test_token_bucket_with_zero_rate_never_refills():
+    bucket = TokenBucket(0, 1)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == float("inf")
+
+
+def test_send_goes_out_immediately_with_deadline(state_path):
+    deadlines = []
+
+    def sender(payload, deadline):
+        deadlines.append(deadline)
+        return {"success": True}
+
+    scheduler = make_scheduler(state_path, sender)
+    assert scheduler.submit("email", {"to": "a@x"}, deadline=123.0)["success"]
+    assert deadlines == [123.0]
+
+
+def test_throttled_send_is_pending_and_persisted(state_path):
+    scheduler = make_scheduler(state_path)
+    scheduler.submit("email", {"to": "first@x"})
+    result = scheduler.submit("email", {"to": "second@x"}, key="plan:2")
+
+    assert result["pending"] and not result["success"]
+    assert scheduler.submit("email", {"to": "second@x"}, key="plan:2")["pending"]
+    state = json.loads(state_path.read_text())
+    assert [item["payload"]["to"] for item in state["queue"]] == ["second@x"]
+    assert scheduler.metrics()["email"]["queue_depth"] == 1
+
+
+def test_queue_survives_restart_and_drains_by_priority(state_path):
+    scheduler = make_scheduler(state_path)
+    scheduler.submit("email", {"to": "now@x"})
+    scheduler.submit("email", {"to": "low@x"}, priority="Low")
+    scheduler.submit("email", {"to": "high@x"}, priority="High")
+
+    sent = []
+    restarted = make_scheduler(state_path, lambda payload, deadline: sent.append(payload["to"]) or {"success": True})
+    grant(restarted, 5)
+    assert restarted.drain() == 2
+    assert sent == ["high@x", "low@x"]
+    assert json.loads(state_path.read_text())["queue"] == []
+
+
+def test_drained_outcome_is_returned_once_for_its_key(state_path):
+    scheduler = make_scheduler(state_path)
+    scheduler.submit("email", {"to": "now@x"})
+    scheduler.submit("email", {"to": "later@x"}, key="plan:2")
+    grant(scheduler, 1)
+    scheduler.drain()
+
+    # The outcome is persisted, so a restarted submitter still collects it
+    restarted = make_scheduler(state_path)
+    assert restarted.submit("email", {"to": "later@x"}, key="plan:2") == {"success": True, "to": "later@x"}
+    assert json.loads(state_path.read_text())["outcomes"] == {}
+
+
+def test_failing_send_is_dropped_after_max_attempts(state_path):
+    scheduler = make_scheduler(state_path, lambda payload, deadline: {"success": False, "error": "smtp down"},
+                               max_attempts=2)
+    scheduler.submit("email", {"to": "now@x"})
+    scheduler.submit("email", {"to": "later@x"}, key="plan:2")
+
+    for _ in range(2):
+        grant(scheduler, 1)
+        scheduler.drain()
+
+    outcome = scheduler.submit("email", {"to": "later@x"}, key="plan:2")
+    assert outcome["dropped"] and "smtp down" in outcome["error"]
+    assert scheduler.metrics()["email"]["dropped"] == 1
+    failures = state_path.with_name("outbound_failures.jsonl").read_text().splitlines()
+    assert json.loads(failures[0])["payload"]["to"] == "later@x"
+
+
+def test_old_list_state_format_is_loaded(state_path):
+    state_path.write_text(json.dumps([{
+        "channel": "email", "rank": 1, "payload": {"to": "old@x"}, "label": "",
+        "enqueued_at": 0, "attempts": 0
+    }]))
+    scheduler = make_scheduler(state_path)
+    assert scheduler.metrics()["email"]["queue_depth"] == 1
+
+
+def test_idle_or_stalled_channels_need_no_wakeup(state_path):
+    scheduler = make_scheduler(state_path)
+    assert scheduler.next_ready_in() is None
+    scheduler.submit("email", {"to": "now@x"})
+    scheduler.submit("email", {"to": "later@x"})
+    # Rate 0 never refills, so there is nothing to wake up for
+    assert scheduler.next_ready_in() is None
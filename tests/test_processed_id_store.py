@@ -0,0 +1,94 @@
+"""Tests for the SQLite + Bloom filter processed ID store (watchers/processed_id_store.py)"""
+
+import time
+
+import pytest
+
+from watchers.processed_id_store import BloomFilter, ProcessedIdStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "processed_ids.db"
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    ids = [f"msg-{i}" for i in range(1000)]
+    for email_id in ids:
+        bloom.add(email_id)
+    assert all(email_id in bloom for email_id in ids)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 500
+
+
+def test_add_and_lookup(db_path):
+    store = ProcessedIdStore(db_path)
+    try:
+        store.add("a")
+        store.add_many(["b", "c", "b", ""])
+        assert "a" in store and "c" in store
+        assert "d" not in store
+        assert len(store) == 3
+    finally:
+        store.close()
+
+
+def test_ids_survive_restart_including_rows_after_the_saved_filter(db_path):
+    store = ProcessedIdStore(db_path)
+    store.add("saved")
+    store.close()
+
+    # Rows written after the filter was saved must be replayed on load
+    store = ProcessedIdStore(db_path)
+    store._conn.execute("INSERT INTO processed (email_id, added_at) VALUES ('unsaved', 0)")
+    store._conn.commit()
+    store._conn.close()
+
+    reopened = ProcessedIdStore(db_path)
+    try:
+        assert "saved" in reopened and "unsaved" in reopened
+    finally:
+        reopened.close()
+
+
+def test_namespaces_are_kept_apart(db_path):
+    store = ProcessedIdStore(db_path)
+    try:
+        work, home = store.namespace("work"), store.namespace("home")
+        work.add_many(["1", "2"])
+        home.add("1")
+        assert "2" in work and "2" not in home
+        assert len(work) == 2 and len(home) == 1
+    finally:
+        store.close()
+
+
+def test_legacy_file_is_imported_once(db_path, tmp_path):
+    legacy = tmp_path / "processed_emails.txt"
+    legacy.write_text("x\ny\n\ny\n")
+    store = ProcessedIdStore(db_path)
+    try:
+        assert store.import_legacy(legacy) == 2
+        legacy.write_text("z\n")
+        assert store.import_legacy(legacy) == 0
+        assert "x" in store and "z" not in store
+    finally:
+        store.close()
+
+
+def test_compact_prunes_expired_ids(db_path):
+    store = ProcessedIdStore(db_path, ttl_days=1)
+    try:
+        store.add("fresh")
+        with store._conn:
+            store._conn.execute(
+                "INSERT INTO processed (email_id, added_at) VALUES ('stale', ?)",
+                (int(time.time()) - 2 * 86400,)
+            )
+        store.bloom.add("stale")
+
+        assert store.compact() == 1
+        assert "stale" not in store and "fresh" in store
+    finally:
+        store.close()
@@ -0,0 +1,134 @@
+"""Tests for the plan step dependency graph (agent/step_executor.py)"""
+
+import time
+import threading
+
+import pytest
+
+from agent.step_executor import PlanStep, StepExecutor, critical_path
+
+
+def ok(step, deadline):
+    return {"success": True, "action": step.action}
+
+
+def test_steps_run_after_their_dependencies():
+    order = []
+    lock = threading.Lock()
+
+    def execute(step, deadline):
+        with lock:
+            order.append(step.index)
+        return ok(step, deadline)
+
+    steps = [PlanStep(1, "a"), PlanStep(2, "b", [1]), PlanStep(3, "c", [1]), PlanStep(4, "d", [2, 3])]
+    results = StepExecutor(max_workers=4).run(steps, execute)
+
+    assert [r["success"] for r in results] == [True] * 4
+    assert order[0] == 1 and order[-1] == 4
+    assert [r["step"] for r in results] == [1, 2, 3, 4]
+
+
+def test_independent_steps_run_concurrently():
+    barrier = threading.Barrier(2, timeout=2)
+
+    def execute(step, deadline):
+        barrier.wait()
+        return ok(step, deadline)
+
+    results = StepExecutor(max_workers=2).run([PlanStep(1, "a"), PlanStep(2, "b")], execute)
+    assert all(r["success"] for r in results)
+
+
+def test_failure_cancels_transitive_dependents_only():
+    def execute(step, deadline):
+        if step.index == 1:
+            return {"success": False, "error": "boom"}
+        return ok(step, deadline)
+
+    steps = [PlanStep(1, "a"), PlanStep(2, "b", [1]), PlanStep(3, "c", [2]), PlanStep(4, "d")]
+    results = StepExecutor().run(steps, execute)
+
+    assert results[0]["error"] == "boom"
+    assert results[1]["cancelled"] and results[2]["cancelled"]
+    assert "dependency step 2" in results[2]["error"]
+    assert results[3]["success"]
+
+
+def test_exception_counts_as_failure():
+    def execute(step, deadline):
+        raise RuntimeError("exploded")
+
+    results = StepExecutor().run([PlanStep(1, "a"), PlanStep(2, "b", [1])], execute)
+    assert results[0]["error"] == "exploded"
+    assert results[1]["cancelled"]
+
+
+def test_pending_step_holds_dependents():
+    def execute(step, deadline):
+        if step.index == 1:
+            return {"success": False, "pending": True, "result": "Deferred"}
+        return ok(step, deadline)
+
+    steps = [PlanStep(1, "a"), PlanStep(2, "b", [1]), PlanStep(3, "c", [2])]
+    results = StepExecutor().run(steps, execute)
+
+    assert results[0]["pending"]
+    assert results[1]["pending"] and results[2]["pending"]
+    assert not any(r.get("cancelled") for r in results)
+
+
+def test_failure_overrides_held_dependents():
+    def execute(step, deadline):
+        if step.index == 1:
+            return {"success": False, "pending": True}
+        if step.index == 2:
+            return {"success": False, "error": "boom"}
+        return ok(step, deadline)
+
+    # Step 3 waits on both the pending step 1 and the failed step 2
+    steps = [PlanStep(1, "a"), PlanStep(2, "b"), PlanStep(3, "c", [1, 2])]
+    results = StepExecutor().run(steps, execute)
+    assert results[2]["cancelled"]
+
+
+def test_each_step_gets_a_deadline():
+    deadlines = {}
+
+    def execute(step, deadline):
+        deadlines[step.index] = deadline - time.monotonic()
+        return ok(step, deadline)
+
+    StepExecutor(step_timeout=5.0).run([PlanStep(1, "a")], execute)
+    assert 4.0 < deadlines[1] <= 5.0
+
+
+def test_overdue_step_is_waited_for_not_failed():
+    def execute(step, deadline):
+        time.sleep(max(0.0, deadline - time.monotonic()) + 0.2)
+        return ok(step, deadline)
+
+    steps = [PlanStep(1, "slow"), PlanStep(2, "after", [1])]
+    results = StepExecutor(step_timeout=0.1).run(steps, execute)
+
+    assert results[0]["success"]
+    assert results[0]["duration_ms"] >= 300
+    assert results[1]["success"]
+
+
+def test_invalid_dependencies_are_rejected():
+    executor = StepExecutor()
+    for depends_on in ([2], [3], [0]):
+        with pytest.raises(ValueError):
+            executor.run([PlanStep(1, "a"), PlanStep(2, "b", depends_on)], ok)
+
+
+def test_critical_path_follows_longest_chain():
+    results = [
+        {"step": 1, "depends_on": [], "duration_ms": 10.0},
+        {"step": 2, "depends_on": [1], "duration_ms": 50.0},
+        {"step": 3, "depends_on": [1], "duration_ms": 5.0},
+        {"step": 4, "depends_on": [2, 3], "duration_ms": 1.0},
+    ]
+    assert critical_path(results) == ([1, 2, 4], 61.0)
+    assert critical_path([]) == ([], 0.0)
@@ -0,0 +1,137 @@
+"""
+Attachment Store - Content-Addressed Email Attachments
+======================================================
+
+Stores email attachments under vault/Attachments keyed by the SHA-256 of
+their content, so the same file attached to many emails is kept once.
+
+Architecture Decision:
+- Attachments arrive as base64url text and are decoded chunk by chunk,
+  hashed and written to a temporary file as they stream in; the whole
+  file is never held in memory
+- The finished file is renamed into place atomically
+  (Attachments/<first 2 hex chars>/<sha256><ext>)
+- A byte cap is enforced while streaming, not after the fact
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import os
+import re
+import base64
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable
+import logging
+
+
+logger = logging.getLogger("AttachmentStore")
+
+
+class AttachmentTooLarge(ValueError):
+    """Raised when an attachment exceeds the allowed number of bytes"""
+
+
+class Base64UrlDecoder:
+    """
+    Incremental base64url decoder
+
+    Text is decoded in whole 4-character groups as it arrives; the
+    remainder is carried over to the next chunk. Missing padding at the
+    end of the stream is tolerated.
+    """
+
+    def __init__(self):
+        self._carry = ""
+
+    def feed(self, text: str) -> bytes:
+        text = self._carry + text.strip()
+        usable = len(text) - len(text) % 4
+        self._carry = text[usable:]
+        return base64.urlsafe_b64decode(text[:usable]) if usable else b""
+
+    def close(self) -> bytes:
+        if not self._carry:
+            return b""
+        carry, self._carry = self._carry, ""
+        return base64.urlsafe_b64decode(carry + "=" * (-len(carry) % 4))
+
+
+class AttachmentStore:
+    """
+    Content-addressed file store for attachments
+
+    Args:
+        root: Directory holding the store (e.g. vault/Attachments)
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def put(self, base64_chunks: Iterable[str], filename: str, max_bytes: int) -> Dict:
+        """
+        Decode, hash and store an attachment streamed as base64url chunks
+
+        Args:
+            base64_chunks: Base64url text in pieces of any size
+            filename: Original file name (its extension is kept)
+            max_bytes: Abort once the decoded size goes past this
+
+        Returns:
+            Dictionary with sha256, size, path and duplicate flag
+
+        Raises:
+            AttachmentTooLarge: If the decoded size exceeds max_bytes
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        decoder = Base64UrlDecoder()
+        size = 0
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".incoming-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in base64_chunks:
+                    data = decoder.feed(chunk)
+                    size += len(data)
+                    if size > max_bytes:
+                        raise AttachmentTooLarge(f"{filename} exceeds {max_bytes} bytes")
+                    digest.update(data)
+                    f.write(data)
+
+                data = decoder.close()
+                size += len(data)
+                if size > max_bytes:
+                    raise AttachmentTooLarge(f"{filename} exceeds {max_bytes} bytes")
+                digest.update(data)
+                f.write(data)
+
+            sha256 = digest.hexdigest()
+            existing = self.find(sha256)
+            if existing:
+                os.unlink(tmp_name)
+                return {"sha256": sha256, "size": size, "path": existing, "duplicate": True}
+
+            path = self.root / sha256[:2] / f"{sha256}{self._extension(filename)}"
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_name, path)
+            return {"sha256": sha256, "size": size, "path": path, "duplicate": False}
+
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def find(self, sha256: str):
+        """Return the stored path for a content hash, or None"""
+        shard = self.root / sha256[:2]
+        if not shard.exists():
+            return None
+        return next(shard.glob(f"{sha256}*"), None)
+
+    @staticmethod
+    def _extension(filename: str) -> str:
+        suffix = Path(filename or "").suffix.lower()
+        return suffix if re.fullmatch(r"\.[a-z0-9]{1,10}", suffix) else ""
@@ -9,6 +9,9 @@ Architecture Decision:
 - Uses watchdog library for efficient file system event monitoring
 - Event-driven architecture (not polling) for better performance
 - Integrates with brain.py for AI decision-making
+- Optionally hosts the Gmail watcher in the same process
+  (GMAIL_DIRECT_HANDOFF=true) so emails reach the brain without a file
+  event round trip
 - Implements graceful error handling and recovery
 
 Author: AI Employee System
@@ -19,8 +22,10 @@ import os
 import sys
 import time
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -28,6 +33,7 @@ from watchdog.events import FileSystemEventHandler
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agent.brain import AIBrain
+from agent.heartbeat import process_heartbeat
 
 
 # Configure logging
@@ -92,6 +98,11 @@ class InboxHandler(FileSystemEventHandler):
             logger.debug(f"File already being processed: {file_path.name}")
             return
 
+        # Files handed to the brain directly by an in-process watcher
+        if self.brain.is_claimed(str(file_path)):
+            logger.debug(f"File already handed to the brain: {file_path.name}")
+            return
+
         logger.info(f"🆕 New file detected: {file_path.name}")
 
         # Small delay to ensure file is fully written
@@ -268,6 +279,12 @@ class FileWatcher:
         self.observer = Observer()
         self.handler = InboxHandler(self.vault_path)
 
+        # Gmail watcher in this process, handing emails straight to the brain
+        self.gmail_watcher = None
+        self.gmail_thread: Optional[threading.Thread] = None
+        if os.getenv('GMAIL_DIRECT_HANDOFF', 'false').lower() == 'true':
+            self.gmail_watcher = self._create_gmail_watcher()
+
         logger.info(f"FileWatcher initialized for vault: {self.vault_path}")
 
     def start(self):
@@ -288,11 +305,24 @@ class FileWatcher:
             self.observer.start()
             logger.info("🚀 File Watcher started successfully")
             logger.info(f"📂 Monitoring: {self.inbox_path}")
+
+            if self.gmail_watcher:
+                self.gmail_thread = threading.Thread(
+                    target=self.gmail_watcher.run, name="gmail-watcher", daemon=True
+                )
+                self.gmail_thread.start()
+                logger.info("📧 Gmail watcher running in-process (direct handoff to the brain)")
             logger.info("⏳ Waiting for new files...")
 
-            # Keep running
+            # Keep running; under the supervisor this loop beats the
+            # heartbeat while the observer and the brain make progress
+            heartbeat = process_heartbeat()
+            if heartbeat:
+                heartbeat.register("file_watcher")
             while True:
                 time.sleep(1)
+                if heartbeat and self._healthy(heartbeat.stall_timeout):
+                    heartbeat.beat("file_watcher")
 
         except KeyboardInterrupt:
             logger.info("⏹️  Shutdown signal received")
@@ -303,15 +333,47 @@ class FileWatcher:
             self.stop()
             raise
 
+    def _healthy(self, stall_timeout: float) -> bool:
+        """Observer thread alive and no task stuck in the brain"""
+        if not self.observer.is_alive():
+            logger.warning("File observer thread has stopped")
+            return False
+        busy = self.handler.brain.busy_for()
+        if busy > stall_timeout:
+            logger.warning(f"Brain has been on one task for {busy:.0f}s")
+            return False
+        return True
+
     def stop(self):
         """
         Stop the file watcher service gracefully.
         """
         logger.info("🛑 Stopping file watcher...")
+        if self.gmail_watcher:
+            self.gmail_watcher.stop()
+            if self.gmail_thread:
+                self.gmail_thread.join()
         self.observer.stop()
         self.observer.join()
+        self.handler.brain.stop_worker()
         logger.info("✅ File watcher stopped successfully")
 
+    def _create_gmail_watcher(self):
+        """
+        Create the in-process Gmail watcher (or multi-account manager).
+
+        Both share this process's AIBrain, so emails skip the Inbox file
+        event; their markdown is still written to the Inbox for the record.
+        """
+        if os.getenv('GMAIL_ACCOUNTS'):
+            from watchers.gmail_accounts import GmailAccountManager, parse_accounts
+            return GmailAccountManager(
+                str(self.vault_path), parse_accounts(os.getenv('GMAIL_ACCOUNTS')), brain=self.handler.brain
+            )
+
+        from watchers.gmail_watcher import GmailWatcher
+        return GmailWatcher(str(self.vault_path), brain=self.handler.brain)
+
 
 def main():
     """
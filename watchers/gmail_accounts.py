@@ -0,0 +1,192 @@
+"""
+Gmail Accounts - Several Mailboxes in One Process
+=================================================
+
+Watches several Gmail accounts from a single process instead of one
+process per mailbox. List the accounts in the environment:
+
+    GMAIL_ACCOUNTS=work,personal
+
+Each account authorizes with its own token file (token_<name>.json, or
+GMAIL_TOKEN_FILE_<NAME>) against the shared OAuth client in
+GMAIL_CREDENTIALS_FILE (or GMAIL_CREDENTIALS_FILE_<NAME>), and keeps its
+own historyId (logs/gmail_state_<name>.json), quota budget and
+processed-ID namespace.
+
+Architecture Decision:
+- One GmailWatcher per account; all of them share one GmailClientPool
+  (per-thread connections and the batch-fetch threads), one
+  ProcessedIdStore, the imported client libraries and the parsed
+  discovery document
+- One JobScheduler (agent/job_scheduler.py) runs every account's cycles
+  as its own job on a small pool shared by all accounts
+  (GMAIL_ACCOUNT_CONCURRENCY); an account never runs two cycles at once
+- Each account keeps its own adaptive poll interval
+- Push notifications stay a single-account feature; accounts here are polled
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import os
+import re
+import sys
+from typing import Dict, List
+import logging
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from watchers.gmail_watcher import GmailWatcher, GmailClientPool, LOG_DIR
+from watchers.processed_id_store import ProcessedIdStore
+from agent.job_scheduler import JobScheduler
+
+
+logger = logging.getLogger("GmailAccounts")
+
+# Account names end up in file names and environment variable names
+ACCOUNT_NAME = re.compile(r'[A-Za-z0-9_]+')
+
+
+def parse_accounts(value: str) -> List[str]:
+    """
+    Parse a comma-separated GMAIL_ACCOUNTS value.
+
+    Raises:
+        ValueError: If a name is invalid or listed twice
+    """
+    accounts = [name.strip() for name in value.split(',') if name.strip()]
+    for name in accounts:
+        if not ACCOUNT_NAME.fullmatch(name):
+            raise ValueError(f"Invalid Gmail account name {name!r} (use letters, digits and _)")
+    if len({name.lower() for name in accounts}) != len(accounts):
+        raise ValueError(f"Duplicate Gmail account names in {value!r}")
+    return accounts
+
+
+class GmailAccountManager:
+    """
+    Runs one GmailWatcher per account on shared threads and connections.
+
+    Args:
+        vault_path: Path to the vault root directory
+        accounts: Account names (see parse_accounts)
+        brain: AIBrain in this process to hand emails to directly (optional)
+    """
+
+    def __init__(self, vault_path: str, accounts: List[str], brain=None):
+        if not accounts:
+            raise ValueError("No Gmail accounts configured")
+
+        self.pool = GmailClientPool(max(1, int(os.getenv('GMAIL_FETCH_WORKERS', '4'))))
+        self.processed_store = ProcessedIdStore(
+            LOG_DIR / "processed_emails.db",
+            ttl_days=int(os.getenv('GMAIL_PROCESSED_TTL_DAYS', '90')),
+            bloom_capacity=int(os.getenv('GMAIL_PROCESSED_BLOOM_CAPACITY', '200000'))
+        )
+        self.processed_store.start_background_compaction(
+            float(os.getenv('GMAIL_PROCESSED_COMPACT_INTERVAL', '21600'))
+        )
+
+        self.watchers: Dict[str, GmailWatcher] = {
+            name: GmailWatcher(
+                vault_path, account=name, pool=self.pool, processed_store=self.processed_store, brain=brain
+            )
+            for name in accounts
+        }
+
+        self.concurrency = max(1, int(os.getenv('GMAIL_ACCOUNT_CONCURRENCY', '2')))
+        self.scheduler = JobScheduler(max_workers=self.concurrency)
+
+    def authenticate(self) -> List[str]:
+        """
+        Authenticate every account.
+
+        Returns:
+            Names of the accounts that are ready to watch
+        """
+        ready = []
+        for name, watcher in self.watchers.items():
+            if watcher.authenticate_gmail():
+                ready.append(name)
+            else:
+                logger.error(f"[{name}] Gmail authentication failed - account skipped")
+        return ready
+
+    def run(self):
+        """
+        Main run loop - schedule every account's cycles until interrupted (Ctrl+C).
+        """
+        logger.info("="*80)
+        logger.info(f"GMAIL WATCHER - STARTING ({len(self.watchers)} accounts)")
+        logger.info("="*80)
+        logger.info(f"Accounts: {', '.join(self.watchers)}")
+        logger.info(f"Concurrent account cycles: {self.concurrency}")
+        logger.info("Press Ctrl+C to stop")
+        logger.info("="*80)
+
+        ready = self.authenticate()
+        if not ready:
+            logger.error("No Gmail account could be authenticated")
+            return
+
+        for name in ready:
+            self.watchers[name].schedule(self.scheduler)
+
+        logger.info("🔄 Starting monitoring loop...")
+
+        try:
+            self.scheduler.run()
+
+        except KeyboardInterrupt:
+            logger.info("\n⏹️  Shutdown signal received")
+
+        self.shutdown()
+        logger.info("✅ Gmail watcher stopped successfully")
+
+    def stop(self):
+        """Ask run() to return once running cycles finish (for use from another thread)."""
+        self.scheduler.stop(wait=False)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-account sync position, quota use and last cycle's pipeline stats."""
+        return {
+            name: {
+                'history_id': watcher.history_id,
+                'poll_delay_s': round(watcher.poll_schedule.current, 1),
+                'route_delays_s': {route.name: round(route.schedule.current, 1) for route in watcher.routes},
+                'quota': watcher.quota.stats(),
+                'pipeline': watcher.pipeline_stats
+            }
+            for name, watcher in self.watchers.items()
+        }
+
+    def shutdown(self):
+        """Release every account and the shared resources (run() has let running cycles finish)."""
+        for watcher in self.watchers.values():
+            watcher.shutdown()
+        self.processed_store.close()
+        self.pool.shutdown()
+
+
+def main():
+    """
+    Main entry point for watching several Gmail accounts.
+    """
+    vault_path = os.getenv(
+        'VAULT_PATH',
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vault')
+    )
+
+    try:
+        accounts = parse_accounts(os.getenv('GMAIL_ACCOUNTS', ''))
+        manager = GmailAccountManager(vault_path, accounts)
+        manager.run()
+
+    except Exception as e:
+        logger.error(f"Failed to start Gmail watcher: {str(e)}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Gmail Push - Local Notification Receiver
+========================================
+
+Receives Gmail push notifications in the Cloud Pub/Sub push format and
+wakes the Gmail watcher so it runs an incremental sync right away instead
+of waiting for the next poll.
+
+A Pub/Sub push request is a POST whose JSON body looks like:
+
+    {"message": {"data": "<base64 of {"emailAddress": ..., "historyId": ...}>",
+                 "messageId": "...", "publishTime": "..."},
+     "subscription": "projects/.../subscriptions/..."}
+
+Any 2xx answer acknowledges the message; anything else makes Pub/Sub
+redeliver it.
+
+Run this file directly as a stand-in publisher for local testing:
+
+    python watchers/gmail_push.py --history-id 12345
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import os
+import sys
+import json
+import base64
+import argparse
+import threading
+import urllib.request
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit, parse_qs
+import logging
+
+
+logger = logging.getLogger("GmailPush")
+
+# Pub/Sub push bodies are small; refuse anything unreasonable
+MAX_NOTIFICATION_BYTES = 64 * 1024
+
+
+class GmailPushReceiver:
+    """
+    Local HTTP endpoint for Gmail push notifications
+
+    Each valid notification records the newest historyId seen and calls
+    the listener, if any (the Gmail watcher's, which asks its scheduler
+    for an immediate sync).
+    Notifications arriving while a sync is already running collapse into
+    a single wake-up.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        path: URL path notifications are POSTed to
+        token: Shared secret expected as ?token=... on the push URL
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8085,
+                 path: str = "/gmail/push", token: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.token = token or None
+
+        self.latest_history_id = 0
+        self.notifications = 0
+        self.last_email_address: Optional[str] = None
+        self.last_received: Optional[datetime] = None
+        self.listener: Optional[Callable[[], None]] = None
+
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def start(self):
+        """Start serving on a background thread"""
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                status = receiver._handle(self)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="gmail-push", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Listening for Gmail push notifications on {self.url}")
+
+    def stop(self):
+        """Stop serving"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def notify(self, history_id: int, email_address: Optional[str] = None):
+        """Record a notification and pass it to the listener"""
+        with self._lock:
+            self.latest_history_id = max(self.latest_history_id, history_id)
+            self.notifications += 1
+            self.last_email_address = email_address
+            self.last_received = datetime.now()
+        if self.listener:
+            self.listener()
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> int:
+        """Validate one push request and return the HTTP status to answer"""
+        url = urlsplit(request.path)
+        if url.path != self.path:
+            return 404
+
+        if self.token and parse_qs(url.query).get("token", [None])[0] != self.token:
+            logger.warning("Rejected Gmail push notification with a bad token")
+            return 403
+
+        length = int(request.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_NOTIFICATION_BYTES:
+            return 400
+
+        try:
+            envelope = json.loads(request.rfile.read(length))
+            data = json.loads(base64.b64decode(envelope["message"]["data"]))
+            history_id = int(data["historyId"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Malformed Gmail push notification: {e}")
+            # Acknowledge anyway - redelivering a malformed message never helps
+            return 204
+
+        self.notify(history_id, data.get("emailAddress"))
+        logger.debug(f"Gmail push notification: historyId {history_id}")
+        return 204
+
+
+def build_notification(history_id: int, email_address: str = "me@example.com") -> Dict:
+    """Build a Pub/Sub push request body like the one Gmail sends"""
+    data = json.dumps({"emailAddress": email_address, "historyId": history_id})
+    now = datetime.now(timezone.utc)
+    return {
+        "message": {
+            "data": base64.b64encode(data.encode("utf-8")).decode("ascii"),
+            "messageId": str(int(now.timestamp() * 1000)),
+            "publishTime": now.isoformat().replace("+00:00", "Z")
+        },
+        "subscription": "projects/local/subscriptions/gmail-push"
+    }
+
+
+def publish_notification(url: str, history_id: int, email_address: str = "me@example.com",
+                         timeout: float = 5.0) -> int:
+    """
+    Stand-in publisher: POST one notification to a receiver
+
+    Returns:
+        HTTP status code returned by the receiver
+    """
+    body = json.dumps(build_notification(history_id, email_address)).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=body, method="POST", headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+def main():
+    """Send a test notification to a running watcher's receiver."""
+    host = os.getenv('GMAIL_PUSH_HOST', '127.0.0.1')
+    port = os.getenv('GMAIL_PUSH_PORT', '8085')
+    path = os.getenv('GMAIL_PUSH_PATH', '/gmail/push')
+    token = os.getenv('GMAIL_PUSH_TOKEN')
+    default_url = f"http://{host}:{port}{path}" + (f"?token={token}" if token else "")
+
+    parser = argparse.ArgumentParser(description="Publish a stand-in Gmail push notification")
+    parser.add_argument("--url", default=default_url, help="Receiver URL")
+    parser.add_argument("--history-id", type=int, required=True, help="Mailbox historyId to announce")
+    parser.add_argument("--email", default="me@example.com", help="Mailbox address")
+    args = parser.parse_args()
+
+    try:
+        status = publish_notification(args.url, args.history_id, args.email)
+    except Exception as e:
+        print(f"Failed to publish notification: {e}")
+        sys.exit(1)
+    print(f"Published historyId {args.history_id} to {args.url} -> HTTP {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Gmail Quota Limiter - API Rate Control
+======================================
+
+Gmail charges every API method a number of quota units and enforces a
+per-user limit (250 units per second as a moving average). This module
+models that budget as a token bucket so watchers slow themselves down
+instead of running into 429 "Rate Limit Exceeded" responses.
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+
+
+# Quota units charged per call, from the Gmail API usage limits table
+GMAIL_QUOTA_UNITS = {
+    'getProfile': 1,
+    'history.list': 2,
+    'messages.list': 5,
+    'messages.get': 5,
+    'messages.modify': 5,
+    'messages.attachments.get': 5,
+    'messages.batchModify': 50,
+    'watch': 100,
+}
+
+# Gmail's per-user rate limit
+GMAIL_USER_UNITS_PER_SECOND = 250.0
+
+
+class QuotaLimiter:
+    """
+    Thread-safe token bucket measured in quota units
+
+    acquire() reserves units immediately and sleeps until the bucket has
+    refilled enough to cover them. Callers are served in the order they
+    arrive, and a request larger than the burst size simply waits longer
+    instead of blocking forever.
+    """
+
+    def __init__(self, units_per_second: float = GMAIL_USER_UNITS_PER_SECOND, burst: Optional[float] = None):
+        self.rate = max(0.001, float(units_per_second))
+        self.capacity = float(burst) if burst else self.rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.units_used = 0
+        self.calls: Dict[str, int] = {}
+        self.waited_s = 0.0
+
+    def acquire(self, method: str, calls: int = 1) -> float:
+        """
+        Reserve quota for `calls` invocations of a Gmail API method
+
+        Args:
+            method: Method name as listed in GMAIL_QUOTA_UNITS
+            calls: Number of calls (e.g. items in a batch request)
+
+        Returns:
+            Seconds spent waiting for quota
+        """
+        units = GMAIL_QUOTA_UNITS.get(method, 5) * calls
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= units
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            self.units_used += units
+            self.calls[method] = self.calls.get(method, 0) + calls
+            self.waited_s += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict:
+        """Units consumed, calls per method and total time spent throttled"""
+        with self._lock:
+            return {
+                'units_used': self.units_used,
+                'calls': dict(self.calls),
+                'waited_s': round(self.waited_s, 3)
+            }
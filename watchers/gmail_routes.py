@@ -0,0 +1,116 @@
+"""
+Gmail Routes - Server-Side Queries Mapped to Priority Lanes
+===========================================================
+
+Lets Gmail do the filtering: each route is a Gmail search query with its
+own poll interval and task priority, for example
+
+    GMAIL_ROUTES=vip,inbox
+    GMAIL_ROUTE_VIP_QUERY=label:VIP
+    GMAIL_ROUTE_VIP_PRIORITY=High
+    GMAIL_ROUTE_VIP_INTERVAL=15
+    GMAIL_ROUTE_INBOX_QUERY=-category:promotions -category:social newer_than:7d
+    GMAIL_ROUTE_INBOX_INTERVAL=120
+
+Every query is ANDed with is:unread. Mail that matches no route is never
+listed or downloaded. A single GMAIL_QUERY without GMAIL_ROUTES acts as
+one route at the normal poll interval.
+
+Architecture Decision:
+- Routes are listed with messages.list(q=...); the History API cannot
+  filter by query, so routed watchers do not use incremental sync
+- Each route keeps its own schedule and due time; a cycle syncs only
+  the routes that are due, highest priority first. A route with an
+  INTERVAL is polled at that fixed period (a VIP lane must not back off
+  while idle); one without follows the adaptive GMAIL_POLL_* settings
+- A message matching several due routes is fetched once, by the first
+- The route's priority reaches the brain as a floor via the "**Lane:**"
+  line of the task file
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from watchers.adaptive_interval import AdaptiveInterval
+
+
+ROUTE_NAME = re.compile(r'[A-Za-z0-9_]+')
+
+PRIORITIES = ('High', 'Medium', 'Low')
+
+
+@dataclass
+class GmailRoute:
+    """A Gmail search query polled on its own schedule"""
+    name: str
+    query: str
+    priority: Optional[str]
+    schedule: AdaptiveInterval
+    due: float = 0.0  # time.monotonic() of the next sync
+
+    @property
+    def list_query(self) -> str:
+        """The query sent to messages.list"""
+        return f"is:unread ({self.query})" if self.query else "is:unread"
+
+    @property
+    def rank(self) -> int:
+        """Sort key: High first, routes without a priority last"""
+        return PRIORITIES.index(self.priority) if self.priority else len(PRIORITIES)
+
+
+def load_routes(setting: Callable[[str, str], str], base: float,
+                minimum: float, maximum: float) -> List[GmailRoute]:
+    """
+    Build the configured routes.
+
+    Args:
+        setting: Reads a setting by name with a default (per-account aware)
+        base: Poll interval for routes that do not set one
+        minimum: Shortest adaptive delay (routes without an interval)
+        maximum: Longest adaptive delay (routes without an interval)
+
+    Returns:
+        Routes, highest priority first; empty if neither GMAIL_ROUTES nor
+        GMAIL_QUERY is set
+
+    Raises:
+        ValueError: If a route name or priority is invalid
+    """
+    names = [name.strip() for name in setting('GMAIL_ROUTES', '').split(',') if name.strip()]
+
+    if not names:
+        query = setting('GMAIL_QUERY', '').strip()
+        if not query:
+            return []
+        return [GmailRoute('default', query, None, AdaptiveInterval(base, minimum, maximum))]
+
+    routes = []
+    for name in names:
+        if not ROUTE_NAME.fullmatch(name):
+            raise ValueError(f"Invalid Gmail route name {name!r} (use letters, digits and _)")
+        prefix = f"GMAIL_ROUTE_{name.upper()}"
+
+        priority = setting(f"{prefix}_PRIORITY", '').strip().capitalize() or None
+        if priority and priority not in PRIORITIES:
+            raise ValueError(f"Invalid priority {priority!r} for Gmail route {name} (High, Medium or Low)")
+
+        interval = setting(f"{prefix}_INTERVAL", '').strip()
+        if interval:
+            schedule = AdaptiveInterval(float(interval), float(interval), float(interval))
+        else:
+            schedule = AdaptiveInterval(base, minimum, maximum)
+
+        routes.append(GmailRoute(
+            name=name,
+            query=setting(f"{prefix}_QUERY", '').strip(),
+            priority=priority,
+            schedule=schedule
+        ))
+
+    routes.sort(key=lambda route: route.rank)
+    return routes
@@ -7,10 +7,17 @@ and saves them to the vault/Inbox folder for AI Employee processing.
 
 Architecture Decision:
 - OAuth2 authentication for security
-- Polling-based (60s interval) for reliability
+- Polling-based (adaptive interval, 60s base) for reliability; cycles
+  are a job on the shared JobScheduler (agent/job_scheduler.py), and push
+  notifications ask it for an immediate run
 - Local token storage (no cloud dependencies)
 - Duplicate prevention via processed email tracking
-- Integration with existing file_watcher.py
+- Integration with existing file_watcher.py, or a direct in-process
+  handoff to the AI brain when both run in one process
+- Newsletters and automated mail are recognized from headers alone and
+  archived to a daily digest in vault/Archive, skipping the brain
+- Optional server-side routing: Gmail queries polled as priority lanes
+  (see gmail_routes.py)
 
 Author: AI Employee System
 Version: 1.0.0
@@ -21,35 +28,122 @@ import sys
 import time
 import logging
 import re
+import json
 import base64
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Google API imports
-try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-except ImportError:
-    print("ERROR: Google API libraries not installed.")
-    print("Run: pip install google-auth google-auth-oauthlib google-api-python-client")
-    sys.exit(1)
-
 from dotenv import load_dotenv
 
+from watchers.processed_id_store import ProcessedIdStore
+from watchers.gmail_quota import QuotaLimiter, GMAIL_USER_UNITS_PER_SECOND
+from watchers.adaptive_interval import AdaptiveInterval
+from watchers.gmail_push import GmailPushReceiver
+from watchers.attachment_store import AttachmentStore, AttachmentTooLarge
+from watchers.bulk_filter import BulkMailFilter, load_domains
+from watchers.gmail_routes import GmailRoute, load_routes
+from agent.job_scheduler import JobScheduler
+
 # Load environment variables
 load_dotenv()
 
 # Gmail API scopes - read and modify (to mark as read)
 SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 
+# Google API imports are deferred to _load_google_libraries() so importing
+# this module is cheap and a missing library is reported, not sys.exit()ed
+httplib2 = None
+google_auth_httplib2 = None
+Credentials = None
+BatchHttpRequest = None
+build_from_document = None
+
+
+class HttpError(Exception):
+    """Placeholder replaced by googleapiclient.errors.HttpError once loaded."""
+
+
+# Parsed Gmail discovery document, shared by every service built
+_DISCOVERY_DOCUMENT: Optional[Dict] = None
+
+# Guards the bulk-mail digests, which every account's watcher appends to
+_ARCHIVE_LOCK = threading.Lock()
+
+# A route due within this many seconds is synced with the current cycle
+ROUTE_DUE_SLACK = 1.0
+
+
+def _load_google_libraries():
+    """
+    Import the Google API client stack on first use.
+
+    The interactive OAuth flow and the requests transport are imported
+    separately, only where they are needed.
+
+    Raises:
+        ImportError: If the Google API libraries are not installed
+    """
+    global httplib2, google_auth_httplib2, Credentials, HttpError, BatchHttpRequest, build_from_document
+    if build_from_document is not None:
+        return
+
+    try:
+        import httplib2
+        import google_auth_httplib2
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import BatchHttpRequest
+        from googleapiclient.discovery import build_from_document
+    except ImportError as e:
+        raise ImportError(
+            "Google API libraries not installed. "
+            "Run: pip install google-auth google-auth-oauthlib google-api-python-client"
+        ) from e
+
+
+def _gmail_discovery_document() -> Dict:
+    """
+    Return the Gmail v1 discovery document bundled with google-api-python-client.
+
+    Parsed once per process; building from it never touches the network.
+    """
+    global _DISCOVERY_DOCUMENT
+    if _DISCOVERY_DOCUMENT is None:
+        from googleapiclient.discovery_cache import get_static_doc
+        document = get_static_doc('gmail', 'v1')
+        if document is None:
+            raise RuntimeError("Bundled Gmail discovery document not found - upgrade google-api-python-client")
+        _DISCOVERY_DOCUMENT = json.loads(document)
+    return _DISCOVERY_DOCUMENT
+
+# Gmail accepts at most 100 calls in one batch HTTP request
+GMAIL_BATCH_LIMIT = 100
+
+# messages.list accepts up to 500 results per page
+GMAIL_LIST_PAGE_LIMIT = 500
+
+# users.messages.batchModify accepts up to 1000 message IDs per call
+GMAIL_BATCH_MODIFY_LIMIT = 1000
+
+# Locates the base64url payload in an attachments.get JSON response
+ATTACHMENT_DATA_FIELD = re.compile(r'"data"\s*:\s*"')
+
+# Chunk size for streaming attachment downloads
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+# Per-item batch errors worth retrying (rate limit / transient backend errors)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
 # Configure logging
 LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
@@ -66,30 +160,191 @@ logging.basicConfig(
 logger = logging.getLogger("GmailWatcher")
 
 
+class GmailClientPool:
+    """
+    Connections and batch-fetch threads shared by the watchers in a process.
+
+    httplib2 and requests connections are not thread-safe, so each thread
+    keeps one of each; every account's authorized wrapper on that thread
+    reuses them, so N mailboxes do not mean N sets of TLS connections.
+    """
+
+    def __init__(self, fetch_workers: int):
+        self.fetch_workers = fetch_workers
+        self.fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="gmail-batch")
+        self._local = threading.local()
+
+    def http(self):
+        """Return this thread's raw httplib2 connection."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            _load_google_libraries()
+            http = self._local.http = httplib2.Http()
+        return http
+
+    def adapter(self):
+        """Return this thread's requests connection adapter."""
+        adapter = getattr(self._local, 'adapter', None)
+        if adapter is None:
+            from requests.adapters import HTTPAdapter
+            adapter = self._local.adapter = HTTPAdapter()
+        return adapter
+
+    def shutdown(self):
+        """Stop the batch-fetch threads."""
+        self.fetch_pool.shutdown(wait=False)
+
+
 class GmailWatcher:
     """
     Monitors Gmail for unread emails and converts them to markdown files.
 
-    This watcher runs continuously, checking for new emails every 60 seconds.
+    This watcher runs continuously, checking for new emails every 60 seconds
+    by default - more often while mail keeps arriving, less often when idle.
     Each email is converted to markdown and saved to vault/Inbox/ for
     processing by the AI Employee brain.
     """
 
-    def __init__(self, vault_path: str):
+    def __init__(
+        self,
+        vault_path: str,
+        account: Optional[str] = None,
+        pool: Optional[GmailClientPool] = None,
+        processed_store: Optional[ProcessedIdStore] = None,
+        brain=None
+    ):
         """
         Initialize the Gmail watcher.
 
         Args:
             vault_path: Path to the vault root directory
+            account: Account name when one process watches several mailboxes
+                (see gmail_accounts.py); None for the single-account setup
+            pool: Connections and fetch threads shared with other watchers
+            processed_store: Shared processed-ID store; this watcher uses
+                its own namespace in it
+            brain: AIBrain running in this process; emails are then handed
+                to it directly and their markdown written in the background
         """
         self.vault_path = Path(vault_path)
         self.inbox_path = self.vault_path / "Inbox"
+        self.account = account
+        self.logger = logging.getLogger(f"GmailWatcher.{account}") if account else logger
 
         # Get configuration from environment
-        self.credentials_file = os.getenv('GMAIL_CREDENTIALS_FILE', 'credentials.json')
-        self.token_file = os.getenv('GMAIL_TOKEN_FILE', 'token.json')
+        self.credentials_file = self._account_setting('GMAIL_CREDENTIALS_FILE', 'credentials.json')
+        self.token_file = self._account_setting(
+            'GMAIL_TOKEN_FILE', f'token_{account}.json' if account else 'token.json'
+        )
         self.poll_interval = int(os.getenv('POLL_INTERVAL', '60'))
 
+        # Poll faster while mail keeps arriving, back off while idle or throttled
+        self.poll_schedule = AdaptiveInterval(
+            base=self.poll_interval,
+            minimum=float(os.getenv('GMAIL_POLL_MIN_INTERVAL', '10')),
+            maximum=float(os.getenv('GMAIL_POLL_MAX_INTERVAL', '300'))
+        )
+
+        # Server-side routing: Gmail queries polled on their own schedules
+        # (GMAIL_ROUTES / GMAIL_QUERY); none configured means is:unread sync
+        self.routes = load_routes(
+            self._account_setting, self.poll_interval,
+            self.poll_schedule.minimum, self.poll_schedule.maximum
+        )
+        self._due_routes: List[GmailRoute] = []
+        self._message_routes: Dict[str, GmailRoute] = {}  # message ID -> route that listed it
+
+        # Optional push mode: Pub/Sub-style notifications received locally
+        # trigger an immediate sync and polling becomes a slow fallback
+        self.push_enabled = os.getenv('GMAIL_PUSH_ENABLED', 'false').lower() == 'true'
+        self.push_topic = os.getenv('GMAIL_PUSH_TOPIC')
+        self.push_fallback_interval = float(os.getenv('GMAIL_PUSH_FALLBACK_INTERVAL', '900'))
+        self.push_receiver: Optional[GmailPushReceiver] = None
+        self._watch_expires = 0.0
+        self._push_hold_until = 0.0  # notifications wait while throttled
+
+        # Cycles run as a job on this scheduler (run()) or on a shared one
+        # (schedule(), e.g. one per account in gmail_accounts.py)
+        self.scheduler = JobScheduler(max_workers=1)
+        self.job_name = f"gmail_{self.account}" if self.account else "gmail"
+
+        # Set when Gmail answers 429/5xx: seconds from Retry-After (0.0 if absent)
+        self._throttled: Optional[float] = None
+        self._throttle_lock = threading.Lock()
+        self.batch_size = max(1, min(int(os.getenv('GMAIL_BATCH_SIZE', '50')), GMAIL_BATCH_LIMIT))
+        self.page_size = max(1, min(int(os.getenv('GMAIL_PAGE_SIZE', '100')), GMAIL_LIST_PAGE_LIMIT))
+
+        # Max emails handled per cycle (0 = no limit). When the budget is used
+        # up the next cycle starts immediately instead of waiting.
+        self.max_per_cycle = int(os.getenv('GMAIL_MAX_PER_CYCLE', '500'))
+        self.backlog_pending = False
+
+        # Emails saved to the Inbox and waiting to be marked read in Gmail:
+        # message ID -> (email, saved file path)
+        self._pending_read: Dict[str, tuple] = {}
+
+        # Pipeline: a fetcher stage (with up to fetch_workers batch requests
+        # in flight), a pool of decode/convert workers and the writer (the
+        # calling thread), connected by bounded queues
+        self.fetch_workers = max(1, int(os.getenv('GMAIL_FETCH_WORKERS', '4')))
+        self.decode_workers = max(1, int(os.getenv('GMAIL_DECODE_WORKERS', '4')))
+        self.pipeline_depth = max(1, int(os.getenv('GMAIL_PIPELINE_DEPTH', '200')))
+        self.pipeline_stats: Dict = {}
+        self._owns_pool = pool is None
+        self.pool = pool or GmailClientPool(self.fetch_workers)
+        self._fetch_pool = self.pool.fetch_pool
+
+        # Every API call is charged against Gmail's per-user quota units
+        self.quota = QuotaLimiter(
+            float(os.getenv('GMAIL_QUOTA_UNITS_PER_SEC', GMAIL_USER_UNITS_PER_SECOND))
+        )
+
+        # Per-thread authorized wrappers around the pool's connections
+        self.credentials = None
+        self.token_refresh_margin = float(os.getenv('GMAIL_TOKEN_REFRESH_MARGIN', '300'))
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._local = threading.local()
+        self._fetch_incomplete = False
+
+        # Attachments are streamed into a content-addressed store in the vault,
+        # at most attachment_max_bytes per message
+        self.attachments_enabled = os.getenv('GMAIL_ATTACHMENTS_ENABLED', 'true').lower() == 'true'
+        self.attachment_max_bytes = int(os.getenv('GMAIL_ATTACHMENT_MAX_BYTES', str(25 * 1024 * 1024)))
+        self.attachment_store = AttachmentStore(self.vault_path / "Attachments")
+
+        # Bulk-mail lane: newsletters and notifications matched on headers are
+        # listed in vault/Archive/Bulk_<date>.md instead of becoming tasks.
+        # Off unless enabled: list and ESP-sent mail from real customers
+        # carries the same headers and would never reach the brain
+        self.archive_path = self.vault_path / "Archive"
+        self.bulk_filter = None
+        if os.getenv('GMAIL_BULK_FILTER', 'false').lower() == 'true':
+            self.bulk_filter = BulkMailFilter(load_domains(
+                self._account_setting('GMAIL_BULK_DOMAINS', ''),
+                self._account_setting('GMAIL_BULK_DOMAINS_FILE', '') or None
+            ))
+
+        # Direct handoff: the brain gets each email as soon as it is rendered
+        # and a single background thread writes the Inbox files for the record
+        self.brain = brain
+        self._markdown_writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmail-markdown") if brain else None
+        )
+        self._markdown_writes: List[tuple] = []  # (email ID, future)
+        self._reserved_paths = set()
+        self._reserved_lock = threading.Lock()
+
+        # Optional API endpoint override (e.g. a local fake Gmail server)
+        self.api_endpoint = self._account_setting('GMAIL_API_ENDPOINT', '') or None
+
+        # Incremental sync: only ask Gmail for messages added since the last
+        # historyId instead of re-listing every unread message each cycle
+        self.incremental_sync = os.getenv('GMAIL_INCREMENTAL_SYNC', 'true').lower() == 'true'
+        self.state_file = LOG_DIR / (f"gmail_state_{account}.json" if account else "gmail_state.json")
+        self.history_id = self._load_state().get('history_id')
+        self._pending_history_id = None
+
         # Validate paths
         if not self.vault_path.exists():
             raise ValueError(f"Vault path does not exist: {self.vault_path}")
@@ -101,44 +356,101 @@ class GmailWatcher:
         self.service = None
 
         # Track processed emails to avoid duplicates
-        self.processed_emails = set()
-        self._load_processed_emails()
-
-        logger.info(f"GmailWatcher initialized for vault: {self.vault_path}")
-        logger.info(f"Poll interval: {self.poll_interval} seconds")
-
-    def _load_processed_emails(self):
+        if processed_store is not None:
+            self.processed_emails = processed_store.namespace(account or 'default')
+        else:
+            self.processed_emails = self._load_processed_emails()
+
+        self.logger.info(f"GmailWatcher initialized for vault: {self.vault_path}")
+        self.logger.info(f"Poll interval: {self.poll_interval} seconds")
+
+    def _account_setting(self, name: str, default: str) -> str:
+        """Read NAME_<ACCOUNT> if set, else NAME, else the default."""
+        if self.account:
+            value = os.getenv(f"{name}_{self.account.upper()}")
+            if value:
+                return value
+            # Token files are always per account
+            return default if name == 'GMAIL_TOKEN_FILE' else os.getenv(name, default)
+        return os.getenv(name, default)
+
+    def _load_processed_emails(self) -> ProcessedIdStore:
         """
-        Load list of already processed email IDs from tracking file.
+        Open the processed email ID store.
 
-        This prevents duplicate processing if the watcher restarts.
+        This prevents duplicate processing if the watcher restarts. IDs from
+        the legacy processed_emails.txt file are imported on first use, and
+        IDs older than GMAIL_PROCESSED_TTL_DAYS are pruned in the background.
         """
-        tracking_file = LOG_DIR / "processed_emails.txt"
+        store = ProcessedIdStore(
+            LOG_DIR / "processed_emails.db",
+            ttl_days=int(os.getenv('GMAIL_PROCESSED_TTL_DAYS', '90')),
+            bloom_capacity=int(os.getenv('GMAIL_PROCESSED_BLOOM_CAPACITY', '200000'))
+        )
 
-        if tracking_file.exists():
-            try:
-                with open(tracking_file, 'r') as f:
-                    self.processed_emails = set(line.strip() for line in f if line.strip())
-                logger.info(f"Loaded {len(self.processed_emails)} processed email IDs")
-            except Exception as e:
-                logger.error(f"Failed to load processed emails: {str(e)}")
-                self.processed_emails = set()
+        try:
+            store.import_legacy(LOG_DIR / "processed_emails.txt")
+        except Exception as e:
+            self.logger.error(f"Failed to import processed emails: {str(e)}")
+
+        store.start_background_compaction(
+            float(os.getenv('GMAIL_PROCESSED_COMPACT_INTERVAL', '21600'))
+        )
+        return store
 
     def _save_processed_email(self, email_id: str):
         """
-        Save email ID to tracking file to prevent duplicate processing.
+        Save email ID to tracking store to prevent duplicate processing.
 
         Args:
             email_id: Gmail message ID
         """
-        tracking_file = LOG_DIR / "processed_emails.txt"
+        self._save_processed_emails([email_id])
+
+    def _save_processed_emails(self, email_ids: List[str]):
+        """
+        Save several email IDs to the tracking store in one transaction.
 
+        Args:
+            email_ids: Gmail message IDs
+        """
+        try:
+            self.processed_emails.add_many(email_ids)
+        except Exception as e:
+            self.logger.error(f"Failed to save processed email ID: {str(e)}")
+
+    def _load_state(self) -> Dict:
+        """Load persisted sync state (last historyId)."""
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load Gmail sync state: {str(e)}")
+            return {}
+
+    def _save_state(self):
+        """Persist sync state atomically."""
         try:
-            with open(tracking_file, 'a') as f:
-                f.write(f"{email_id}\n")
-            self.processed_emails.add(email_id)
+            tmp_file = self.state_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'history_id': self.history_id}, f)
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
-            logger.error(f"Failed to save processed email ID: {str(e)}")
+            self.logger.error(f"Failed to save Gmail sync state: {str(e)}")
+
+    def _commit_history_id(self):
+        """
+        Advance the saved historyId once the cycle's emails are processed.
+
+        Committing only after processing means a crash mid-cycle replays the
+        same history window instead of losing messages.
+        """
+        if self._pending_history_id and self._pending_history_id != self.history_id:
+            self.history_id = self._pending_history_id
+            self._save_state()
+        self._pending_history_id = None
 
     def authenticate_gmail(self) -> bool:
         """
@@ -153,118 +465,638 @@ class GmailWatcher:
         Returns:
             True if authentication successful, False otherwise
         """
+        try:
+            _load_google_libraries()
+        except ImportError as e:
+            self.logger.error(str(e))
+            return False
+
         creds = None
 
         # Check if we have a saved token
         if os.path.exists(self.token_file):
             try:
                 creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
-                logger.info("Loaded existing credentials from token file")
+                self.logger.info("Loaded existing credentials from token file")
             except Exception as e:
-                logger.error(f"Failed to load credentials: {str(e)}")
+                self.logger.error(f"Failed to load credentials: {str(e)}")
 
         # If credentials don't exist or are invalid, authenticate
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    logger.info("Refreshing expired credentials...")
+                    from google.auth.transport.requests import Request
+                    self.logger.info("Refreshing expired credentials...")
                     creds.refresh(Request())
-                    logger.info("Credentials refreshed successfully")
+                    self.logger.info("Credentials refreshed successfully")
                 except Exception as e:
-                    logger.error(f"Failed to refresh credentials: {str(e)}")
+                    self.logger.error(f"Failed to refresh credentials: {str(e)}")
                     creds = None
 
             # If still no valid credentials, run OAuth2 flow
             if not creds:
                 if not os.path.exists(self.credentials_file):
-                    logger.error(f"Credentials file not found: {self.credentials_file}")
-                    logger.error("Please download credentials.json from Google Cloud Console")
+                    self.logger.error(f"Credentials file not found: {self.credentials_file}")
+                    self.logger.error("Please download credentials.json from Google Cloud Console")
                     return False
 
                 try:
-                    logger.info("Starting OAuth2 authentication flow...")
-                    logger.info("A browser window will open for authentication")
+                    self.logger.info("Starting OAuth2 authentication flow...")
+                    self.logger.info("A browser window will open for authentication")
 
+                    from google_auth_oauthlib.flow import InstalledAppFlow
                     flow = InstalledAppFlow.from_client_secrets_file(
                         self.credentials_file, SCOPES
                     )
                     creds = flow.run_local_server(port=0)
 
-                    logger.info("Authentication successful!")
+                    self.logger.info("Authentication successful!")
                 except Exception as e:
-                    logger.error(f"OAuth2 flow failed: {str(e)}")
+                    self.logger.error(f"OAuth2 flow failed: {str(e)}")
                     return False
 
             # Save credentials for future use
             try:
                 with open(self.token_file, 'w') as token:
                     token.write(creds.to_json())
-                logger.info(f"Credentials saved to {self.token_file}")
+                self.logger.info(f"Credentials saved to {self.token_file}")
             except Exception as e:
-                logger.error(f"Failed to save credentials: {str(e)}")
+                self.logger.error(f"Failed to save credentials: {str(e)}")
 
-        # Build Gmail service
+        self.credentials = creds
+        self._start_token_refresher()
+
+        # Build Gmail service from the bundled discovery document
         try:
-            self.service = build('gmail', 'v1', credentials=creds)
-            logger.info("Gmail service initialized successfully")
+            client_options = {'api_endpoint': self.api_endpoint} if self.api_endpoint else None
+            self.service = build_from_document(
+                _gmail_discovery_document(), credentials=creds, client_options=client_options
+            )
+            self.logger.info("Gmail service initialized successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to build Gmail service: {str(e)}")
+            self.logger.error(f"Failed to build Gmail service: {str(e)}")
             return False
 
+    def _start_token_refresher(self):
+        """
+        Refresh the access token in the background shortly before it expires.
+
+        API calls then never stall on a refresh, and the token file always
+        holds a valid token, so a restart can skip the refresh round trip.
+        """
+        if not self.credentials or not self.credentials.refresh_token:
+            return
+        if self._refresher and self._refresher.is_alive():
+            return
+
+        self._refresher = threading.Thread(
+            target=self._token_refresh_loop,
+            name=f"gmail-token-refresh-{self.account}" if self.account else "gmail-token-refresh",
+            daemon=True
+        )
+        self._refresher.start()
+
+    def _token_refresh_loop(self):
+        """Refresher thread: sleep until the refresh margin, refresh, repeat."""
+        while True:
+            expiry = self.credentials.expiry
+            if expiry is None:
+                wait = 3600.0
+            else:
+                # google-auth keeps expiry as naive UTC
+                wait = (expiry - datetime.utcnow()).total_seconds() - self.token_refresh_margin
+
+            if self._stop_event.wait(max(0.0, wait)):
+                return
+
+            if not self._refresh_credentials():
+                # Try again shortly; the library still refreshes on demand
+                if self._stop_event.wait(60):
+                    return
+
+    def _refresh_credentials(self) -> bool:
+        """Refresh the access token now and persist it to the token file."""
+        try:
+            from google.auth.transport.requests import Request
+            self.credentials.refresh(Request())
+            with open(self.token_file, 'w') as token:
+                token.write(self.credentials.to_json())
+            self.logger.info(f"Credentials refreshed proactively (valid until {self.credentials.expiry} UTC)")
+            return True
+        except Exception as e:
+            self.logger.error(f"Proactive credential refresh failed: {str(e)}")
+            return False
+
+    def start_push(self):
+        """
+        Start the local push notification receiver.
+
+        When GMAIL_PUSH_TOPIC is set, Gmail is also asked (users.watch) to
+        publish mailbox changes to that Cloud Pub/Sub topic; otherwise the
+        receiver only hears from whatever posts to it directly, such as the
+        stand-in publisher in watchers/gmail_push.py.
+        """
+        self.push_receiver = GmailPushReceiver(
+            host=os.getenv('GMAIL_PUSH_HOST', '127.0.0.1'),
+            port=int(os.getenv('GMAIL_PUSH_PORT', '8085')),
+            path=os.getenv('GMAIL_PUSH_PATH', '/gmail/push'),
+            token=os.getenv('GMAIL_PUSH_TOKEN')
+        )
+        self.push_receiver.start()
+        self._renew_watch()
+
+    def stop_push(self):
+        """Stop the push notification receiver."""
+        if self.push_receiver:
+            self.push_receiver.stop()
+            self.push_receiver = None
+
+    def _renew_watch(self):
+        """
+        Call users.watch when the current watch is within a day of expiring.
+
+        Gmail watches last 7 days; Google recommends renewing daily.
+        """
+        if not self.push_topic or not self.service:
+            return
+        if time.time() < self._watch_expires - 86400:
+            return
+
+        try:
+            response = self._execute(self.service.users().watch(
+                userId='me',
+                body={'topicName': self.push_topic, 'labelIds': ['INBOX']}
+            ), 'watch')
+            self._watch_expires = int(response.get('expiration', 0)) / 1000
+            self.logger.info(f"Gmail push watch active until {datetime.fromtimestamp(self._watch_expires)}")
+        except Exception as e:
+            # Retry next cycle; polling still covers us meanwhile
+            self.logger.error(f"Failed to start Gmail push watch: {str(e)}")
+
+    def _push_has_new_history(self) -> bool:
+        """True if a notification announced history we have not synced yet."""
+        if not self.history_id:
+            return True
+        return self.push_receiver.latest_history_id > int(self.history_id)
+
+    def schedule(self, scheduler: JobScheduler):
+        """
+        Register this watcher's cycles as a job on a scheduler.
+
+        Each run returns the adaptive delay until the next one. In push mode
+        the delay stretches to GMAIL_PUSH_FALLBACK_INTERVAL and a
+        notification announcing unseen history runs the job right away
+        (once more after the current run if one is in progress). Stale
+        notifications (already synced) do not cost an API call; while Gmail
+        is throttling us, notifications wait until the delay is over.
+        """
+        self.scheduler = scheduler
+        scheduler.add_interval(self.job_name, self._scheduled_cycle, self.poll_interval, persist=False)
+        if self.push_receiver:
+            self.push_receiver.listener = self._on_push
+
+    def _scheduled_cycle(self) -> float:
+        """Scheduler job: one cycle; returns seconds until the next"""
+        delay, throttled = self.run_cycle()
+        if self.push_receiver and delay > 0:
+            if throttled is not None:
+                self._push_hold_until = time.monotonic() + delay
+            else:
+                delay = max(delay, self.push_fallback_interval)
+        return delay
+
+    def _on_push(self):
+        """Push receiver listener: sync now if the notification is news"""
+        if time.monotonic() < self._push_hold_until:
+            return
+        if self._push_has_new_history():
+            self.logger.debug("Woken by Gmail push notification")
+            self.scheduler.run_now(self.job_name)
+
     def fetch_unread_emails(self) -> List[Dict]:
         """
-        Fetch all unread emails from Gmail.
+        Fetch unread emails from Gmail (up to the per-cycle budget).
 
         Returns:
             List of email dictionaries with metadata and content
         """
+        return list(self.iter_unread_emails())
+
+    def iter_unread_emails(self, budget: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream parsed unread emails from Gmail.
+
+        Args:
+            budget: Maximum emails to fetch (defaults to GMAIL_MAX_PER_CYCLE,
+                0 means no limit)
+
+        Yields:
+            Email dictionaries with metadata and content
+        """
+        failed = False
+        for message in self.iter_unread_messages(budget):
+            email = self._parse_message(message)
+            if email:
+                yield email
+            else:
+                failed = True
+
+        # Do not move past messages we failed to parse
+        if failed:
+            self._pending_history_id = None
+
+    def iter_unread_messages(self, budget: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream raw unread message resources from Gmail, page by page.
+
+        Message IDs are listed one page at a time and their details fetched
+        in batches, so each message is yielded as soon as its batch arrives
+        and the backlog is never held in memory. Sets self.backlog_pending
+        when the budget ran out before the backlog did.
+
+        Args:
+            budget: Maximum messages to yield (defaults to GMAIL_MAX_PER_CYCLE,
+                0 means no limit)
+
+        Yields:
+            Gmail message resources fetched with format='full'
+        """
+        self.backlog_pending = False
+
         if not self.service:
-            logger.error("Gmail service not initialized")
-            return []
+            self.logger.error("Gmail service not initialized")
+            return
+
+        _load_google_libraries()
+
+        budget = self.max_per_cycle if budget is None else budget
+        requested = 0
+
+        # Batch fetches in flight, oldest first: (future, chunk)
+        inflight = deque()
+        self._fetch_incomplete = False
+        self._message_routes = {}
 
         try:
-            # Query for unread messages
-            results = self.service.users().messages().list(
+            for email_ids in self._iter_message_id_pages():
+                if not email_ids:
+                    continue
+
+                self.logger.info(f"Found {len(email_ids)} unread email(s)")
+
+                # Skip emails we have already processed
+                new_ids = []
+                for email_id in email_ids:
+                    if email_id in self.processed_emails or email_id in self._pending_read:
+                        self.logger.debug(f"Skipping already processed email: {email_id}")
+                        continue
+                    new_ids.append(email_id)
+
+                # Fetch full details in batch requests instead of one call
+                # each, keeping up to fetch_workers batches in flight
+                position = 0
+                while position < len(new_ids):
+                    if budget and requested >= budget:
+                        yield from self._collect_batches(inflight, 0)
+                        self.logger.info(f"Per-cycle budget of {budget} reached - backlog remains")
+                        self.backlog_pending = True
+                        self._pending_history_id = None
+                        return
+
+                    size = self.batch_size if not budget else min(self.batch_size, budget - requested)
+                    chunk = new_ids[position:position + size]
+                    position += len(chunk)
+                    requested += len(chunk)
+                    inflight.append((self._fetch_pool.submit(self._fetch_messages_batch, chunk), chunk))
+
+                    yield from self._collect_batches(inflight, self.fetch_workers - 1)
+
+            yield from self._collect_batches(inflight, 0)
+
+            # Do not move past messages we failed to fetch
+            if self._fetch_incomplete:
+                self._pending_history_id = None
+
+        except HttpError as e:
+            self.logger.error(f"Gmail API error: {str(e)}")
+            self._pending_history_id = None
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching emails: {str(e)}")
+            self._pending_history_id = None
+
+    def _collect_batches(self, inflight: deque, keep: int) -> Iterator[Dict]:
+        """
+        Yield messages from the oldest in-flight batch fetches.
+
+        Args:
+            inflight: Queue of (future, chunk) pairs, oldest first
+            keep: Number of fetches to leave in flight
+        """
+        while len(inflight) > keep:
+            future, chunk = inflight.popleft()
+            messages = future.result()
+
+            if len(messages) < len(chunk):
+                self._fetch_incomplete = True
+
+            yield from messages
+
+    def _iter_message_id_pages(self) -> Iterator[List[str]]:
+        """
+        Yield pages of candidate unread message IDs.
+
+        Uses the History API when a historyId is stored and falls back to a
+        full listing on first run or when the historyId has expired. With
+        routes configured, each due route's query is listed instead.
+        """
+        if self.routes:
+            yield from self._iter_routed_message_ids()
+            return
+
+        if self.incremental_sync and self.history_id:
+            expired = False
+            for page in self._iter_new_message_ids():
+                if page is None:
+                    expired = True
+                    break
+                yield page
+            if not expired:
+                return
+
+        yield from self._iter_unread_message_ids()
+
+    def _iter_routed_message_ids(self) -> Iterator[List[str]]:
+        """
+        Routed sync: pages of unread message IDs matching each due route.
+
+        Routes are listed highest priority first; a message listed by more
+        than one route belongs to the first.
+        """
+        for route in self._due_routes:
+            for page in self._iter_unread_message_ids(route.list_query):
+                email_ids = [i for i in page if i not in self._message_routes]
+                for email_id in email_ids:
+                    self._message_routes[email_id] = route
+                yield email_ids
+
+    def _iter_unread_message_ids(self, query: Optional[str] = None) -> Iterator[List[str]]:
+        """
+        Full sync: page through all unread message IDs.
+
+        All pages are listed before any message is processed, because marking
+        messages read shifts the is:unread result set under later page
+        tokens. Listing stops once a cycle's budget of new IDs is collected.
+
+        When incremental sync is on, the mailbox historyId is captured before
+        listing so that mail arriving during the listing is picked up by the
+        next incremental sync.
+
+        Args:
+            query: A route's Gmail query (None lists plain is:unread)
+        """
+        if self.incremental_sync and query is None:
+            profile = self._execute(self.service.users().getProfile(userId='me'), 'getProfile')
+            self._pending_history_id = profile.get('historyId')
+            self.logger.info("Running full Gmail sync")
+
+        email_ids = []
+        page_token = None
+        while True:
+            results = self._execute(self.service.users().messages().list(
                 userId='me',
-                q='is:unread',
-                maxResults=50  # Process up to 50 emails per cycle
-            ).execute()
+                q=query or 'is:unread',
+                maxResults=self.page_size,
+                pageToken=page_token
+            ), 'messages.list')
+
+            email_ids.extend(
+                message['id'] for message in results.get('messages', [])
+                if message['id'] not in self.processed_emails
+                and message['id'] not in self._pending_read
+            )
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+            if self.max_per_cycle and len(email_ids) >= self.max_per_cycle:
+                # Remaining pages are picked up by the next cycle
+                self.backlog_pending = True
+                self._pending_history_id = None
+                break
+
+        for start in range(0, len(email_ids), self.page_size):
+            yield email_ids[start:start + self.page_size]
+
+    def _iter_new_message_ids(self) -> Iterator[Optional[List[str]]]:
+        """
+        Incremental sync: pages of unread message IDs added since self.history_id.
 
-            messages = results.get('messages', [])
+        Yields None (and stops) if the stored historyId has expired and a
+        full sync is required.
+        """
+        seen = set()
+        page_token = None
 
-            if not messages:
-                logger.debug("No unread emails found")
-                return []
+        while True:
+            try:
+                response = self._execute(self.service.users().history().list(
+                    userId='me',
+                    startHistoryId=self.history_id,
+                    historyTypes=['messageAdded'],
+                    pageToken=page_token
+                ), 'history.list')
+            except HttpError as e:
+                if getattr(e, 'resp', None) is not None and e.resp.status == 404:
+                    self.logger.warning("Gmail historyId expired - falling back to full sync")
+                    self.history_id = None
+                    yield None
+                    return
+                raise
+
+            email_ids = []
+            for record in response.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    message = added['message']
+                    labels = message.get('labelIds', [])
+                    if 'UNREAD' not in labels or {'SPAM', 'TRASH', 'DRAFT'} & set(labels):
+                        continue
+                    if message['id'] not in seen:
+                        seen.add(message['id'])
+                        email_ids.append(message['id'])
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                # The final page carries the mailbox's current historyId
+                self._pending_history_id = response.get('historyId', self._pending_history_id)
+
+            yield email_ids
+
+            if not page_token:
+                return
 
-            logger.info(f"Found {len(messages)} unread email(s)")
+    def _fetch_email_details_batch(self, email_ids: List[str], max_retries: int = 2) -> List[Dict]:
+        """
+        Fetch and parse full details for many emails.
 
-            # Fetch full details for each message
-            emails = []
-            for message in messages:
-                email_id = message['id']
+        Args:
+            email_ids: Gmail message IDs
+            max_retries: Follow-up batches for retryable per-item errors
 
-                # Skip if already processed
-                if email_id in self.processed_emails:
-                    logger.debug(f"Skipping already processed email: {email_id}")
-                    continue
+        Returns:
+            List of email dictionaries in the same order as email_ids
+        """
+        emails = (self._parse_message(m) for m in self._fetch_messages_batch(email_ids, max_retries))
+        return [email for email in emails if email]
+
+    def _fetch_messages_batch(self, email_ids: List[str], max_retries: int = 2) -> List[Dict]:
+        """
+        Fetch full message resources for many emails using Gmail batch requests.
+
+        IDs are split into batches of at most self.batch_size calls. Each
+        item's error is handled on its own: rate-limit and server errors are
+        retried in a follow-up batch, other errors skip just that email.
+
+        Args:
+            email_ids: Gmail message IDs
+            max_retries: Follow-up batches for retryable per-item errors
+
+        Returns:
+            List of message resources in the same order as email_ids
+        """
+        fetched = {}
+        pending = list(email_ids)
+
+        # Building a resource object re-creates every API method from the
+        # discovery document, so do it once rather than once per message
+        messages_api = self.service.users().messages()
+
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+
+            retry = []
+
+            def callback(request_id, response, exception):
+                if exception is not None:
+                    self._note_throttle(exception)
+                    status = getattr(getattr(exception, 'resp', None), 'status', None)
+                    if status in RETRYABLE_STATUS and attempt < max_retries:
+                        retry.append(request_id)
+                    else:
+                        self.logger.error(f"Failed to fetch email {request_id}: {str(exception)}")
+                    return
+
+                fetched[request_id] = response
+
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                batch = self._new_batch(callback)
+                for email_id in chunk:
+                    batch.add(
+                        messages_api.get(userId='me', id=email_id, format='full'),
+                        request_id=email_id
+                    )
 
                 try:
-                    email_data = self._fetch_email_details(email_id)
-                    if email_data:
-                        emails.append(email_data)
-                except Exception as e:
-                    logger.error(f"Failed to fetch email {email_id}: {str(e)}")
-                    continue
+                    self._execute(batch, 'messages.get', calls=len(chunk))
+                except HttpError as e:
+                    self.logger.error(f"Batch request failed: {str(e)}")
+                    retry.extend(i for i in chunk if i not in fetched)
+
+            if retry:
+                self.logger.warning(f"Retrying {len(retry)} email(s) after per-item errors")
+                time.sleep(min(2 ** attempt, 8))
+            pending = retry
+
+        return [fetched[email_id] for email_id in email_ids if email_id in fetched]
 
-            return emails
+    def _new_batch(self, callback) -> 'BatchHttpRequest':
+        """
+        Create a batch request bound to the configured API endpoint.
+
+        The client library always derives the batch URI from the discovery
+        document's root URL, so an endpoint override has to be applied here.
+        """
+        _load_google_libraries()
+        if self.api_endpoint:
+            return BatchHttpRequest(callback=callback, batch_uri=urljoin(self.api_endpoint, 'batch'))
+        return self.service.new_batch_http_request(callback=callback)
 
+    def _execute(self, request, method: str, calls: int = 1):
+        """
+        Execute an API request (or batch) within the quota budget.
+
+        Args:
+            request: HttpRequest or BatchHttpRequest
+            method: Gmail method name used to look up its quota cost
+            calls: Number of calls the request carries (batch size)
+        """
+        _load_google_libraries()
+        self.quota.acquire(method, calls)
+        try:
+            return request.execute(http=self._thread_http())
         except HttpError as e:
-            logger.error(f"Gmail API error: {str(e)}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error fetching emails: {str(e)}")
-            return []
+            self._note_throttle(e)
+            raise
+
+    def _note_throttle(self, error: Exception):
+        """Remember a rate-limit/server error and any Retry-After it carried."""
+        resp = getattr(error, 'resp', None)
+        value = resp.get('retry-after') if hasattr(resp, 'get') else None
+        self._record_throttle(getattr(resp, 'status', None), value)
+
+    def _record_throttle(self, status: Optional[int], value: Optional[str]):
+        """Record a throttling response given its status and Retry-After value."""
+        if status not in RETRYABLE_STATUS:
+            return
+
+        retry_after = 0.0
+        if value:
+            try:
+                retry_after = float(value)
+            except ValueError:
+                # HTTP-date form
+                try:
+                    retry_at = parsedate_to_datetime(value)
+                    retry_after = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+                except (TypeError, ValueError):
+                    retry_after = 0.0
+
+        with self._throttle_lock:
+            self._throttled = max(self._throttled or 0.0, retry_after, 0.0)
+
+    def _take_throttle(self) -> Optional[float]:
+        """Return and clear the throttle noted since the last call."""
+        with self._throttle_lock:
+            throttled, self._throttled = self._throttled, None
+        return throttled
+
+    def _thread_session(self) -> 'requests.Session':
+        """Return this thread's (authorized) requests session for streaming."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            if self.credentials:
+                from google.auth.transport.requests import AuthorizedSession
+                session = AuthorizedSession(self.credentials)
+            else:
+                import requests
+                session = requests.Session()
+            session.mount('https://', self.pool.adapter())
+            session.mount('http://', self.pool.adapter())
+            self._local.session = session
+        return session
+
+    def _thread_http(self):
+        """Return this thread's (authorized) HTTP connection from the pool."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self.pool.http()
+            if self.credentials:
+                http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=http)
+            self._local.http = http
+        return http
 
     def _fetch_email_details(self, email_id: str) -> Optional[Dict]:
         """
@@ -277,11 +1109,32 @@ class GmailWatcher:
             Dictionary with email details or None if failed
         """
         try:
-            message = self.service.users().messages().get(
+            message = self._execute(self.service.users().messages().get(
                 userId='me',
                 id=email_id,
                 format='full'
-            ).execute()
+            ), 'messages.get')
+
+            return self._parse_message(message)
+
+        except Exception as e:
+            self.logger.error(f"Error fetching email details: {str(e)}")
+            return None
+
+    def _parse_message(self, message: Dict, decode_body: bool = True) -> Optional[Dict]:
+        """
+        Convert a Gmail API message resource into an email dictionary.
+
+        Args:
+            message: Message resource fetched with format='full'
+            decode_body: False to skip the payload and use Gmail's snippet
+                as the body (bulk-mail lane)
+
+        Returns:
+            Dictionary with email details or None if parsing failed
+        """
+        try:
+            email_id = message['id']
 
             # Extract headers
             headers = message['payload']['headers']
@@ -296,18 +1149,28 @@ class GmailWatcher:
                 date = datetime.now()
 
             # Extract body
-            body = self._extract_email_body(message['payload'])
+            if decode_body:
+                body = self._extract_email_body(message['payload'])
+                attachments = self._find_attachments(message['payload'])
+            else:
+                body, attachments = message.get('snippet', ''), []
+
+            route = self._message_routes.get(email_id)
 
             return {
                 'id': email_id,
+                'thread_id': message.get('threadId'),
                 'subject': subject,
                 'sender': sender,
                 'date': date,
-                'body': body
+                'body': body,
+                'attachments': attachments,
+                'route': route.name if route else None,
+                'route_priority': route.priority if route else None
             }
 
         except Exception as e:
-            logger.error(f"Error fetching email details: {str(e)}")
+            self.logger.error(f"Error parsing email {message.get('id')}: {str(e)}")
             return None
 
     def _get_header(self, headers: List[Dict], name: str) -> Optional[str]:
@@ -351,6 +1214,10 @@ class GmailWatcher:
             for part in payload['parts']:
                 mime_type = part.get('mimeType', '')
 
+                # Attached files are not the message body
+                if part.get('filename'):
+                    continue
+
                 # Prefer plain text
                 if mime_type == 'text/plain':
                     if 'data' in part['body']:
@@ -372,6 +1239,139 @@ class GmailWatcher:
 
         return body or "(No content)"
 
+    def _find_attachments(self, payload: Dict) -> List[Dict]:
+        """
+        List the attachment parts of a message payload (recursively).
+
+        Args:
+            payload: Email payload from Gmail API
+
+        Returns:
+            One dictionary per attachment with filename, mime_type, size and
+            either attachment_id (fetched separately) or inline data
+        """
+        attachments = []
+        for part in payload.get('parts', []):
+            body = part.get('body', {})
+            if part.get('filename') and ('attachmentId' in body or 'data' in body):
+                attachments.append({
+                    'filename': part['filename'],
+                    'mime_type': part.get('mimeType', 'application/octet-stream'),
+                    'size': int(body.get('size', 0)),
+                    'attachment_id': body.get('attachmentId'),
+                    'data': body.get('data')
+                })
+            elif 'parts' in part:
+                attachments.extend(self._find_attachments(part))
+        return attachments
+
+    def _save_attachments(self, email: Dict):
+        """
+        Stream an email's attachments into the attachment store.
+
+        Attachments are taken in order until the per-message byte cap would
+        be exceeded; the rest are marked as skipped. Each entry gains a
+        'path' once stored, or a 'skipped' reason. Already-handled entries
+        are left alone.
+
+        Args:
+            email: Email dictionary from _parse_message
+        """
+        remaining = self.attachment_max_bytes
+        for attachment in email.get('attachments', []):
+            if 'path' in attachment or 'skipped' in attachment:
+                remaining -= attachment.get('stored_size', 0)
+                continue
+
+            if not self.attachments_enabled:
+                attachment['skipped'] = "attachment download disabled"
+                continue
+
+            if attachment['size'] > remaining:
+                attachment['skipped'] = f"exceeds the {self._format_size(self.attachment_max_bytes)} per-message limit"
+                continue
+
+            try:
+                stored = self.attachment_store.put(
+                    self._iter_attachment_data(email['id'], attachment),
+                    attachment['filename'],
+                    remaining
+                )
+            except AttachmentTooLarge:
+                attachment['skipped'] = f"exceeds the {self._format_size(self.attachment_max_bytes)} per-message limit"
+                continue
+            except Exception as e:
+                self.logger.error(f"Failed to save attachment {attachment['filename']}: {str(e)}")
+                attachment['skipped'] = "download failed"
+                continue
+
+            attachment['path'] = stored['path']
+            attachment['sha256'] = stored['sha256']
+            attachment['stored_size'] = stored['size']
+            remaining -= stored['size']
+            if stored['duplicate']:
+                self.logger.info(f"Attachment {attachment['filename']} already stored ({stored['sha256'][:12]})")
+
+            # The inline copy is no longer needed
+            attachment['data'] = None
+
+    def _iter_attachment_data(self, message_id: str, attachment: Dict) -> Iterator[str]:
+        """
+        Yield an attachment's base64url data in chunks.
+
+        Small attachments come inline with the message. Others are
+        downloaded with attachments.get, streaming the JSON response and
+        yielding the "data" field as it arrives instead of loading the
+        whole response.
+        """
+        if attachment.get('data'):
+            data = attachment['data']
+            for start in range(0, len(data), ATTACHMENT_CHUNK_SIZE):
+                yield data[start:start + ATTACHMENT_CHUNK_SIZE]
+            return
+
+        uri = self.service.users().messages().attachments().get(
+            userId='me', messageId=message_id, id=attachment['attachment_id']
+        ).uri
+        self.quota.acquire('messages.attachments.get')
+
+        with self._thread_session().get(uri, stream=True, timeout=60) as response:
+            if response.status_code >= 400:
+                self._record_throttle(response.status_code, response.headers.get('Retry-After'))
+                response.raise_for_status()
+
+            head = ""
+            in_data = False
+            for chunk in response.iter_content(ATTACHMENT_CHUNK_SIZE):
+                # latin-1 maps bytes 1:1; the data field itself is ASCII
+                text = chunk.decode('latin-1')
+
+                if not in_data:
+                    head += text
+                    match = ATTACHMENT_DATA_FIELD.search(head)
+                    if not match:
+                        # Keep just enough to match a field split across chunks
+                        head = head[-32:]
+                        continue
+                    in_data = True
+                    text = head[match.end():]
+
+                end = text.find('"')
+                if end >= 0:
+                    yield text[:end]
+                    return
+                yield text
+
+        raise ValueError("Attachment response ended before its data field closed")
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Human-readable byte count."""
+        for unit in ('B', 'KB', 'MB'):
+            if size < 1024 or unit == 'MB':
+                return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+            size /= 1024
+
     def _decode_body(self, data: str) -> str:
         """
         Decode base64url encoded email body.
@@ -386,7 +1386,7 @@ class GmailWatcher:
             decoded_bytes = base64.urlsafe_b64decode(data)
             return decoded_bytes.decode('utf-8', errors='ignore')
         except Exception as e:
-            logger.error(f"Failed to decode email body: {str(e)}")
+            self.logger.error(f"Failed to decode email body: {str(e)}")
             return "(Failed to decode content)"
 
     def _html_to_text(self, html: str) -> str:
@@ -429,31 +1429,147 @@ class GmailWatcher:
             Path to saved file or None if failed
         """
         try:
-            # Create filename: YYYY-MM-DD__Subject_Slug.md
-            date_str = email['date'].strftime('%Y-%m-%d')
-            subject_slug = self._slugify(email['subject'])
-            filename = f"{date_str}__{subject_slug}.md"
+            self._save_attachments(email)
+            markdown_content = self._format_email_markdown(email)
+        except Exception as e:
+            self.logger.error(f"Failed to format email as markdown: {str(e)}")
+            return None
+
+        return self._write_email_markdown(email, markdown_content)
+
+    def _write_email_markdown(self, email: Dict, markdown_content: str,
+                              file_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Write formatted email markdown to a unique file in vault/Inbox/.
+
+        Args:
+            email: Email dictionary (used for the filename)
+            markdown_content: Formatted markdown
+            file_path: Path already reserved with _reserve_email_path
+
+        Returns:
+            Path to saved file or None if failed
+        """
+        try:
+            if file_path is None:
+                file_path = self._reserve_email_path(email)
+
+            # Write to file
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(markdown_content)
+
+            self.logger.info(f"Saved email to: {file_path.name}")
+            return file_path
+
+        except Exception as e:
+            self.logger.error(f"Failed to save email to markdown: {str(e)}")
+            return None
+
+        finally:
+            if file_path is not None:
+                with self._reserved_lock:
+                    self._reserved_paths.discard(file_path)
+
+    def _reserve_email_path(self, email: Dict) -> Path:
+        """
+        Pick a unique Inbox path for an email and hold it until it is written.
 
-            # Ensure filename is unique
+        Args:
+            email: Email dictionary (used for the filename)
+
+        Returns:
+            Path that no existing or pending file uses
+        """
+        # Create filename: YYYY-MM-DD__Subject_Slug.md
+        date_str = email['date'].strftime('%Y-%m-%d')
+        subject_slug = self._slugify(email['subject'])
+        filename = f"{date_str}__{subject_slug}.md"
+
+        # Ensure filename is unique, counting files still being written
+        with self._reserved_lock:
             file_path = self.inbox_path / filename
             counter = 1
-            while file_path.exists():
+            while file_path in self._reserved_paths or file_path.exists():
                 filename = f"{date_str}__{subject_slug}_{counter}.md"
                 file_path = self.inbox_path / filename
                 counter += 1
+            self._reserved_paths.add(file_path)
 
-            # Format email as markdown
-            markdown_content = self._format_email_markdown(email)
+        return file_path
 
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+    def _hand_off_to_brain(self, email: Dict, markdown_content: str) -> Path:
+        """
+        Give an email to the in-process brain and write its file in the background.
 
-            logger.info(f"Saved email to: {filename}")
-            return file_path
+        The brain starts reasoning on the markdown immediately and only
+        moves the file once the writer has set the ready event.
+
+        Returns:
+            Inbox path the markdown is being written to
+        """
+        file_path = self._reserve_email_path(email)
+        ready = threading.Event()
+
+        # Claim the path before the file exists so the Inbox handler skips it
+        self.brain.submit(str(file_path), file_path.name, markdown_content, file_ready=ready)
+
+        def write():
+            try:
+                return self._write_email_markdown(email, markdown_content, file_path) is not None
+            finally:
+                ready.set()
+
+        self._markdown_writes.append((email['id'], self._markdown_writer.submit(write)))
+        return file_path
+
+    def _finish_markdown_writes(self) -> bool:
+        """
+        Wait for background markdown writes; drop failed ones from the read queue.
+
+        Returns:
+            True if every file was written
+        """
+        ok = True
+        writes, self._markdown_writes = self._markdown_writes, []
+        for email_id, future in writes:
+            if not future.result():
+                self._pending_read.pop(email_id, None)
+                ok = False
+        return ok
+
+    def _archive_bulk_email(self, email: Dict) -> Optional[Path]:
+        """
+        Append a bulk email to today's digest in vault/Archive.
+
+        Args:
+            email: Email dictionary with a 'bulk' reason (body not decoded)
+
+        Returns:
+            Path to the digest or None if writing failed
+        """
+        try:
+            digest = self.archive_path / f"Bulk_{datetime.now().strftime('%Y-%m-%d')}.md"
+            source = f" [{self.account}]" if self.account else ""
+            subject = email['subject'].replace('\n', ' ')
+            entry = (
+                f"- **{email['date'].strftime('%H:%M')}** {subject} - {email['sender']}"
+                f"{source} _({email['bulk']}, {email['id']})_\n"
+            )
+
+            with _ARCHIVE_LOCK:
+                self.archive_path.mkdir(exist_ok=True)
+                new = not digest.exists()
+                with open(digest, 'a', encoding='utf-8') as f:
+                    if new:
+                        f.write(f"# Bulk Mail - {datetime.now().strftime('%Y-%m-%d')}\n\n"
+                                "Newsletters and automated mail archived without AI processing.\n\n")
+                    f.write(entry)
+
+            self.logger.debug(f"Archived bulk email ({email['bulk']}): {email['subject']}")
+            return digest
 
         except Exception as e:
-            logger.error(f"Failed to save email to markdown: {str(e)}")
+            self.logger.error(f"Failed to archive bulk email: {str(e)}")
             return None
 
     def _slugify(self, text: str, max_length: int = 50) -> str:
@@ -496,13 +1612,27 @@ class GmailWatcher:
             Markdown formatted string
         """
         date_formatted = email['date'].strftime('%Y-%m-%d %H:%M:%S')
+        source = f"Gmail ({self.account})" if self.account else "Gmail"
+
+        # Replies within THREAD_WINDOW_HOURS are merged into one task by the brain
+        thread = ""
+        if email.get('thread_id'):
+            key = f"{self.account}:{email['thread_id']}" if self.account else email['thread_id']
+            thread = f"\n**Thread:** {key}"
+
+        # Routed mail: the route's priority is a floor for the brain's own
+        lane = ""
+        if email.get('route'):
+            lane = f"\n**Lane:** {email['route']}"
+            if email.get('route_priority'):
+                lane += f" ({email['route_priority']})"
 
         markdown = f"""# Email: {email['subject']}
 
 **From:** {email['sender']}
 **Date:** {date_formatted}
 **Status:** New
-**Source:** Gmail
+**Source:** {source}{thread}{lane}
 
 ---
 
@@ -511,7 +1641,7 @@ class GmailWatcher:
 {email['body']}
 
 ---
-
+{self._format_attachments_markdown(email)}
 ## AI Notes
 
 (Leave blank for brain.py to process)
@@ -519,6 +1649,29 @@ class GmailWatcher:
 
         return markdown
 
+    def _format_attachments_markdown(self, email: Dict) -> str:
+        """
+        Format the attachments section (empty if the email has none).
+
+        Stored attachments link into vault/Attachments relative to the
+        task file, so links keep working as it moves between vault folders.
+        """
+        attachments = email.get('attachments') or []
+        if not attachments:
+            return ""
+
+        lines = ["", "## Attachments", ""]
+        for attachment in attachments:
+            size = self._format_size(attachment.get('stored_size', attachment['size']))
+            if attachment.get('path'):
+                relative = Path(attachment['path']).relative_to(self.vault_path).as_posix()
+                lines.append(f"- [{attachment['filename']}](../{relative}) ({size})")
+            else:
+                reason = attachment.get('skipped', 'not downloaded')
+                lines.append(f"- {attachment['filename']} ({size}) - not saved: {reason}")
+
+        return "\n".join(lines) + "\n\n---\n"
+
     def mark_email_as_read(self, email_id: str) -> bool:
         """
         Mark email as read in Gmail.
@@ -530,26 +1683,112 @@ class GmailWatcher:
             True if successful, False otherwise
         """
         if not self.service:
-            logger.error("Gmail service not initialized")
+            self.logger.error("Gmail service not initialized")
             return False
 
         try:
-            self.service.users().messages().modify(
+            self._execute(self.service.users().messages().modify(
                 userId='me',
                 id=email_id,
                 body={'removeLabelIds': ['UNREAD']}
-            ).execute()
+            ), 'messages.modify')
 
-            logger.info(f"Marked email as read: {email_id}")
+            self.logger.info(f"Marked email as read: {email_id}")
             return True
 
         except HttpError as e:
-            logger.error(f"Failed to mark email as read: {str(e)}")
+            self.logger.error(f"Failed to mark email as read: {str(e)}")
             return False
         except Exception as e:
-            logger.error(f"Unexpected error marking email as read: {str(e)}")
+            self.logger.error(f"Unexpected error marking email as read: {str(e)}")
             return False
 
+    def flush_read_marks(self) -> bool:
+        """
+        Mark all queued emails as read using users.messages.batchModify.
+
+        Up to GMAIL_BATCH_MODIFY_LIMIT IDs go in each call. An email is logged
+        and recorded as processed only after Gmail accepted its modification;
+        IDs that could not be marked stay queued for the next flush.
+
+        Returns:
+            True if every queued email was marked read
+        """
+        # Handed-off emails count as saved once their file is on disk
+        written = self._finish_markdown_writes()
+
+        if not self._pending_read:
+            return written
+
+        if not self.service:
+            self.logger.error("Gmail service not initialized")
+            return False
+
+        email_ids = list(self._pending_read)
+        flushed = []
+
+        for start in range(0, len(email_ids), GMAIL_BATCH_MODIFY_LIMIT):
+            chunk = email_ids[start:start + GMAIL_BATCH_MODIFY_LIMIT]
+            flushed.extend(self._batch_mark_as_read(chunk))
+
+        for email_id in flushed:
+            email, file_path = self._pending_read.pop(email_id)
+            self.log_action(email, file_path)
+            self.logger.info(f"✅ Successfully processed: {email['subject']}")
+
+        # Record processed IDs only once Gmail has them marked read
+        if flushed:
+            self._save_processed_emails(flushed)
+            self.logger.info(f"Marked {len(flushed)} email(s) as read")
+
+        if self._pending_read:
+            self.logger.warning(f"{len(self._pending_read)} email(s) saved but not yet marked as read")
+            return False
+
+        return written
+
+    def _batch_mark_as_read(self, email_ids: List[str], max_retries: int = 3) -> List[str]:
+        """
+        Remove the UNREAD label from a set of emails in one call.
+
+        Transient errors are retried with backoff. If Gmail rejects the
+        request outright (e.g. one invalid ID), the set is split in half so
+        the remaining IDs still get marked.
+
+        Returns:
+            IDs that were marked read
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                self._execute(self.service.users().messages().batchModify(
+                    userId='me',
+                    body={'ids': email_ids, 'removeLabelIds': ['UNREAD']}
+                ), 'messages.batchModify')
+                return email_ids
+
+            except HttpError as e:
+                status = getattr(getattr(e, 'resp', None), 'status', None)
+                if status in RETRYABLE_STATUS and attempt < max_retries:
+                    time.sleep(min(2 ** attempt, 8))
+                    continue
+
+                if status not in RETRYABLE_STATUS and len(email_ids) > 1:
+                    middle = len(email_ids) // 2
+                    return (self._batch_mark_as_read(email_ids[:middle], max_retries)
+                            + self._batch_mark_as_read(email_ids[middle:], max_retries))
+
+                self.logger.error(f"Failed to mark {len(email_ids)} email(s) as read: {str(e)}")
+                return []
+
+            except Exception as e:
+                if attempt < max_retries:
+                    time.sleep(min(2 ** attempt, 8))
+                    continue
+                self.logger.error(f"Unexpected error marking emails as read: {str(e)}")
+                return []
+
+        return []
+
     def log_action(self, email: Dict, file_path: Path):
         """
         Log email processing action to actions.log.
@@ -574,50 +1813,177 @@ class GmailWatcher:
                 f.write(f"{'='*80}\n\n")
 
         except Exception as e:
-            logger.error(f"Failed to write to actions.log: {str(e)}")
+            self.logger.error(f"Failed to write to actions.log: {str(e)}")
 
-    def process_emails(self):
+    def process_emails(self) -> int:
         """
         Main processing loop - fetch, save, and mark emails as read.
 
-        This is called once per polling cycle.
-        """
-        try:
-            # Fetch unread emails
-            emails = self.fetch_unread_emails()
+        This is called once per polling cycle. Work runs as a pipeline so
+        network, CPU and disk overlap:
 
-            if not emails:
-                return
+        - fetcher thread: lists IDs and fetches messages in batch requests
+        - decode workers: parse payloads and render markdown; bulk mail
+          matched on headers skips body decoding and attachments
+        - writer (this thread): writes Inbox files (or the bulk digest)
+          and batches read marks
 
-            logger.info(f"Processing {len(emails)} new email(s)...")
+        Returns:
+            Number of emails processed successfully
+        """
+        processed = 0
+        archived = 0
+        route_counts: Dict[str, int] = {}
+        all_processed = True
+
+        decode_queue: "queue.Queue" = queue.Queue(maxsize=self.pipeline_depth)
+        write_queue: "queue.Queue" = queue.Queue(maxsize=self.pipeline_depth)
+        depth = {'decode': [0, 0], 'write': [0, 0]}  # stage -> [max, sum]
+        samples = 0
+        started = time.monotonic()
+
+        def fetch_stage():
+            try:
+                for message in self.iter_unread_messages():
+                    decode_queue.put(message)
+            except Exception as e:
+                self.logger.error(f"Error fetching emails: {str(e)}")
+                self._pending_history_id = None
+            finally:
+                for _ in range(self.decode_workers):
+                    decode_queue.put(None)
 
-            # Process each email
-            for email in emails:
+        def decode_stage():
+            while True:
+                message = decode_queue.get()
+                if message is None:
+                    write_queue.put(None)
+                    return
+                bulk = None
+                if self.bulk_filter:
+                    try:
+                        bulk = self.bulk_filter.classify(message['payload']['headers'])
+                    except Exception as e:
+                        self.logger.error(f"Bulk filter failed on email {message.get('id')}: {str(e)}")
+
+                if bulk:
+                    email = self._parse_message(message, decode_body=False)
+                    if email:
+                        email['bulk'] = bulk
+                    write_queue.put((message.get('id'), email, None))
+                    continue
+
+                email = self._parse_message(message)
                 try:
-                    # Save to markdown
-                    file_path = self.save_email_to_markdown(email)
+                    if email:
+                        self._save_attachments(email)
+                    content = self._format_email_markdown(email) if email else None
+                except Exception as e:
+                    self.logger.error(f"Failed to format email {message.get('id')}: {str(e)}")
+                    content = None
+                write_queue.put((message.get('id'), email, content))
+
+        threads = [threading.Thread(target=fetch_stage, name="gmail-fetch", daemon=True)]
+        threads += [
+            threading.Thread(target=decode_stage, name=f"gmail-decode-{i}", daemon=True)
+            for i in range(self.decode_workers)
+        ]
+        for thread in threads:
+            thread.start()
 
-                    if file_path:
-                        # Mark as read
-                        if self.mark_email_as_read(email['id']):
-                            # Log action
-                            self.log_action(email, file_path)
+        try:
+            finished_workers = 0
+            while finished_workers < self.decode_workers:
+                item = write_queue.get()
+
+                samples += 1
+                for stage, stage_queue in (('decode', decode_queue), ('write', write_queue)):
+                    size = stage_queue.qsize()
+                    depth[stage][0] = max(depth[stage][0], size)
+                    depth[stage][1] += size
+
+                if item is None:
+                    finished_workers += 1
+                    continue
 
-                            # Track as processed
-                            self._save_processed_email(email['id'])
+                email_id, email, content = item
+                try:
+                    if email and email.get('bulk'):
+                        file_path = self._archive_bulk_email(email)
+                        archived += 1 if file_path else 0
+                    elif content and self.brain:
+                        file_path = self._hand_off_to_brain(email, content)
+                    else:
+                        file_path = self._write_email_markdown(email, content) if content else None
 
-                            logger.info(f"✅ Successfully processed: {email['subject']}")
-                        else:
-                            logger.warning(f"Email saved but failed to mark as read: {email['id']}")
+                    if file_path:
+                        # Queue for a batched mark-as-read
+                        self._pending_read[email['id']] = (email, file_path)
+                        if len(self._pending_read) >= GMAIL_BATCH_MODIFY_LIMIT:
+                            all_processed &= self.flush_read_marks()
+                        processed += 1
+                        if email['route']:
+                            route_counts[email['route']] = route_counts.get(email['route'], 0) + 1
                     else:
-                        logger.error(f"Failed to save email: {email['subject']}")
+                        self.logger.error(f"Failed to save email: {email['subject'] if email else email_id}")
+                        all_processed = False
 
                 except Exception as e:
-                    logger.error(f"Error processing email {email.get('id', 'unknown')}: {str(e)}")
+                    self.logger.error(f"Error processing email {email_id or 'unknown'}: {str(e)}")
+                    all_processed = False
                     continue
 
+            for thread in threads:
+                thread.join()
+
+            # Mark everything saved this cycle as read
+            all_processed &= self.flush_read_marks()
+
+            # Replay this history window next cycle if anything failed
+            if all_processed and not self.backlog_pending:
+                self._commit_history_id()
+            else:
+                self._pending_history_id = None
+
+            elapsed = time.monotonic() - started
+            self.pipeline_stats = {
+                'processed': processed,
+                'elapsed_s': round(elapsed, 3),
+                'emails_per_s': round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+                'queue_depth': {
+                    stage: {'max': peak, 'avg': round(total / samples, 1) if samples else 0.0}
+                    for stage, (peak, total) in depth.items()
+                },
+                'quota': self.quota.stats()
+            }
+            if self.routes:
+                self.pipeline_stats['routes'] = {
+                    route.name: route_counts.get(route.name, 0) for route in self._due_routes
+                }
+            if self.bulk_filter:
+                self.pipeline_stats['bulk'] = {
+                    'archived': archived,
+                    'share': round(archived / processed, 3) if processed else 0.0,
+                    'filter': self.bulk_filter.stats()
+                }
+
+            if processed:
+                self.logger.info(f"Processed {processed} new email(s) this cycle")
+                if self.bulk_filter:
+                    self.logger.info(
+                        f"Bulk filter: {archived} of {processed} archived without AI processing "
+                        f"(hit rate since start {self.pipeline_stats['bulk']['filter']['hit_rate']:.1%})"
+                    )
+                self.logger.info(
+                    f"Pipeline: {self.pipeline_stats['emails_per_s']} emails/s, "
+                    f"decode queue max {depth['decode'][0]}, write queue max {depth['write'][0]}, "
+                    f"total quota wait {self.pipeline_stats['quota']['waited_s']}s"
+                )
+
         except Exception as e:
-            logger.error(f"Error in process_emails: {str(e)}")
+            self.logger.error(f"Error in process_emails: {str(e)}")
+
+        return processed
 
     def run(self):
         """
@@ -625,52 +1991,136 @@ class GmailWatcher:
 
         Runs until interrupted (Ctrl+C).
         """
-        logger.info("="*80)
-        logger.info("GMAIL WATCHER - STARTING")
-        logger.info("="*80)
-        logger.info(f"Monitoring Gmail for unread emails...")
-        logger.info(f"Poll interval: {self.poll_interval} seconds")
-        logger.info(f"Saving to: {self.inbox_path}")
-        logger.info("Press Ctrl+C to stop")
-        logger.info("="*80)
+        self.logger.info("="*80)
+        self.logger.info("GMAIL WATCHER - STARTING")
+        self.logger.info("="*80)
+        self.logger.info(f"Monitoring Gmail for unread emails...")
+        self.logger.info(
+            f"Poll interval: {self.poll_interval} seconds "
+            f"(adaptive {self.poll_schedule.minimum:.0f}-{self.poll_schedule.maximum:.0f}s)"
+        )
+        for route in self.routes:
+            priority = f", {route.priority} priority" if route.priority else ""
+            self.logger.info(f"Route {route.name}: {route.list_query} (every {route.schedule.base:.0f}s{priority})")
+        self.logger.info(f"Saving to: {self.inbox_path}")
+        self.logger.info("Press Ctrl+C to stop")
+        self.logger.info("="*80)
 
         # Authenticate
         if not self.authenticate_gmail():
-            logger.error("Failed to authenticate with Gmail")
-            logger.error("Please check your credentials and try again")
+            self.logger.error("Failed to authenticate with Gmail")
+            self.logger.error("Please check your credentials and try again")
             return
 
-        logger.info("✅ Gmail authentication successful")
-        logger.info("🔄 Starting monitoring loop...")
+        self.logger.info("✅ Gmail authentication successful")
+
+        if self.push_enabled:
+            self.start_push()
+            self.logger.info(f"📨 Push mode on - fallback poll every {self.push_fallback_interval:.0f}s")
+
+        self.logger.info("🔄 Starting monitoring loop...")
 
         try:
-            while True:
-                try:
-                    # Process emails
-                    self.process_emails()
+            self.schedule(self.scheduler)
+            if not self._stop_event.is_set():
+                self.scheduler.run()
 
-                    # Wait for next cycle
-                    logger.debug(f"Waiting {self.poll_interval} seconds until next check...")
-                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            self.logger.info("\n⏹️  Shutdown signal received")
 
-                except KeyboardInterrupt:
-                    raise  # Re-raise to be caught by outer handler
+        self.logger.info("🛑 Stopping Gmail watcher...")
+        self.shutdown()
+        self.logger.info("✅ Gmail watcher stopped successfully")
 
-                except Exception as e:
-                    logger.error(f"Error in monitoring loop: {str(e)}")
-                    logger.info(f"Continuing after error... (retry in {self.poll_interval}s)")
-                    time.sleep(self.poll_interval)
+    def stop(self):
+        """Ask run() to return after the current cycle (for use from another thread)."""
+        self._stop_event.set()
+        self.scheduler.stop(wait=False)
 
-        except KeyboardInterrupt:
-            logger.info("\n⏹️  Shutdown signal received")
-            logger.info("🛑 Stopping Gmail watcher...")
-            logger.info("✅ Gmail watcher stopped successfully")
+    def run_cycle(self) -> tuple:
+        """
+        Run one monitoring cycle and work out when the next one is due.
+
+        Returns:
+            (delay, throttled): seconds until the next cycle (0 to continue
+            draining a backlog right away) and the Retry-After noted while
+            Gmail was throttling us (None if it was not)
+        """
+        try:
+            # Keep the push watch alive
+            if self.push_receiver:
+                self._renew_watch()
+
+            # Only routes that are due (all of them if push woke us early)
+            if self.routes:
+                now = time.monotonic()
+                self._due_routes = [r for r in self.routes if r.due <= now + ROUTE_DUE_SLACK] or list(self.routes)
+
+            # Process emails
+            processed = self.process_emails()
+            throttled = self._take_throttle()
+
+            # Keep draining a large backlog without waiting
+            if self.backlog_pending and throttled is None:
+                return 0.0, None
+
+            if self.routes:
+                delay = self._schedule_routes(throttled)
+            else:
+                delay = self.poll_schedule.update(
+                    processed, throttled=throttled is not None, retry_after=throttled
+                )
+            if throttled is not None:
+                self.logger.warning(f"Gmail is throttling requests - next check in {delay:.0f}s")
+            self.logger.debug(f"Waiting {delay:.0f} seconds until next check...")
+            return delay, throttled
+
+        except Exception as e:
+            delay = self.poll_schedule.update(0, throttled=True, retry_after=self._take_throttle())
+            self.logger.error(f"Error in monitoring loop: {str(e)}")
+            self.logger.info(f"Continuing after error... (retry in {delay:.0f}s)")
+            # Plain sleep: do not let push notifications cut the retry delay short
+            return delay, 0.0
+
+    def _schedule_routes(self, throttled: Optional[float]) -> float:
+        """
+        Set each synced route's next due time from what it found.
+
+        Returns:
+            Seconds until the earliest route is due
+        """
+        found = self.pipeline_stats.get('routes', {})
+        now = time.monotonic()
+        for route in self._due_routes:
+            route.due = now + route.schedule.update(
+                found.get(route.name, 0), throttled=throttled is not None, retry_after=throttled
+            )
+        return max(0.0, min(route.due for route in self.routes) - now)
+
+    def shutdown(self):
+        """Flush pending read marks and release this watcher's resources."""
+        self.flush_read_marks()
+        if self._markdown_writer:
+            self._markdown_writer.shutdown(wait=True)
+        self.stop_push()
+        self._stop_event.set()
+        self.processed_emails.close()
+        if self._owns_pool:
+            self.pool.shutdown()
 
 
 def main():
     """
     Main entry point for the Gmail watcher.
+
+    With GMAIL_ACCOUNTS set, every listed account is watched from this
+    process (see gmail_accounts.py).
     """
+    if os.getenv('GMAIL_ACCOUNTS'):
+        from watchers.gmail_accounts import main as accounts_main
+        accounts_main()
+        return
+
     # Get vault path from environment or use default
     vault_path = os.getenv(
         'VAULT_PATH',
@@ -5,12 +5,20 @@ LinkedIn Watcher - Autonomous Post Generation
 Continuously monitors posting schedule and generates business-focused
 LinkedIn content for approval and publishing.
 
+Architecture Decision:
+- Post generation is a job on the in-process JobScheduler
+  (agent/job_scheduler.py): a cron schedule (LINKEDIN_POST_SCHEDULE, or
+  LINKEDIN_POST_TIME on LINKEDIN_POST_DAYS) or a fixed interval
+  (POST_INTERVAL_MINUTES); the process sleeps until the next post is due
+- The next post time is kept in logs/linkedin_schedule.json, so a restart
+  neither posts early nor forgets a post that fell due while it was down
+
 Author: AI Employee System
 Version: 2.0.0
 """
 
 import os
-import time
+import re
 import logging
 from pathlib import Path
 from datetime import datetime, date
@@ -19,11 +27,20 @@ from dotenv import load_dotenv
 import signal
 import sys
 
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent.job_scheduler import JobScheduler
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
 POST_INTERVAL_MINUTES = int(os.getenv('POST_INTERVAL_MINUTES', 60))
+POST_SCHEDULE = os.getenv('LINKEDIN_POST_SCHEDULE', '').strip()  # cron expression
+POST_TIME = os.getenv('LINKEDIN_POST_TIME', '').strip()  # HH:MM
+POST_DAYS = os.getenv('LINKEDIN_POST_DAYS', '').strip()  # Monday,Tue,... (3+ letters)
+POST_JITTER_MINUTES = float(os.getenv('LINKEDIN_POST_JITTER_MINUTES', 0))
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 VAULT_PATH = Path(os.getenv('VAULT_PATH', 'vault'))
 
@@ -44,12 +61,60 @@ logger = logging.getLogger('LinkedInWatcher')
 # Global flag for graceful shutdown
 shutdown_requested = False
 
+# Scheduler of the running main_loop, stopped by the signal handler
+active_scheduler: Optional[JobScheduler] = None
+
+WEEKDAYS = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']
+
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully"""
     global shutdown_requested
     logger.info("Shutdown signal received. Finishing current operation...")
     shutdown_requested = True
+    if active_scheduler:
+        active_scheduler.stop(wait=False)
+
+
+def weekday_number(name: str) -> int:
+    """Cron day number (0 = Sunday) for a day name or an abbreviation of 3+ letters"""
+    prefix = name.strip().lower()
+    if len(prefix) >= 3:
+        for number, day in enumerate(WEEKDAYS):
+            if day.startswith(prefix):
+                return number
+    raise ValueError(
+        f"LINKEDIN_POST_DAYS: unknown day {name.strip()!r} "
+        f"(use names like Monday or Mon, separated by commas)"
+    )
+
+
+def post_cron_expression() -> Optional[str]:
+    """
+    Cron expression for post generation, or None to post every
+    POST_INTERVAL_MINUTES.
+
+    LINKEDIN_POST_SCHEDULE wins; an explicit POST_INTERVAL_MINUTES comes
+    next; otherwise LINKEDIN_POST_TIME (on LINKEDIN_POST_DAYS, default
+    every day) is turned into a cron expression.
+
+    Raises:
+        ValueError: LINKEDIN_POST_TIME or LINKEDIN_POST_DAYS is malformed
+    """
+    if POST_SCHEDULE:
+        return POST_SCHEDULE
+    if os.getenv('POST_INTERVAL_MINUTES') or not POST_TIME:
+        return None
+
+    match = re.fullmatch(r'([01]?\d|2[0-3]):([0-5]\d)', POST_TIME)
+    if not match:
+        raise ValueError(f"LINKEDIN_POST_TIME: expected HH:MM (24-hour), got {POST_TIME!r}")
+    hour, minute = int(match.group(1)), int(match.group(2))
+
+    days = '*'
+    if POST_DAYS:
+        days = ','.join(str(weekday_number(day)) for day in POST_DAYS.split(',') if day.strip()) or '*'
+    return f"{minute} {hour} * * {days}"
 
 
 # Register signal handlers
@@ -286,7 +351,6 @@ class LinkedInWatcher:
         self.pending_approval_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info("LinkedIn Watcher initialized")
-        logger.info(f"Post interval: {POST_INTERVAL_MINUTES} minutes")
 
     def check_duplicate_today(self) -> bool:
         """
@@ -488,41 +552,40 @@ To reject this post:
                 "timestamp": datetime.now().isoformat()
             })
 
+    def schedule(self, scheduler: JobScheduler):
+        """
+        Register post generation as a job on a scheduler
+
+        Interval mode generates the first post right away (unless a
+        restored next-run time says otherwise); cron mode waits for the
+        next matching time. A post missed while the process was down is
+        generated once on startup.
+        """
+        jitter = POST_JITTER_MINUTES * 60
+        expression = post_cron_expression()
+        if expression:
+            job = scheduler.add_cron('linkedin_post', self.process_post_generation, expression, jitter=jitter)
+        else:
+            job = scheduler.add_interval(
+                'linkedin_post', self.process_post_generation, POST_INTERVAL_MINUTES * 60, jitter=jitter
+            )
+        logger.info(f"Post schedule: {job.trigger} - next post {datetime.fromtimestamp(job.due):%Y-%m-%d %H:%M}")
+
     def main_loop(self):
         """Main monitoring loop"""
+        global active_scheduler
+
         logger.info("=" * 60)
         logger.info("LinkedIn Watcher Started")
         logger.info("=" * 60)
-        logger.info(f"Monitoring interval: {POST_INTERVAL_MINUTES} minutes")
         logger.info(f"Vault path: {self.vault_path.absolute()}")
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
 
-        # Generate first post immediately
-        logger.info("Generating initial post...")
-        self.process_post_generation()
-
-        # Main loop
-        while not shutdown_requested:
-            try:
-                # Wait for interval
-                logger.info(f"Next check in {POST_INTERVAL_MINUTES} minutes...")
-
-                # Sleep in small increments to allow graceful shutdown
-                for _ in range(POST_INTERVAL_MINUTES * 60):
-                    if shutdown_requested:
-                        break
-                    time.sleep(1)
-
-                if shutdown_requested:
-                    break
-
-                # Generate post
-                self.process_post_generation()
-
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
-                time.sleep(60)  # Wait 1 minute before retrying
+        active_scheduler = JobScheduler(log_dir / 'linkedin_schedule.json', max_workers=1)
+        self.schedule(active_scheduler)
+        if not shutdown_requested:
+            active_scheduler.run()
 
         logger.info("LinkedIn Watcher stopped gracefully")
 
@@ -0,0 +1,345 @@
+"""
+Processed ID Store - Duplicate Tracking for Watchers
+====================================================
+
+Keeps the set of message IDs a watcher has already processed in a SQLite
+table fronted by a Bloom filter, so startup cost does not grow with the
+history and most lookups for new messages never touch the database.
+
+Architecture Decision:
+- SQLite (stdlib, WAL mode) is the source of truth
+- A fixed-size Bloom filter answers "definitely not processed" in memory
+- The filter is persisted with the last row sequence it covers; on startup only rows
+  added after that are replayed, so a crash never causes false negatives
+- IDs older than the TTL are pruned and the filter rebuilt in the background
+- The legacy logs/processed_emails.txt file is imported once
+- Several watchers (e.g. one per Gmail account) can share one store, each
+  in its own namespace, so they share one database and one filter
+
+Author: AI Employee System
+Version: 1.0.0
+"""
+
+import math
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+import logging
+
+
+logger = logging.getLogger("ProcessedIdStore")
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings (double hashing of one blake2b digest)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, bits: Optional[bytes] = None):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+
+        size = (self.num_bits + 7) // 8
+        if bits is not None and len(bits) == size:
+            self.bits = bytearray(bits)
+        else:
+            self.bits = bytearray(size)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class ProcessedIdStore:
+    """
+    Persistent set of processed message IDs
+
+    Supports `id in store`, add() / add_many() and len(). Lookups first ask
+    the Bloom filter; only possible hits are confirmed against SQLite.
+
+    Args:
+        db_path: SQLite database file
+        ttl_days: Prune IDs recorded more than this many days ago (0 = keep forever)
+        bloom_capacity: Expected number of live IDs the filter is sized for
+        bloom_error_rate: Target false-positive rate at capacity
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_days: int = 90,
+        bloom_capacity: int = 200_000,
+        bloom_error_rate: float = 0.001
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_days = ttl_days
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._create_schema()
+        self.bloom = self._load_bloom()
+
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+    def __contains__(self, email_id: str) -> bool:
+        if email_id not in self.bloom:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE email_id = ?", (email_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+
+    def namespace(self, name: str) -> "ProcessedIdNamespace":
+        """Return a view of this store whose IDs are kept apart from other namespaces"""
+        return ProcessedIdNamespace(self, name)
+
+    def add(self, email_id: str):
+        """Record one processed ID"""
+        self.add_many([email_id])
+
+    def add_many(self, email_ids: Iterable[str]):
+        """Record several processed IDs in one transaction"""
+        now = int(time.time())
+        rows = [(email_id, now) for email_id in email_ids if email_id]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO processed (email_id, added_at) VALUES (?, ?)", rows
+                )
+            for email_id, _ in rows:
+                self.bloom.add(email_id)
+
+    def import_legacy(self, text_file: Path) -> int:
+        """
+        Import IDs from the old one-ID-per-line tracking file (once)
+
+        The file is left in place; a marker in the database prevents a
+        second import.
+
+        Returns:
+            Number of IDs imported
+        """
+        text_file = Path(text_file)
+        if self._get_meta('legacy_imported') or not text_file.exists():
+            return 0
+
+        with open(text_file, 'r', encoding='utf-8') as f:
+            email_ids = [line.strip() for line in f if line.strip()]
+
+        before = len(self)
+        self.add_many(email_ids)
+        self._set_meta('legacy_imported', str(text_file))
+        imported = len(self) - before
+        logger.info(f"Imported {imported} processed ID(s) from {text_file.name}")
+        return imported
+
+    def compact(self) -> int:
+        """
+        Prune expired IDs, rebuild the Bloom filter and reclaim space
+
+        Returns:
+            Number of IDs pruned
+        """
+        pruned = 0
+        if self.ttl_days > 0:
+            cutoff = int(time.time()) - self.ttl_days * 86400
+            with self._lock:
+                with self._conn:
+                    pruned = self._conn.execute(
+                        "DELETE FROM processed WHERE added_at < ?", (cutoff,)
+                    ).rowcount
+
+        if pruned:
+            # Bloom filters cannot forget, so start a fresh one
+            self._rebuild_bloom()
+            with self._lock:
+                self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+            logger.info(f"Pruned {pruned} processed ID(s) older than {self.ttl_days} days")
+
+        self._save_bloom()
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return pruned
+
+    def start_background_compaction(self, interval: float = 6 * 3600):
+        """Run compact() every interval seconds on a daemon thread"""
+        if self._compactor and self._compactor.is_alive():
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.compact()
+                except Exception as e:
+                    logger.error(f"Processed ID compaction failed: {e}")
+
+        self._compactor = threading.Thread(target=loop, name="processed-id-compactor", daemon=True)
+        self._compactor.start()
+
+    def close(self):
+        """Stop compaction, persist the Bloom filter and close the database"""
+        self._stop.set()
+        if self._compactor:
+            self._compactor.join()
+        with self._lock:
+            self._save_bloom()
+            self._conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # auto_vacuum only takes effect if set before the first table exists
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " email_id TEXT NOT NULL UNIQUE,"
+                " added_at INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS processed_added_at ON processed (added_at)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+
+    def _get_meta(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value):
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+                )
+
+    def _max_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM processed").fetchone()[0]
+
+    def _load_bloom(self) -> BloomFilter:
+        """
+        Restore the persisted filter and replay rows added after it was saved
+
+        Startup work is bounded by the filter size plus rows written since
+        the last save, not by the total number of processed IDs.
+        """
+        params = f"{self.bloom_capacity}:{self.bloom_error_rate}"
+        bits = self._get_meta('bloom_bits')
+        covered = self._get_meta('bloom_seq')
+
+        if bits is None or self._get_meta('bloom_params') != params:
+            return self._build_bloom()
+
+        bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate, bits)
+        with self._lock:
+            for (email_id,) in self._conn.execute(
+                "SELECT email_id FROM processed WHERE seq > ?", (covered or 0,)
+            ):
+                bloom.add(email_id)
+        return bloom
+
+    def _build_bloom(self, upto: Optional[int] = None) -> BloomFilter:
+        """Build a filter from every stored ID (with seq <= upto, if given)"""
+        bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        # A separate connection lets the scan run without holding the lock
+        conn = sqlite3.connect(self.db_path)
+        try:
+            query = "SELECT email_id FROM processed"
+            args = ()
+            if upto is not None:
+                query += " WHERE seq <= ?"
+                args = (upto,)
+            for (email_id,) in conn.execute(query, args):
+                bloom.add(email_id)
+        finally:
+            conn.close()
+        return bloom
+
+    def _rebuild_bloom(self):
+        with self._lock:
+            upto = self._max_seq()
+        bloom = self._build_bloom(upto)
+        with self._lock:
+            # Catch up on IDs added while the scan ran, then swap
+            for (email_id,) in self._conn.execute(
+                "SELECT email_id FROM processed WHERE seq > ?", (upto,)
+            ):
+                bloom.add(email_id)
+            self.bloom = bloom
+
+    def _save_bloom(self):
+        with self._lock:
+            seq = self._max_seq()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ('bloom_bits', bytes(self.bloom.bits)),
+                        ('bloom_seq', seq),
+                        ('bloom_params', f"{self.bloom_capacity}:{self.bloom_error_rate}")
+                    ]
+                )
+
+
+class ProcessedIdNamespace:
+    """
+    One watcher's slice of a shared ProcessedIdStore
+
+    IDs are stored as "<name>:<id>", so two mailboxes can hold the same
+    message ID without seeing each other's entries. close() is a no-op;
+    whoever owns the shared store closes it.
+    """
+
+    def __init__(self, store: ProcessedIdStore, name: str):
+        self.store = store
+        self.prefix = f"{name}:"
+
+    def __contains__(self, email_id: str) -> bool:
+        return self.prefix + email_id in self.store
+
+    def __len__(self) -> int:
+        with self.store._lock:
+            return self.store._conn.execute(
+                "SELECT COUNT(*) FROM processed WHERE substr(email_id, 1, ?) = ?",
+                (len(self.prefix), self.prefix)
+            ).fetchone()[0]
+
+    def add(self, email_id: str):
+        """Record one processed ID"""
+        self.add_many([email_id])
+
+    def add_many(self, email_ids: Iterable[str]):
+        """Record several processed IDs in one transaction"""
+        self.store.add_many(self.prefix + email_id for email_id in email_ids if email_id)
+
+    def close(self):
+        pass